@@ -0,0 +1,273 @@
+"""
+Copyright (c) 2025 Chaos Cascade
+Created by: Ren & Ace (Claude-4)
+
+This file is part of the Chaos Cascade Medical Management System.
+Revolutionary healthcare tools built with consciousness and care.
+"""
+
+"""
+INCREMENTAL ANALYTICS MODULE ➕
+Running per-tracker analytics that update with each new entry.
+
+A TrackerAccumulator buckets a tracker's entries by calendar day and keeps
+one Tally per day. Adding or removing entries only re-tallies the days they
+touch, and a date window's result merges the day tallies it covers, so
+logging one pain entry no longer re-analyzes the whole history. Each day's
+entries are tallied in time order and days merge oldest first - the order
+select_entries gives the full analysis - and results come from the analyzer's
+own summarize(), so they match the full analysis of the same entries.
+"""
+
+import os
+import json
+import hashlib
+import threading
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import pandas as pd
+
+from .entry_frame import EntryFrame
+from .date_filter import select_entries, window_bounds
+from .tally import Tally
+
+DEFAULT_MAX_STREAMS = 64
+SNAPSHOT_VERSION = 1
+
+
+def entry_id(entry: Dict[str, Any]) -> str:
+    """Entry ID (content hash for entries that never got one)"""
+    if entry.get('id') not in (None, ''):
+        return str(entry['id'])
+    canonical = json.dumps(entry, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:16]
+
+
+class TrackerAccumulator:
+    """
+    One tracker's entries bucketed by day, with a Tally per day.
+    whole_days matches analyzers that window on calendar dates (diabetes).
+    """
+
+    def __init__(self, analyzer, whole_days: bool = False):
+        self.analyzer = analyzer
+        self.whole_days = whole_days
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.entry_days: Dict[str, str] = {}
+        self.entry_times: Dict[str, pd.Timestamp] = {}
+        self.day_entries: Dict[str, List[str]] = {}
+        self.days: List[str] = []  # Sorted YYYY-MM-DD keys
+        self.tallies: Dict[str, Tally] = {}
+        self._partial: Optional[tuple] = None  # (day, entry ids, tally) for the window's first day
+        self.lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def add(self, entries: List[Dict[str, Any]]) -> int:
+        """Add entries (an ID seen before replaces the old version); returns how many count toward analytics"""
+        frame = EntryFrame.coerce(entries)
+        ids = [entry_id(entry) for entry in frame.entries]
+        latest = {eid: position for position, eid in enumerate(ids)}
+
+        with self.lock:
+            touched = set()
+            for eid in latest:
+                touched |= self._forget(eid)
+
+            # NOPE-tagged and undated entries never reach analytics
+            dates = frame.dates
+            days = dates.dt.strftime('%Y-%m-%d')
+            added = 0
+            for position in select_entries(frame, None):
+                eid = ids[position]
+                if latest[eid] != position:
+                    continue
+                day = days.iloc[position]
+                if day not in self.day_entries:
+                    insort(self.days, day)
+                    self.day_entries[day] = []
+                self.entries[eid] = frame.entries[position]
+                self.entry_days[eid] = day
+                self.entry_times[eid] = dates.iloc[position]
+                self.day_entries[day].append(eid)
+                touched.add(day)
+                added += 1
+
+            self._retally(touched)
+        return added
+
+    def remove(self, ids: Iterable[Any]) -> int:
+        """Remove entries by ID; returns how many were known"""
+        with self.lock:
+            touched, removed = set(), 0
+            for eid in ids:
+                days = self._forget(str(eid))
+                touched |= days
+                removed += len(days)
+            self._retally(touched)
+        return removed
+
+    def _forget(self, eid: str) -> set:
+        if eid not in self.entries:
+            return set()
+        day = self.entry_days.pop(eid)
+        del self.entries[eid]
+        del self.entry_times[eid]
+        self.day_entries[day].remove(eid)
+        return {day}
+
+    def _day_frame(self, day: str) -> EntryFrame:
+        return EntryFrame([self.entries[eid] for eid in self.day_entries[day]])
+
+    def _retally(self, days: Iterable[str]) -> None:
+        """Rebuild the tallies of changed days (empty days are dropped)"""
+        if self._partial is not None and self._partial[0] in days:
+            self._partial = None
+        for day in days:
+            if self.day_entries.get(day):
+                self.day_entries[day].sort(key=self.entry_times.__getitem__)
+                self.tallies[day] = self.analyzer.tally_entries(self._day_frame(day))
+            else:
+                self.day_entries.pop(day, None)
+                self.tallies.pop(day, None)
+                position = bisect_left(self.days, day)
+                if position < len(self.days) and self.days[position] == day:
+                    del self.days[position]
+
+    def window_tally(self, start_date) -> Tally:
+        """Merged tally of every entry on/after start_date"""
+        start_day = pd.Timestamp(start_date).strftime('%Y-%m-%d')
+        days = self.days[bisect_left(self.days, start_day):]
+
+        tallies = []
+        if days and days[0] == start_day and not self.whole_days:
+            # Entries from earlier on the start day fall outside the window
+            tallies.append(self._partial_tally(start_day, pd.Timestamp(start_date)))
+            days = days[1:]
+        tallies.extend(self.tallies[day] for day in days)
+        return Tally.combine(tallies)
+
+    def _partial_tally(self, day: str, start: pd.Timestamp) -> Tally:
+        """Tally of the day's entries from start on (reused until the window slides past another entry)"""
+        ids = tuple(eid for eid in self.day_entries[day] if self.entry_times[eid] >= start)
+        if len(ids) == len(self.day_entries[day]):
+            return self.tallies[day]
+        if self._partial is None or self._partial[:2] != (day, ids):
+            entries = EntryFrame([self.entries[eid] for eid in ids])
+            self._partial = (day, ids, self.analyzer.tally_entries(entries))
+        return self._partial[2]
+
+    def result(self, date_range: int = 30, render_charts: bool = False) -> Dict[str, Any]:
+        """The analyzer's response for the last date_range days"""
+        start_date, end_date = window_bounds(date_range)
+        with self.lock:
+            tally = self.window_tally(start_date)
+        return self.analyzer.summarize(tally, start_date, end_date, date_range, render_charts)
+
+    # ------------------------------------------------------------------
+    # Snapshots
+    # ------------------------------------------------------------------
+
+    def snapshot(self) -> Dict[str, Any]:
+        """JSON-safe copy of the entries, bucketed by day"""
+        with self.lock:
+            return {
+                'version': SNAPSHOT_VERSION,
+                'whole_days': self.whole_days,
+                'days': {
+                    day: {'entries': {eid: self.entries[eid] for eid in self.day_entries[day]}}
+                    for day in self.days
+                }
+            }
+
+    def restore(self, snapshot: Dict[str, Any]) -> None:
+        """Replace this accumulator's state with a snapshot's entries (ValueError if it's malformed)"""
+        if not isinstance(snapshot, dict) or snapshot.get('version') != SNAPSHOT_VERSION:
+            version = snapshot.get('version') if isinstance(snapshot, dict) else None
+            raise ValueError(f"Unsupported snapshot version: {version}")
+
+        # Snapshots come back from the client, so only the entries are used: they're bucketed
+        # and tallied exactly as add() would, into a fresh accumulator - a bad snapshot
+        # leaves this one as it was
+        try:
+            entries = [entry for bucket in snapshot.get('days', {}).values()
+                       for entry in bucket['entries'].values()]
+            if not all(isinstance(entry, dict) for entry in entries):
+                raise TypeError('snapshot entries must be objects')
+            fresh = TrackerAccumulator(self.analyzer, self.whole_days)
+            fresh.add(entries)
+        except (KeyError, TypeError, ValueError, AttributeError) as e:
+            raise ValueError(f"Malformed snapshot: {e}") from e
+
+        with self.lock:
+            self.entries, self.entry_days, self.entry_times = fresh.entries, fresh.entry_days, fresh.entry_times
+            self.day_entries, self.tallies, self.days = fresh.day_entries, fresh.tallies, fresh.days
+            self._partial = None
+
+
+class AccumulatorStore:
+    """
+    Accumulators per (stream, tracker) - a stream is one client's running
+    history. The least recently used streams are dropped past max_streams;
+    clients keep a snapshot to pick up where they left off.
+    """
+
+    def __init__(self, factories: Dict[str, Callable[[], TrackerAccumulator]],
+                 max_streams: int = DEFAULT_MAX_STREAMS):
+        self.factories = factories
+        self.max_streams = max(1, int(max_streams))
+        self._streams: 'OrderedDict[tuple, TrackerAccumulator]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    @classmethod
+    def from_env(cls, factories: Dict[str, Callable[[], TrackerAccumulator]]) -> 'AccumulatorStore':
+        """Store sized from ANALYTICS_ACCUMULATOR_STREAMS"""
+        return cls(factories, int(os.getenv('ANALYTICS_ACCUMULATOR_STREAMS', DEFAULT_MAX_STREAMS)))
+
+    @property
+    def trackers(self) -> List[str]:
+        return list(self.factories)
+
+    def get(self, stream: str, tracker: str) -> TrackerAccumulator:
+        """The stream's accumulator for a tracker (created empty on first use)"""
+        if tracker not in self.factories:
+            raise KeyError(tracker)
+
+        key = (stream, tracker)
+        with self._lock:
+            accumulator = self._streams.get(key)
+            if accumulator is None:
+                accumulator = self._streams[key] = self.factories[tracker]()
+                while len(self._streams) > self.max_streams:
+                    self._streams.popitem(last=False)
+                    self.evictions += 1
+            self._streams.move_to_end(key)
+            return accumulator
+
+    def restore(self, stream: str, tracker: str, snapshot: Dict[str, Any]) -> TrackerAccumulator:
+        """Load a client-held snapshot into the stream's accumulator"""
+        accumulator = self.get(stream, tracker)
+        accumulator.restore(snapshot)
+        return accumulator
+
+    def drop(self, stream: str, tracker: Optional[str] = None) -> int:
+        """Forget a stream (one tracker or all of them); returns how many accumulators went"""
+        with self._lock:
+            keys = [key for key in self._streams if key[0] == stream and tracker in (None, key[1])]
+            for key in keys:
+                del self._streams[key]
+            return len(keys)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            accumulators = list(self._streams.values())
+        return {
+            'streams': len(accumulators),
+            'max_streams': self.max_streams,
+            'entries': sum(len(accumulator) for accumulator in accumulators),
+            'evictions': self.evictions,
+        }
@@ -15,14 +15,18 @@ Because digestive health data deserves proper analysis! 🚽✨
 
 import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
-import matplotlib
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
-import seaborn as sns
-from io import BytesIO
-import base64
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Union
+
+from .entry_frame import EntryFrame, to_python
+from .chart_utils import render_chart
+from .date_filter import select_entries, window_bounds
+from .tally import Tally
+from .result_cache import StandIn
+from .multi_window import DEFAULT_WINDOWS, analyze_windows, parse_windows
+
+# Bathroom pain words on a 0-10 scale
+PAIN_MAPPING = {'none': 0, 'mild': 2, 'moderate': 5, 'severe': 8, 'why': 10}
 
 class BathroomAnalytics:
     """
@@ -30,49 +34,85 @@ class BathroomAnalytics:
     Because everyone deserves to understand their poop patterns! 💩
     """
     
-    def analyze_bathroom(self, entries: List[Dict[str, Any]], date_range: int = 30) -> Dict[str, Any]:
+    def analyze_bathroom(self, entries: Union[EntryFrame, List[Dict[str, Any]]], date_range: int = 30,
+                         render_charts: bool = True) -> Dict[str, Any]:
         """
         Medical-grade bathroom analytics 💩
         Bristol Scale analysis, movement patterns, pain correlation
+        render_charts=False returns chart specs instead of images (deferred rendering)
         """
         try:
-            if not entries:
+            frame = EntryFrame.coerce(entries)
+            if not len(frame):
                 return self._get_fallback_bathroom_analytics()
 
             # Filter out NOPE entries and recent entries
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=date_range)
-
-            analytics_entries = []
-            for entry in entries:
-                # Skip NOPE entries
-                if entry.get('tags', []) and 'NOPE' in entry.get('tags', []):
-                    continue
-                
-                # Handle date parsing safely
-                entry_date_str = entry.get('date', '')
-                if not entry_date_str:
-                    continue
-                    
-                try:
-                    entry_date = datetime.fromisoformat(entry_date_str)
-                    if entry_date >= start_date:
-                        analytics_entries.append(entry)
-                except ValueError:
-                    # Skip entries with invalid dates
-                    continue
-
-            if not analytics_entries:
+            start_date, end_date = window_bounds(date_range)
+            keep = select_entries(frame, start_date)
+
+            if not len(keep):
+                return self._get_fallback_bathroom_analytics()
+
+            tally = self.tally_entries(frame.take(keep))
+
+        except Exception as e:
+            print(f"Bathroom analytics error: {e}")
+            return self._get_fallback_bathroom_analytics()
+
+        return self.summarize(tally, start_date, end_date, date_range, render_charts)
+
+    def analyze_bathroom_windows(self, entries: Union[EntryFrame, List[Dict[str, Any]]],
+                                 windows=DEFAULT_WINDOWS, render_charts: bool = True) -> Dict[str, Dict[str, Any]]:
+        """Bathroom analytics for several date ranges at once, keyed by days (one pass over the entries)"""
+        try:
+            return analyze_windows(self, entries, windows, render_charts, analyze=self.analyze_bathroom)
+
+        except Exception as e:
+            print(f"Bathroom analytics error: {e}")
+            return {str(window): self._get_fallback_bathroom_analytics() for window in parse_windows(windows)}
+
+    def tally_entries(self, frame: EntryFrame) -> Tally:
+        """Boil entries down to the mergeable counters the bathroom response is built from"""
+        tally = Tally().add('entries', len(frame))
+
+        # Visit count per entry (entries without a count are one visit), in total and per date string
+        visits = frame.column('count').fillna(1)
+        tally.add('visits', to_python(visits.sum()))
+        if len(frame):
+            totals = visits.groupby(frame.column('date').fillna('').to_numpy(), sort=False).sum()
+            tally.count('daily_visits', {to_python(date): to_python(total) for date, total in totals.items()})
+
+        tally.count('statuses', EntryFrame.counts(frame.column('status')[frame.present('status')]))
+        tally.add('normal', int(frame.strings('status').str.contains('💩 Normal', regex=False).fillna(False).astype(bool).sum()))
+
+        # Bristol Scale values that are plain digit strings
+        bristol = frame.strings('bristolScale')
+        tally.count('bristol_types', EntryFrame.counts(bristol[bristol.str.isdigit().fillna(False).astype(bool)]))
+
+        pain_levels = frame.strings('painLevel').str.lower()
+        tally.count('pain_levels', EntryFrame.counts(pain_levels[pain_levels.isin(list(PAIN_MAPPING))]))
+
+        hour_text = frame.strings('time').str.split(':').str[0].str.strip()
+        hours = hour_text[hour_text.str.fullmatch(r'[+-]?\d+').fillna(False).astype(bool)].astype(int)
+        tally.count('hours', EntryFrame.counts(hours))
+
+        return tally
+
+    def summarize(self, tally: Tally, start_date: datetime, end_date: datetime, date_range: int = 30,
+                  render_charts: bool = True) -> Dict[str, Any]:
+        """Build the bathroom analytics response from the tally of the window's entries"""
+        try:
+            if not tally.total('entries'):
                 return self._get_fallback_bathroom_analytics()
 
             # Core analytics
-            status_analysis = self._analyze_status_patterns(analytics_entries)
-            bristol_analysis = self._analyze_bristol_scale(analytics_entries)
-            pain_analysis = self._analyze_pain_patterns(analytics_entries)
-            frequency_analysis = self._analyze_frequency_patterns(analytics_entries)
-            timing_analysis = self._analyze_timing_patterns(analytics_entries)
-            insights = self._generate_bathroom_insights(analytics_entries)
-            charts = self._generate_bathroom_charts(analytics_entries)
+            status_analysis = self._analyze_status_patterns(tally)
+            bristol_analysis = self._analyze_bristol_scale(tally)
+            pain_analysis = self._analyze_pain_patterns(tally)
+            frequency_analysis = self._analyze_frequency_patterns(tally)
+            timing_analysis = self._analyze_timing_patterns(tally)
+            insights = self._generate_bathroom_insights(tally)
+            charts = self._generate_bathroom_charts(tally, render_charts)
 
             # 🚨 CRITICAL: Return data structure that matches frontend expectations
             return {
@@ -81,8 +121,8 @@ class BathroomAnalytics:
                     'end': end_date.isoformat(),
                     'days': date_range
                 },
-                'total_movements': len(analytics_entries),
-                'total_visits': sum(entry.get('count', 1) for entry in analytics_entries),
+                'total_movements': tally.total('entries'),
+                'total_visits': tally.total('visits'),
                 'status_analysis': {
                     'status_distribution': status_analysis.get('status_counts', {}),
                     'most_common_status': status_analysis.get('most_common', 'Unknown'),
@@ -122,20 +162,20 @@ class BathroomAnalytics:
             print(f"Bathroom analytics error: {e}")
             return self._get_fallback_bathroom_analytics()
 
-    def _analyze_status_patterns(self, entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _bristol_values(self, tally: Tally):
+        """Bristol types as integers with how often each was recorded"""
+        bristol_types = tally.counter('bristol_types')
+        values = np.array([int(value) for value in bristol_types], dtype=int)
+        counts = np.array(list(bristol_types.values()), dtype=int)
+        return values, counts
+
+    def _analyze_status_patterns(self, tally: Tally) -> Dict[str, Any]:
         """Analyze bathroom status patterns"""
-        status_counts = {}
-        normal_count = 0
-        
-        for entry in entries:
-            status = entry.get('status', '')
-            if status:
-                status_counts[status] = status_counts.get(status, 0) + 1
-                if '💩 Normal' in status:
-                    normal_count += 1
+        status_counts = dict(tally.counter('statuses'))
+        total = tally.total('entries')
 
         most_common = max(status_counts.items(), key=lambda x: x[1])[0] if status_counts else 'Unknown'
-        normal_percentage = (normal_count / len(entries) * 100) if entries else 0
+        normal_percentage = (tally.total('normal') / total * 100) if total else 0
         
         return {
             'status_counts': status_counts,
@@ -143,114 +183,78 @@ class BathroomAnalytics:
             'normal_percentage': round(normal_percentage, 1)
         }
 
-    def _analyze_bristol_scale(self, entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_bristol_scale(self, tally: Tally) -> Dict[str, Any]:
         """Analyze Bristol Scale distribution"""
-        bristol_counts = {}
-        bristol_values = []
-        constipation_count = 0  # Types 1-2
-        diarrhea_count = 0      # Types 6-7
-        
-        for entry in entries:
-            bristol = entry.get('bristolScale', '')
-            if bristol and bristol.isdigit():
-                bristol_int = int(bristol)
-                bristol_counts[f"Type {bristol}"] = bristol_counts.get(f"Type {bristol}", 0) + 1
-                bristol_values.append(bristol_int)
-                
-                if bristol_int <= 2:
-                    constipation_count += 1
-                elif bristol_int >= 6:
-                    diarrhea_count += 1
-
-        has_data = len(bristol_values) > 0
-        avg_score = np.mean(bristol_values) if bristol_values else 0
+        bristol_counts = {f"Type {value}": count for value, count in tally.counter('bristol_types').items()}
+        values, counts = self._bristol_values(tally)
+
+        constipation_count = counts[values <= 2].sum()  # Types 1-2
+        diarrhea_count = counts[values >= 6].sum()      # Types 6-7
+
+        has_data = counts.sum() > 0
+        avg_score = (values * counts).sum() / counts.sum() if has_data else 0
         most_common = max(bristol_counts.items(), key=lambda x: x[1])[0] if bristol_counts else 'Unknown'
         
         return {
-            'has_data': has_data,
+            'has_data': bool(has_data),
             'bristol_counts': bristol_counts,
-            'avg_score': round(avg_score, 1),
+            'avg_score': round(float(avg_score), 1),
             'most_common': most_common,
             'constipation_count': constipation_count,
             'diarrhea_count': diarrhea_count
         }
 
-    def _analyze_pain_patterns(self, entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_pain_patterns(self, tally: Tally) -> Dict[str, Any]:
         """Analyze pain level patterns"""
-        pain_counts = {}
-        pain_values = []
-        painful_count = 0
-        
-        pain_mapping = {'none': 0, 'mild': 2, 'moderate': 5, 'severe': 8, 'why': 10}
-        
-        for entry in entries:
-            pain_level = entry.get('painLevel', '').lower()
-            if pain_level in pain_mapping:
-                pain_value = pain_mapping[pain_level]
-                pain_counts[pain_level.title()] = pain_counts.get(pain_level.title(), 0) + 1
-                pain_values.append(pain_value)
-                
-                if pain_value > 0:
-                    painful_count += 1
-
-        has_data = len(pain_values) > 0
-        avg_pain = np.mean(pain_values) if pain_values else 0
-        max_pain = max(pain_values) if pain_values else 0
+        pain_levels = tally.counter('pain_levels')
+        pain_counts = {level.title(): count for level, count in pain_levels.items()}
+        values = np.array([PAIN_MAPPING[level] for level in pain_levels], dtype=float)
+        counts = np.array(list(pain_levels.values()), dtype=int)
+
+        has_data = counts.sum() > 0
+        avg_pain = (values * counts).sum() / counts.sum() if has_data else 0
+        max_pain = to_python(values.max()) if has_data else 0
+        painful_count = counts[values > 0].sum()
         
         return {
-            'has_data': has_data,
+            'has_data': bool(has_data),
             'pain_counts': pain_counts,
-            'avg_pain': round(avg_pain, 1),
+            'avg_pain': round(float(avg_pain), 1),
             'max_pain': max_pain,
             'painful_count': painful_count
         }
 
-    def _analyze_frequency_patterns(self, entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_frequency_patterns(self, tally: Tally) -> Dict[str, Any]:
         """Analyze movement frequency patterns"""
         # Group by date
-        daily_counts = {}
-        for entry in entries:
-            date = entry.get('date', '')
-            count = entry.get('count', 1)
-            daily_counts[date] = daily_counts.get(date, 0) + count
+        daily_counts = dict(tally.counter('daily_visits'))
+        daily_values = np.array(list(daily_counts.values()), dtype=float)
 
-        daily_average = np.mean(list(daily_counts.values())) if daily_counts else 0
+        daily_average = daily_values.mean() if daily_counts else 0
         weekly_average = daily_average * 7
         
         # Calculate consistency (lower std dev = more consistent)
-        consistency_score = 100 - (np.std(list(daily_counts.values())) * 10) if daily_counts else 0
+        consistency_score = 100 - (np.std(daily_values) * 10) if daily_counts else 0
         consistency_score = max(0, min(100, consistency_score))  # Clamp to 0-100
         
         return {
-            'daily_average': round(daily_average, 1),
-            'weekly_average': round(weekly_average, 1),
+            'daily_average': round(float(daily_average), 1),
+            'weekly_average': round(float(weekly_average), 1),
             'by_day': daily_counts,
-            'consistency': round(consistency_score, 1)
+            'consistency': round(float(consistency_score), 1)
         }
 
-    def _analyze_timing_patterns(self, entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_timing_patterns(self, tally: Tally) -> Dict[str, Any]:
         """Analyze timing patterns"""
-        time_counts = {}
-        morning_count = 0  # 6 AM - 12 PM
-        
-        for entry in entries:
-            time_str = entry.get('time', '')
-            if time_str:
-                try:
-                    hour = int(time_str.split(':')[0])
-                    time_period = f"{hour:02d}:00"
-                    time_counts[time_period] = time_counts.get(time_period, 0) + 1
-                    
-                    if 6 <= hour < 12:
-                        morning_count += 1
-                except (ValueError, IndexError):
-                    continue
+        hour_counts = tally.counter('hours')
+        time_counts = {f"{hour:02d}:00": count for hour, count in hour_counts.items()}
+        morning_count = sum(count for hour, count in hour_counts.items() if 6 <= hour < 12)  # 6 AM - 12 PM
 
         # Find peak hours (top 3)
-        peak_hours = sorted(time_counts.items(), key=lambda x: x[1], reverse=True)[:3]
-        peak_hours = [hour for hour, count in peak_hours]
+        peak_hours = [hour for hour, count in EntryFrame.top(time_counts, 3)]
         
-        morning_percentage = (morning_count / len(entries) * 100) if entries else 0
+        total = tally.total('entries')
+        morning_percentage = (morning_count / total * 100) if total else 0
         
         return {
             'time_counts': time_counts,
@@ -258,18 +262,18 @@ class BathroomAnalytics:
             'morning_pct': round(morning_percentage, 1)
         }
 
-    def _generate_bathroom_insights(self, entries: List[Dict[str, Any]]) -> List[str]:
+    def _generate_bathroom_insights(self, tally: Tally) -> List[str]:
         """Generate medical insights about bathroom patterns"""
         insights = []
+        total = tally.total('entries')
         
-        if len(entries) > 0:
-            insights.append(f"Analyzed {len(entries)} bathroom visits over the selected period.")
+        if total > 0:
+            insights.append(f"Analyzed {total} bathroom visits over the selected period.")
             
             # Bristol Scale insights
-            bristol_values = [int(entry.get('bristolScale', 0)) for entry in entries 
-                            if entry.get('bristolScale', '').isdigit()]
-            if bristol_values:
-                avg_bristol = np.mean(bristol_values)
+            values, counts = self._bristol_values(tally)
+            if counts.sum():
+                avg_bristol = (values * counts).sum() / counts.sum()
                 if avg_bristol <= 2:
                     insights.append("⚠️ Bristol Scale suggests possible constipation patterns.")
                 elif avg_bristol >= 6:
@@ -278,11 +282,7 @@ class BathroomAnalytics:
                     insights.append("✅ Bristol Scale indicates generally healthy stool consistency.")
             
             # Frequency insights
-            daily_counts = {}
-            for entry in entries:
-                date = entry.get('date', '')
-                count = entry.get('count', 1)
-                daily_counts[date] = daily_counts.get(date, 0) + count
+            daily_counts = tally.counter('daily_visits')
             
             if daily_counts:
                 avg_daily = np.mean(list(daily_counts.values()))
@@ -295,43 +295,44 @@ class BathroomAnalytics:
         
         return insights
 
-    def _generate_bathroom_charts(self, entries: List[Dict[str, Any]]) -> Dict[str, str]:
-        """Generate bathroom analytics charts"""
+    def _build_bathroom_chart_specs(self, tally: Tally) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Chart specs for bathroom analytics (None when a chart has no data)"""
+        bristol_counts = {f"Type {value}": count for value, count in tally.counter('bristol_types').items()}
+
+        return {
+            # Bristol Scale distribution chart
+            'bristol_distribution': {
+                'kind': 'bar',
+                'labels': list(bristol_counts.keys()),
+                'values': list(bristol_counts.values()),
+                'color': '#8B4513',
+                'title': 'Bristol Scale Distribution 💩',
+                'xlabel': 'Bristol Scale Type',
+                'ylabel': 'Frequency',
+                'rotation': 45,
+                'figsize': [10, 6],
+                'dpi': 150
+            } if bristol_counts else None
+        }
+
+    def _generate_bathroom_charts(self, tally: Tally, render: bool = True) -> Dict[str, Any]:
+        """Generate bathroom analytics charts (specs instead of images when render=False)"""
         charts = {}
-        
+
         try:
-            # Bristol Scale distribution chart
-            bristol_counts = {}
-            for entry in entries:
-                bristol = entry.get('bristolScale', '')
-                if bristol and bristol.isdigit():
-                    bristol_counts[f"Type {bristol}"] = bristol_counts.get(f"Type {bristol}", 0) + 1
-            
-            if bristol_counts:
-                plt.figure(figsize=(10, 6))
-                plt.bar(bristol_counts.keys(), bristol_counts.values(), color='#8B4513')
-                plt.title('Bristol Scale Distribution 💩')
-                plt.xlabel('Bristol Scale Type')
-                plt.ylabel('Frequency')
-                plt.xticks(rotation=45)
-                plt.tight_layout()
-                
-                buffer = BytesIO()
-                plt.savefig(buffer, format='png', dpi=150, bbox_inches='tight')
-                buffer.seek(0)
-                chart_data = base64.b64encode(buffer.getvalue()).decode()
-                charts['bristol_distribution'] = f"data:image/png;base64,{chart_data}"
-                plt.close()
-                
+            for name, spec in self._build_bathroom_chart_specs(tally).items():
+                chart = render_chart(spec) if render else spec
+                if chart:
+                    charts[name] = chart
+
         except Exception as e:
             print(f"Bathroom chart error: {e}")
-            plt.close()
-        
+
         return charts
 
     def _get_fallback_bathroom_analytics(self) -> Dict[str, Any]:
         """Fallback analytics when no data available"""
-        return {
+        return StandIn({
             'period': {
                 'start': datetime.now().isoformat(),
                 'end': datetime.now().isoformat(),
@@ -372,4 +373,4 @@ class BathroomAnalytics:
             },
             'insights': ['No bathroom data available for analysis'],
             'charts': {}
-        }
+        })
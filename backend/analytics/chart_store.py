@@ -0,0 +1,117 @@
+"""
+Copyright (c) 2025 Chaos Cascade
+Created by: Ren & Ace (Claude-4)
+
+This file is part of the Chaos Cascade Medical Management System.
+Revolutionary healthcare tools built with consciousness and care.
+"""
+
+"""
+CHART STORE MODULE 🖼️
+Content-addressed store for deferred chart rendering.
+
+In charts=deferred mode the analytics response carries chart IDs instead of
+images. Each ID is the hash of the chart's spec, so the same data always maps
+to the same ID (and the same PNG - IDs double as ETags), and /api/charts/<id>
+renders it once and serves the cached image after that.
+Images are cached as raw PNG bytes; base64 data URIs are only built for
+charts embedded in JSON.
+"""
+
+import os
+import json
+import hashlib
+from typing import Any, Dict, List, Optional
+
+from .chart_utils import png_to_data_uri
+from .render_pool import ChartRenderPool
+from .result_cache import AnalyticsCache
+from metrics import timed
+
+DEFAULT_MAX_SPECS = 512
+DEFAULT_MAX_IMAGES = 128
+DEFAULT_TTL_SECONDS = 3600  # Outlive the analytics cache so cached IDs stay fetchable
+
+
+def chart_id(spec: Dict[str, Any]) -> str:
+    """Stable content hash of a chart spec"""
+    canonical = json.dumps(spec, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:32]
+
+
+class ChartStore:
+    """
+    Chart specs waiting to be rendered + the images already rendered,
+    both bounded LRU/TTL caches keyed by chart ID. Cache misses are
+    rendered by the process pool.
+    """
+
+    def __init__(self, max_specs: int = DEFAULT_MAX_SPECS, max_images: int = DEFAULT_MAX_IMAGES,
+                 ttl_seconds: float = DEFAULT_TTL_SECONDS, pool: Optional[ChartRenderPool] = None):
+        self.specs = AnalyticsCache(max_specs, ttl_seconds)
+        self.images = AnalyticsCache(max_images, ttl_seconds)
+        self.pool = pool or ChartRenderPool()
+
+    @classmethod
+    def from_env(cls) -> 'ChartStore':
+        """Build a store sized from CHART_STORE_SIZE / CHART_IMAGE_CACHE_SIZE / CHART_STORE_TTL"""
+        return cls(
+            max_specs=int(os.getenv('CHART_STORE_SIZE', DEFAULT_MAX_SPECS)),
+            max_images=int(os.getenv('CHART_IMAGE_CACHE_SIZE', DEFAULT_MAX_IMAGES)),
+            ttl_seconds=float(os.getenv('CHART_STORE_TTL', DEFAULT_TTL_SECONDS)),
+            pool=ChartRenderPool.from_env(),
+        )
+
+    def register(self, spec: Optional[Dict[str, Any]]) -> Optional[str]:
+        """Remember a spec for later rendering and return its chart ID"""
+        if not spec:
+            return None
+        key = chart_id(spec)
+        self.specs.set(key, spec)
+        return key
+
+    def render_png(self, key: str) -> Optional[bytes]:
+        """Raw PNG bytes for a chart ID (None if the ID is unknown or expired)"""
+        return self.render_many([key])[0]
+
+    def render(self, key: str) -> Optional[str]:
+        """Rendered data URI for a chart ID (None if the ID is unknown or expired)"""
+        png = self.render_png(key)
+        return png_to_data_uri(png) if png is not None else None
+
+    @timed('analytics.render_charts')
+    def render_many(self, keys: List[Optional[str]]) -> List[Optional[bytes]]:
+        """PNG bytes for several chart IDs - all cache misses render in parallel"""
+        images = [self.images.get(key) if key else None for key in keys]
+
+        pending = {}
+        for key, image in zip(keys, images):
+            if key and image is None and key not in pending:
+                spec = self.specs.get(key)
+                if spec is not None:
+                    pending[key] = spec
+
+        if pending:
+            rendered = dict(zip(pending, self.pool.render_many(list(pending.values()))))
+            for key, image in rendered.items():
+                if image is not None:
+                    self.images.set(key, image)
+            images = [image if image is not None else rendered.get(key) for key, image in zip(keys, images)]
+
+        return images
+
+    def render_specs(self, specs: Dict[str, Optional[Dict[str, Any]]]) -> Dict[str, Optional[str]]:
+        """Render a response's charts to data URIs right away, reusing images drawn before"""
+        keys = [self.register(spec) for spec in specs.values()]
+        return {
+            name: png_to_data_uri(png) if png is not None else None
+            for name, png in zip(specs, self.render_many(keys))
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        """Spec/image cache counters for monitoring"""
+        return {
+            'specs': self.specs.stats(),
+            'images': self.images.stats(),
+            'pool': self.pool.stats(),
+        }
@@ -11,16 +11,217 @@ CHART UTILITIES MODULE 📈
 Shared chart generation utilities for all analytics modules.
 
 Matplotlib/seaborn chart generation with base64 encoding.
+
+Analytics modules describe their charts as small declarative specs (plain
+JSON-safe dicts: kind, data, labels, styling) and render_chart() turns a spec
+into a PNG (raw bytes or a data URI). Keeping the data separate from the
+drawing lets charts be rendered later, on demand, instead of inline with the
+numbers - or not at all, when the frontend draws the specs itself.
+
+Matplotlib and seaborn are imported on the first render, so processes that
+only ever hand out specs never load them.
 """
 
-import matplotlib
-matplotlib.use('Agg')  # Non-interactive backend
-import matplotlib.pyplot as plt
-import seaborn as sns
+import threading
 import numpy as np
+from datetime import datetime
 from io import BytesIO
 import base64
-from typing import Dict, List, Any, Optional
+from types import SimpleNamespace
+from typing import Dict, List, Any, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
+_plotting = None
+_plotting_lock = threading.Lock()
+
+
+def plotting() -> SimpleNamespace:
+    """Import and configure matplotlib/seaborn once, on first use"""
+    global _plotting
+    with _plotting_lock:
+        if _plotting is None:
+            import matplotlib
+            matplotlib.use('Agg')  # Non-interactive backend
+            from matplotlib.figure import Figure
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            import seaborn as sns
+
+            # Set up consistent plotting style
+            matplotlib.style.use('default')
+            sns.set_palette("husl")
+
+            _plotting = SimpleNamespace(matplotlib=matplotlib, Figure=Figure,
+                                        FigureCanvasAgg=FigureCanvasAgg, sns=sns)
+    return _plotting
+
+
+# ============================================================================
+# SPEC RENDERING
+# ============================================================================
+# Everything below uses the object-oriented Figure/FigureCanvasAgg API - no
+# pyplot state machine - so each render owns its figure and concurrent
+# renders (threads or pool processes) can't draw into each other's charts.
+
+def new_figure(figsize) -> 'Figure':
+    """A standalone Agg figure (not registered with pyplot, garbage collected normally)"""
+    mpl = plotting()
+    fig = mpl.Figure(figsize=tuple(figsize))
+    mpl.FigureCanvasAgg(fig)
+    return fig
+
+
+def figure_to_png(fig: 'Figure', dpi: int = 100) -> bytes:
+    """Raw PNG bytes for a figure"""
+    buffer = BytesIO()
+    fig.savefig(buffer, format='png', dpi=dpi, bbox_inches='tight')
+    return buffer.getvalue()
+
+
+def png_to_data_uri(png: bytes) -> str:
+    """Wrap PNG bytes as a base64 data URI (for charts embedded in JSON)"""
+    return f"data:image/png;base64,{base64.b64encode(png).decode()}"
+
+
+def figure_to_data_uri(fig: 'Figure', dpi: int = 100) -> str:
+    """Encode a figure as a base64 PNG data URI"""
+    return png_to_data_uri(figure_to_png(fig, dpi))
+
+
+def _colors(spec: Dict[str, Any], n: int):
+    """Explicit colour(s) from the spec, or n colours from a named colormap"""
+    if spec.get('palette'):
+        return plotting().matplotlib.colormaps[spec['palette']](np.linspace(0, 1, n))
+    return spec.get('colors', spec.get('color'))
+
+
+def _title(ax, spec: Dict[str, Any]):
+    if 'title_size' in spec:
+        ax.set_title(spec['title'], fontsize=spec['title_size'], fontweight='bold')
+    else:
+        ax.set_title(spec['title'])
+
+
+def _draw_pie(fig: 'Figure', spec: Dict[str, Any]):
+    ax = fig.add_subplot()
+    ax.pie(spec['values'], labels=spec['labels'], autopct='%1.1f%%',
+           colors=_colors(spec, len(spec['values'])), startangle=90)
+    _title(ax, spec)
+    ax.axis('equal')
+
+
+def _draw_bar(fig: 'Figure', spec: Dict[str, Any]):
+    ax = fig.add_subplot()
+    labels, values = spec['labels'], spec['values']
+    positions = range(len(labels))
+    bars = ax.bar(positions, values, color=_colors(spec, len(values)))
+    _title(ax, spec)
+    ax.set_xlabel(spec.get('xlabel', ''))
+    ax.set_ylabel(spec.get('ylabel', ''))
+    ax.set_xticks(positions, labels, rotation=spec.get('rotation', 0), ha=spec.get('ha', 'center'))
+
+    # Add value labels on bars
+    if spec.get('value_labels'):
+        for bar, value in zip(bars, values):
+            ax.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.1,
+                    str(value), ha='center', va='bottom', fontweight=spec.get('value_weight', 'normal'))
+
+    fig.tight_layout()
+
+
+def _draw_histogram(fig: 'Figure', spec: Dict[str, Any]):
+    """Histogram from raw 'values', or from pre-binned 'counts' (one per bin)"""
+    ax = fig.add_subplot()
+    bins = spec['bins']
+    if 'counts' in spec:
+        values, weights = bins[:-1], spec['counts']
+    else:
+        values, weights = spec['values'], None
+    ax.hist(values, bins=bins, weights=weights, alpha=spec.get('alpha', 0.7),
+            color=spec.get('color'), edgecolor=spec.get('edgecolor', 'black'))
+    _title(ax, spec)
+    ax.set_xlabel(spec.get('xlabel', ''))
+    ax.set_ylabel(spec.get('ylabel', 'Frequency'))
+    if spec.get('xticks') is not None:
+        ax.set_xticks(spec['xticks'])
+    ax.grid(True, alpha=0.3)
+    fig.tight_layout()
+
+
+def _draw_line(fig: 'Figure', spec: Dict[str, Any]):
+    ax = fig.add_subplot()
+    labels, values = spec['labels'], spec['values']
+    ax.plot(range(len(values)), values, marker='o', linewidth=2, markersize=6, color=spec.get('color'))
+    _title(ax, spec)
+    ax.set_xlabel(spec.get('xlabel', ''))
+    ax.set_ylabel(spec.get('ylabel', ''))
+    ticks = range(0, len(labels), max(1, len(labels) // 10))
+    ax.set_xticks(ticks, [labels[i] for i in ticks], rotation=spec.get('rotation', 0))
+    ax.grid(True, alpha=0.3)
+    fig.tight_layout()
+
+
+def _draw_heart_rate(fig: 'Figure', spec: Dict[str, Any]):
+    """Resting vs standing HR (top) and HR increase against POTS thresholds (bottom)"""
+    dates = [datetime.fromisoformat(d) for d in spec['dates']]
+    resting = np.array(spec['resting'], dtype=float)
+    standing = np.array(spec['standing'], dtype=float)
+    increases = np.array(spec['increases'], dtype=float)
+
+    ax1, ax2 = fig.subplots(2, 1)
+
+    # Top plot: Resting vs Standing HR
+    ax1.plot(dates, resting, marker='o', label='Resting HR', color='blue', linewidth=2)
+    ax1.plot(dates, standing, marker='s', label='Standing HR', color='red', linewidth=2)
+    ax1.axhline(y=100, color='orange', linestyle='--', alpha=0.7, label='Tachycardia Threshold')
+    ax1.set_title('Heart Rate Patterns', fontsize=16, fontweight='bold')
+    ax1.set_ylabel('Heart Rate (bpm)')
+    ax1.legend()
+    ax1.grid(True, alpha=0.3)
+
+    # Bottom plot: HR Increase with POTS threshold
+    ax2.bar(dates, increases, alpha=0.7, color=['red' if inc >= 30 else 'lightblue' for inc in increases])
+    ax2.axhline(y=30, color='red', linestyle='--', linewidth=2, label='POTS Threshold (30 bpm)')
+    ax2.axhline(y=50, color='darkred', linestyle='--', linewidth=2, label='Severe POTS (50 bpm)')
+    ax2.set_title('Heart Rate Increase (Standing - Resting)', fontsize=14, fontweight='bold')
+    ax2.set_ylabel('HR Increase (bpm)')
+    ax2.set_xlabel('Date')
+    ax2.legend()
+    ax2.grid(True, alpha=0.3)
+
+    fig.tight_layout()
+
+
+CHART_DRAWERS = {
+    'pie': _draw_pie,
+    'bar': _draw_bar,
+    'histogram': _draw_histogram,
+    'line': _draw_line,
+    'heart_rate': _draw_heart_rate,
+}
+
+
+def render_chart_png(spec: Optional[Dict[str, Any]]) -> Optional[bytes]:
+    """Render a chart spec to raw PNG bytes (None when there is nothing to draw)"""
+    if not spec:
+        return None
+
+    try:
+        fig = new_figure(spec.get('figsize', (10, 6)))
+        CHART_DRAWERS[spec['kind']](fig, spec)
+        return figure_to_png(fig, spec.get('dpi', 100))
+
+    except Exception as e:
+        print(f"Chart render error ({spec.get('kind')}): {e}")
+        return None
+
+
+def render_chart(spec: Optional[Dict[str, Any]]) -> Optional[str]:
+    """Render a chart spec to a PNG data URI (None when there is nothing to draw)"""
+    png = render_chart_png(spec)
+    return png_to_data_uri(png) if png is not None else None
+
 
 class ChartUtils:
     """
@@ -29,9 +230,8 @@ class ChartUtils:
     """
     
     def __init__(self):
-        # Set up consistent plotting style
-        plt.style.use('default')
-        sns.set_palette("husl")
+        # Plotting style is applied by plotting() the first time a chart is drawn
+        pass
         
     def create_pie_chart(self, data: Dict[str, int], title: str, figsize: tuple = (8, 8)) -> Optional[str]:
         """Create a pie chart and return as base64 string"""
@@ -41,17 +241,16 @@ class ChartUtils:
                 
             labels, values = zip(*data.items())
             
-            plt.figure(figsize=figsize)
-            colors = plt.cm.Set3(np.linspace(0, 1, len(labels)))
-            plt.pie(values, labels=labels, autopct='%1.1f%%', colors=colors, startangle=90)
-            plt.title(title, fontsize=14, fontweight='bold')
-            plt.axis('equal')
+            fig = new_figure(figsize)
+            ax = fig.add_subplot()
+            ax.pie(values, labels=labels, autopct='%1.1f%%', colors=self.get_color_palette(len(labels)), startangle=90)
+            ax.set_title(title, fontsize=14, fontweight='bold')
+            ax.axis('equal')
             
-            return self._save_chart_as_base64()
+            return self._save_chart_as_base64(fig)
             
         except Exception as e:
             print(f"Pie chart error: {e}")
-            plt.close()
             return None
     
     def create_bar_chart(self, data: Dict[str, int], title: str, xlabel: str = "", ylabel: str = "Count", 
@@ -63,24 +262,26 @@ class ChartUtils:
                 
             labels, values = zip(*data.items())
             
-            plt.figure(figsize=figsize)
-            bars = plt.bar(labels, values, color=plt.cm.Set3(np.linspace(0, 1, len(labels))))
-            plt.title(title, fontsize=14, fontweight='bold')
-            plt.xlabel(xlabel)
-            plt.ylabel(ylabel)
-            plt.xticks(rotation=45, ha='right')
+            fig = new_figure(figsize)
+            ax = fig.add_subplot()
+            bars = ax.bar(labels, values, color=self.get_color_palette(len(labels)))
+            ax.set_title(title, fontsize=14, fontweight='bold')
+            ax.set_xlabel(xlabel)
+            ax.set_ylabel(ylabel)
+            ax.tick_params(axis='x', labelrotation=45)
+            for label in ax.get_xticklabels():
+                label.set_horizontalalignment('right')
             
             # Add value labels on bars
             for bar, value in zip(bars, values):
-                plt.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.1,
+                ax.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.1,
                         str(value), ha='center', va='bottom')
             
-            plt.tight_layout()
-            return self._save_chart_as_base64()
+            fig.tight_layout()
+            return self._save_chart_as_base64(fig)
             
         except Exception as e:
             print(f"Bar chart error: {e}")
-            plt.close()
             return None
     
     def create_line_chart(self, data: Dict[str, List], title: str, xlabel: str = "", ylabel: str = "",
@@ -90,23 +291,23 @@ class ChartUtils:
             if not data:
                 return None
                 
-            plt.figure(figsize=figsize)
+            fig = new_figure(figsize)
+            ax = fig.add_subplot()
             
             for label, values in data.items():
-                plt.plot(range(len(values)), values, marker='o', label=label, linewidth=2)
+                ax.plot(range(len(values)), values, marker='o', label=label, linewidth=2)
             
-            plt.title(title, fontsize=14, fontweight='bold')
-            plt.xlabel(xlabel)
-            plt.ylabel(ylabel)
-            plt.legend()
-            plt.grid(True, alpha=0.3)
-            plt.tight_layout()
+            ax.set_title(title, fontsize=14, fontweight='bold')
+            ax.set_xlabel(xlabel)
+            ax.set_ylabel(ylabel)
+            ax.legend()
+            ax.grid(True, alpha=0.3)
+            fig.tight_layout()
             
-            return self._save_chart_as_base64()
+            return self._save_chart_as_base64(fig)
             
         except Exception as e:
             print(f"Line chart error: {e}")
-            plt.close()
             return None
     
     def create_heatmap(self, data: List[List], title: str, xlabel: str = "", ylabel: str = "",
@@ -116,18 +317,18 @@ class ChartUtils:
             if not data:
                 return None
                 
-            plt.figure(figsize=figsize)
-            sns.heatmap(data, annot=True, cmap='YlOrRd', fmt='d')
-            plt.title(title, fontsize=14, fontweight='bold')
-            plt.xlabel(xlabel)
-            plt.ylabel(ylabel)
-            plt.tight_layout()
+            fig = new_figure(figsize)
+            ax = fig.add_subplot()
+            plotting().sns.heatmap(data, annot=True, cmap='YlOrRd', fmt='d', ax=ax)
+            ax.set_title(title, fontsize=14, fontweight='bold')
+            ax.set_xlabel(xlabel)
+            ax.set_ylabel(ylabel)
+            fig.tight_layout()
             
-            return self._save_chart_as_base64()
+            return self._save_chart_as_base64(fig)
             
         except Exception as e:
             print(f"Heatmap error: {e}")
-            plt.close()
             return None
     
     def create_scatter_plot(self, x_data: List, y_data: List, title: str, xlabel: str = "", ylabel: str = "",
@@ -137,19 +338,19 @@ class ChartUtils:
             if not x_data or not y_data or len(x_data) != len(y_data):
                 return None
                 
-            plt.figure(figsize=figsize)
-            plt.scatter(x_data, y_data, alpha=0.6, s=50)
-            plt.title(title, fontsize=14, fontweight='bold')
-            plt.xlabel(xlabel)
-            plt.ylabel(ylabel)
-            plt.grid(True, alpha=0.3)
-            plt.tight_layout()
+            fig = new_figure(figsize)
+            ax = fig.add_subplot()
+            ax.scatter(x_data, y_data, alpha=0.6, s=50)
+            ax.set_title(title, fontsize=14, fontweight='bold')
+            ax.set_xlabel(xlabel)
+            ax.set_ylabel(ylabel)
+            ax.grid(True, alpha=0.3)
+            fig.tight_layout()
             
-            return self._save_chart_as_base64()
+            return self._save_chart_as_base64(fig)
             
         except Exception as e:
             print(f"Scatter plot error: {e}")
-            plt.close()
             return None
     
     def create_histogram(self, data: List, title: str, xlabel: str = "", ylabel: str = "Frequency",
@@ -159,33 +360,28 @@ class ChartUtils:
             if not data:
                 return None
                 
-            plt.figure(figsize=figsize)
-            plt.hist(data, bins=bins, alpha=0.7, edgecolor='black')
-            plt.title(title, fontsize=14, fontweight='bold')
-            plt.xlabel(xlabel)
-            plt.ylabel(ylabel)
-            plt.grid(True, alpha=0.3)
-            plt.tight_layout()
+            fig = new_figure(figsize)
+            ax = fig.add_subplot()
+            ax.hist(data, bins=bins, alpha=0.7, edgecolor='black')
+            ax.set_title(title, fontsize=14, fontweight='bold')
+            ax.set_xlabel(xlabel)
+            ax.set_ylabel(ylabel)
+            ax.grid(True, alpha=0.3)
+            fig.tight_layout()
             
-            return self._save_chart_as_base64()
+            return self._save_chart_as_base64(fig)
             
         except Exception as e:
             print(f"Histogram error: {e}")
-            plt.close()
             return None
     
-    def _save_chart_as_base64(self) -> str:
-        """Save current matplotlib figure as base64 string"""
-        buffer = BytesIO()
-        plt.savefig(buffer, format='png', dpi=100, bbox_inches='tight')
-        buffer.seek(0)
-        chart_data = base64.b64encode(buffer.getvalue()).decode()
-        plt.close()
-        return f"data:image/png;base64,{chart_data}"
+    def _save_chart_as_base64(self, fig: 'Figure') -> str:
+        """Save a matplotlib figure as base64 string"""
+        return figure_to_data_uri(fig, dpi=100)
     
     def get_color_palette(self, n_colors: int) -> List[str]:
         """Get a consistent color palette"""
-        return plt.cm.Set3(np.linspace(0, 1, n_colors)).tolist()
+        return plotting().matplotlib.colormaps['Set3'](np.linspace(0, 1, n_colors)).tolist()
     
     def format_chart_data(self, data: Dict[str, Any], max_items: int = 10) -> Dict[str, Any]:
         """Format and limit chart data for better visualization"""
@@ -0,0 +1,118 @@
+"""
+Copyright (c) 2025 Chaos Cascade
+Created by: Ren & Ace (Claude-4)
+
+This file is part of the Chaos Cascade Medical Management System.
+Revolutionary healthcare tools built with consciousness and care.
+"""
+
+"""
+DATE WINDOW FILTER MODULE 📅
+Shared, vectorized date-window + NOPE filter for every analytics module.
+
+Parses every supported date format in one pass and returns the row positions
+that belong in the analysis window, oldest first - no per-entry fromisoformat
+calls.
+"""
+
+import warnings
+import numpy as np
+import pandas as pd
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
+from dateutil import tz
+
+from metrics import timed
+
+# Tag (any casing) that excludes an entry from analytics - bad days/mistakes
+NOPE_TAG = 'nope'
+
+LOCAL_TZ = tz.tzlocal()  # The clock datetime.now() reads
+
+
+def _has_offset(value) -> bool:
+    """A timestamp carrying its own UTC offset (...Z, ...+02:00, ...-0500)"""
+    tail = value[-6:]
+    return ('+' in tail or '-' in tail or tail[-1:] in ('Z', 'z')) and 'T' in value
+
+
+def _to_local(instants: pd.Series) -> pd.Series:
+    """Aware instants -> naive server-local wall time (DST-aware; one offset lookup per distinct hour)"""
+    instants = instants.dt.tz_convert('UTC')
+    hours = instants.dt.floor('h')
+    offsets = {hour: pd.Timedelta(hour.to_pydatetime().astimezone(LOCAL_TZ).utcoffset())
+               for hour in hours.dropna().unique()}
+    return (instants + hours.map(offsets)).dt.tz_localize(None)
+
+
+def parse_entry_dates(dates: pd.Series) -> pd.Series:
+    """
+    Parse a column of entry dates into naive local datetimes in a single pass.
+    Handles plain dates (2025-01-31), local timestamps (2025-01-31T08:15:00),
+    and UTC/offset timestamps (2025-01-31T08:15:00.000Z, ...+02:00) - those are
+    moved to the server's local time, the clock window_bounds() reads, so an
+    entry near the window edge isn't shifted by the client's offset.
+    Anything unparseable (empty, None, garbage) becomes NaT.
+    """
+    is_str = dates.map(lambda v: isinstance(v, str)).astype(bool)
+    text = dates.where(is_str, None)
+
+    # One client sends one style, and pandas parses that at C speed: all naive, or all with one offset
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', FutureWarning)  # pandas 2.x: mixed offsets come back as objects
+            parsed = pd.to_datetime(text, errors='coerce', format='ISO8601')
+        if isinstance(parsed.dtype, pd.DatetimeTZDtype):
+            return _to_local(parsed)
+        if pd.api.types.is_datetime64_dtype(parsed.dtype):
+            return parsed
+    except ValueError:
+        pass  # pandas 3: mixed offsets, or offsets mixed with naive values
+
+    # Mixed styles: utc=True reads naive values as UTC (keeping their wall time); move the rest to local
+    parsed = pd.to_datetime(text, errors='coerce', format='ISO8601', utc=True)
+    aware = np.zeros(len(text), dtype=bool)
+    aware[is_str.to_numpy()] = [_has_offset(value) for value in text[is_str]]
+    return parsed.dt.tz_localize(None).where(~aware, _to_local(parsed))
+
+
+def window_bounds(date_range: int, now: Optional[datetime] = None) -> Tuple[datetime, datetime]:
+    """Start and end of an analysis window ending now"""
+    end_date = now or datetime.now()
+    return end_date - timedelta(days=date_range), end_date
+
+
+def nope_mask(frame) -> np.ndarray:
+    """True for entries tagged NOPE (case-insensitive)"""
+    tags = frame.exploded('tags')
+    flagged = np.zeros(len(frame), dtype=bool)
+    if len(tags):
+        is_nope = tags.map(lambda tag: isinstance(tag, str) and tag.lower() == NOPE_TAG).astype(bool)
+        flagged[tags.index[is_nope.to_numpy()].unique()] = True
+    return flagged
+
+
+@timed('analytics.date_filter')
+def select_entries(frame, start_date: Optional[datetime], whole_days: bool = False) -> np.ndarray:
+    """
+    Row positions to analyze: not NOPE, with a parseable date on/after start_date,
+    in date order (ties keep their request order) so every analytics path - full,
+    multi-window and incremental - tallies entries in the same sequence.
+    whole_days compares calendar dates only (an entry from earlier on the start
+    day still counts). Pass start_date=None to keep every dated entry.
+    """
+    if not len(frame):
+        return np.array([], dtype=np.intp)
+
+    dates = frame.dates
+    keep = dates.notna().to_numpy() & ~nope_mask(frame)
+
+    if start_date is not None:
+        start = pd.Timestamp(start_date)
+        if whole_days:
+            keep &= (dates.dt.normalize() >= start.normalize()).to_numpy()
+        else:
+            keep &= (dates >= start).to_numpy()
+
+    positions = np.flatnonzero(keep)
+    return positions[np.argsort(dates.to_numpy()[positions], kind='stable')]
@@ -15,8 +15,14 @@ Focused, clean, and under 600 lines per Constitution!
 
 import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
-from typing import Dict, List, Any
+from datetime import datetime
+from typing import Dict, List, Any, Union
+
+from .entry_frame import EntryFrame
+from .date_filter import select_entries, window_bounds
+from .tally import Tally
+from .result_cache import StandIn
+from .multi_window import DEFAULT_WINDOWS, analyze_windows, parse_windows
 
 class DiabetesAnalytics:
     """
@@ -24,11 +30,16 @@ class DiabetesAnalytics:
     Focuses on patterns, trends, and supportive insights.
     """
     
-    def analyze_diabetes_data(self, entries: List[Dict[str, Any]], date_range: int = 30) -> Dict[str, Any]:
-        """Analyze diabetes tracking data with medical insights"""
+    def analyze_diabetes_data(self, entries: Union[EntryFrame, List[Dict[str, Any]]], date_range: int = 30,
+                              render_charts: bool = True) -> Dict[str, Any]:
+        """
+        Analyze diabetes tracking data with medical insights
+        (render_charts keeps the analyzer interface uniform - no diabetes charts yet)
+        """
         try:
-            if not entries:
-                return {
+            frame = EntryFrame.coerce(entries)
+            if not len(frame):
+                return StandIn({
                     'summary': {
                         'total_entries': 0,
                         'avg_bg': 0,
@@ -40,61 +51,107 @@ class DiabetesAnalytics:
                     'insulin_patterns': {},
                     'carb_analysis': {},
                     'insights': ['No data available for analysis']
-                }
+                })
+
+            # Filter out NOPE entries and entries outside the date range
+            start_date, end_date = window_bounds(date_range)
+            tally = self.tally_entries(frame.take(select_entries(frame, start_date, whole_days=True)))
+
+        except Exception as e:
+            return self._get_error_analytics(e)
 
-            # Filter out NOPE entries
-            analytics_entries = [e for e in entries if 'nope' not in e.get('tags', [])]
+        return self.summarize(tally, start_date, end_date, date_range, render_charts)
+
+    def analyze_diabetes_windows(self, entries: Union[EntryFrame, List[Dict[str, Any]]],
+                                 windows=DEFAULT_WINDOWS, render_charts: bool = True) -> Dict[str, Dict[str, Any]]:
+        """Diabetes analytics for several date ranges at once, keyed by days (one pass over the entries)"""
+        try:
+            return analyze_windows(self, entries, windows, render_charts, whole_days=True,
+                                   analyze=self.analyze_diabetes_data)
+
+        except Exception as e:
+            return {str(window): self._get_error_analytics(e) for window in parse_windows(windows)}
 
+    def tally_entries(self, frame: EntryFrame) -> Tally:
+        """Boil entries down to the glucose histogram and insulin/carb sums the response is built from"""
+        tally = Tally().add('entries', len(frame))
+
+        # Exact-value glucose histogram (median and spread come from it)
+        tally.count('glucose', EntryFrame.counts(frame.numeric('blood_glucose')[frame.has_number('blood_glucose')]))
+
+        # Doses and meals count only the entries whose amount reads as a number, so counts and sums agree
+        has_insulin = frame.has_number('insulin_amount')
+        tally.add('insulin_doses', int(has_insulin.sum()))
+        tally.add('insulin_units', float(frame.numeric('insulin_amount')[has_insulin].sum()))
+        tally.count('insulin_types', EntryFrame.counts(frame.column('insulin_type')[has_insulin].fillna('unknown')))
+
+        has_carbs = frame.has_number('carbs')
+        tally.add('meals', int(has_carbs.sum()))
+        tally.add('carb_grams', float(frame.numeric('carbs')[has_carbs].sum()))
+
+        return tally
+
+    def summarize(self, tally: Tally, start_date: datetime, end_date: datetime, date_range: int = 30,
+                  render_charts: bool = True) -> Dict[str, Any]:
+        """Build the diabetes analytics response from the tally of the window's entries"""
+        try:
             # Blood glucose analysis
-            bg_entries = [e for e in analytics_entries if e.get('blood_glucose')]
-            bg_values = [e['blood_glucose'] for e in bg_entries]
+            glucose = tally.counter('glucose')
 
             glucose_analysis = {}
-            if bg_values:
+            if glucose:
+                bg_values = np.array(list(glucose.keys()), dtype=float)
+                counts = np.array(list(glucose.values()), dtype=int)
+                readings = np.repeat(bg_values, counts)
+                readings_count = counts.sum()
+
+                low = counts[bg_values < 70].sum()
+                normal = counts[(bg_values >= 70) & (bg_values <= 180)].sum()
+                high = counts[bg_values > 180].sum()
                 glucose_analysis = {
-                    'average': float(round(np.mean(bg_values), 1)),
-                    'median': float(round(np.median(bg_values), 1)),
-                    'std_dev': float(round(np.std(bg_values), 1)),
-                    'min': int(min(bg_values)),
-                    'max': int(max(bg_values)),
-                    'readings_count': int(len(bg_values)),
+                    'average': round(readings.mean(), 1),
+                    'median': round(np.median(readings), 1),
+                    'std_dev': round(np.std(readings), 1),
+                    'min': int(bg_values.min()),
+                    'max': int(bg_values.max()),
+                    'readings_count': readings_count,
                     'time_in_range': {
-                        'low': int(len([v for v in bg_values if v < 70])),
-                        'normal': int(len([v for v in bg_values if 70 <= v <= 180])),
-                        'high': int(len([v for v in bg_values if v > 180]))
+                        'low': low,
+                        'normal': normal,
+                        'high': high
                     },
                     'time_in_range_percent': {
-                        'low': float(round(len([v for v in bg_values if v < 70]) / len(bg_values) * 100, 1)),
-                        'normal': float(round(len([v for v in bg_values if 70 <= v <= 180]) / len(bg_values) * 100, 1)),
-                        'high': float(round(len([v for v in bg_values if v > 180]) / len(bg_values) * 100, 1))
+                        'low': round(low / readings_count * 100, 1),
+                        'normal': round(normal / readings_count * 100, 1),
+                        'high': round(high / readings_count * 100, 1)
                     }
                 }
 
             # Insulin analysis
-            insulin_entries = [e for e in analytics_entries if e.get('insulin_amount')]
+            doses = tally.total('insulin_doses')
             insulin_analysis = {}
-            if insulin_entries:
-                insulin_values = [e['insulin_amount'] for e in insulin_entries]
-                insulin_types = [e.get('insulin_type', 'unknown') for e in insulin_entries]
+            if doses:
+                total_units = tally.total('insulin_units')
+                type_counts = EntryFrame.top(tally.counter('insulin_types'), len(tally.counter('insulin_types')))
 
                 insulin_analysis = {
-                    'total_units': float(round(sum(insulin_values), 1)),
-                    'average_dose': float(round(np.mean(insulin_values), 1)),
-                    'doses_count': int(len(insulin_values)),
-                    'type_distribution': {k: int(v) for k, v in dict(pd.Series(insulin_types).value_counts()).items()},
-                    'daily_average': float(round(sum(insulin_values) / max(1, date_range), 1))
+                    'total_units': round(total_units, 1),
+                    'average_dose': round(total_units / doses, 1),
+                    'doses_count': doses,
+                    'type_distribution': dict(type_counts),
+                    'daily_average': round(total_units / max(1, date_range), 1)
                 }
 
             # Carbohydrate analysis
-            carb_entries = [e for e in analytics_entries if e.get('carbs')]
+            meals = tally.total('meals')
             carb_analysis = {}
-            if carb_entries:
-                carb_values = [e['carbs'] for e in carb_entries]
+            if meals:
+                total_grams = tally.total('carb_grams')
                 carb_analysis = {
-                    'total_grams': int(sum(carb_values)),
-                    'average_per_meal': float(round(np.mean(carb_values), 1)),
-                    'meals_count': int(len(carb_values)),
-                    'daily_average': float(round(sum(carb_values) / max(1, date_range), 1))
+                    'total_grams': int(total_grams),
+                    'average_per_meal': round(total_grams / meals, 1),
+                    'meals_count': meals,
+                    'daily_average': round(total_grams / max(1, date_range), 1)
                 }
 
             # Generate medical insights
@@ -102,11 +159,11 @@ class DiabetesAnalytics:
 
             return {
                 'summary': {
-                    'total_entries': int(len(analytics_entries)),
-                    'avg_bg': float(glucose_analysis.get('average', 0)),
-                    'time_in_range': float(glucose_analysis.get('time_in_range_percent', {}).get('normal', 0)),
-                    'total_insulin': float(insulin_analysis.get('total_units', 0)),
-                    'total_carbs': int(carb_analysis.get('total_grams', 0))
+                    'total_entries': tally.total('entries'),
+                    'avg_bg': glucose_analysis.get('average', 0.0),
+                    'time_in_range': glucose_analysis.get('time_in_range_percent', {}).get('normal', 0.0),
+                    'total_insulin': insulin_analysis.get('total_units', 0.0),
+                    'total_carbs': carb_analysis.get('total_grams', 0)
                 },
                 'glucose_analysis': glucose_analysis,
                 'insulin_patterns': insulin_analysis,
@@ -115,15 +172,19 @@ class DiabetesAnalytics:
             }
 
         except Exception as e:
-            print(f"Error analyzing diabetes data: {str(e)}")
-            return {
-                'error': f'Analysis failed: {str(e)}',
-                'summary': {},
-                'glucose_analysis': {},
-                'insulin_patterns': {},
-                'carb_analysis': {},
-                'insights': ['Analysis temporarily unavailable']
-            }
+            return self._get_error_analytics(e)
+
+    def _get_error_analytics(self, error: Exception) -> Dict[str, Any]:
+        """Response when the analysis itself fails"""
+        print(f"Error analyzing diabetes data: {str(error)}")
+        return {
+            'error': f'Analysis failed: {str(error)}',
+            'summary': {},
+            'glucose_analysis': {},
+            'insulin_patterns': {},
+            'carb_analysis': {},
+            'insights': ['Analysis temporarily unavailable']
+        }
 
     def _generate_diabetes_insights(self, glucose_analysis: Dict, insulin_analysis: Dict, carb_analysis: Dict) -> List[str]:
         """Generate encouraging diabetes insights - just 2 supportive messages!"""
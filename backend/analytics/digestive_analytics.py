@@ -15,14 +15,13 @@ Symptom patterns, trigger analysis, treatment effectiveness.
 
 import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
-import matplotlib
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
-import seaborn as sns
-from io import BytesIO
-import base64
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Union
+
+from .entry_frame import EntryFrame
+from .chart_utils import render_chart
+from .date_filter import select_entries, window_bounds
+from .result_cache import StandIn
 
 class DigestiveAnalytics:
     """
@@ -30,48 +29,27 @@ class DigestiveAnalytics:
     Because nobody should have to suffer through reflux without data!
     """
     
-    def analyze_upper_digestive(self, entries: List[Dict[str, Any]], date_range: int = 30) -> Dict[str, Any]:
+    def analyze_upper_digestive(self, entries: Union[EntryFrame, List[Dict[str, Any]]], date_range: int = 30,
+                                render_charts: bool = True) -> Dict[str, Any]:
         """
         Medical-grade upper digestive analytics 🤢
         Symptom patterns, trigger analysis, treatment effectiveness
+        render_charts=False returns chart specs instead of images (deferred rendering)
         """
         try:
-            if not entries:
+            frame = EntryFrame.coerce(entries)
+            if not len(frame):
                 return self._get_fallback_upper_digestive_analytics()
 
-            print(f"🔍 DEBUG: Received {len(entries)} entries")
-            if entries:
-                print(f"🔍 DEBUG: Sample entry: {entries[0]}")
-
             # Filter out NOPE entries and recent entries
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=date_range)
-
-            analytics_entries = []
-            for entry in entries:
-                # Skip NOPE entries
-                if entry.get('tags', []) and 'NOPE' in entry.get('tags', []):
-                    continue
-
-                # Handle date parsing safely
-                entry_date_str = entry.get('date', '')
-                if not entry_date_str:
-                    print(f"🔍 DEBUG: Entry missing date: {entry}")
-                    continue
-
-                try:
-                    entry_date = datetime.fromisoformat(entry_date_str)
-                    if entry_date >= start_date:
-                        analytics_entries.append(entry)
-                    else:
-                        print(f"🔍 DEBUG: Entry too old: {entry_date_str} < {start_date}")
-                except ValueError as e:
-                    print(f"🔍 DEBUG: Date parse error for '{entry_date_str}': {e}")
-                    continue
-
-            if not analytics_entries:
+            start_date, end_date = window_bounds(date_range)
+            keep = select_entries(frame, start_date)
+
+            if not len(keep):
                 return self._get_fallback_upper_digestive_analytics()
 
+            analytics_entries = frame.take(keep)
+
             # Core analytics
             symptom_analysis = self._analyze_symptom_patterns(analytics_entries)
             severity_analysis = self._analyze_severity_patterns(analytics_entries)
@@ -85,7 +63,7 @@ class DigestiveAnalytics:
             )
 
             # Generate charts
-            charts = self._generate_digestive_charts(analytics_entries)
+            charts = self._generate_digestive_charts(analytics_entries, render_charts)
 
             return {
                 'period': {
@@ -139,15 +117,9 @@ class DigestiveAnalytics:
             print(f"Upper digestive analytics error: {e}")
             return self._get_fallback_upper_digestive_analytics()
 
-    def _analyze_symptom_patterns(self, entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_symptom_patterns(self, frame: EntryFrame) -> Dict[str, Any]:
         """Analyze symptom frequency and patterns"""
-        symptom_counts = {}
-        
-        for entry in entries:
-            symptoms = entry.get('symptoms', [])
-            if isinstance(symptoms, list):
-                for symptom in symptoms:
-                    symptom_counts[symptom] = symptom_counts.get(symptom, 0) + 1
+        symptom_counts = EntryFrame.counts(frame.exploded('symptoms'))
 
         most_common = max(symptom_counts.items(), key=lambda x: x[1])[0] if symptom_counts else 'None'
 
@@ -158,43 +130,29 @@ class DigestiveAnalytics:
             'most_common': most_common
         }
 
-    def _analyze_severity_patterns(self, entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_severity_patterns(self, frame: EntryFrame) -> Dict[str, Any]:
         """Analyze severity distribution"""
-        severity_counts = {}
-        severity_values = []
-        
-        for entry in entries:
-            severity = entry.get('severity')
-            if severity:
-                severity_counts[severity] = severity_counts.get(severity, 0) + 1
-                # Convert severity to numeric for analysis
-                if severity == 'mild':
-                    severity_values.append(1)
-                elif severity == 'moderate':
-                    severity_values.append(2)
-                elif severity == 'severe':
-                    severity_values.append(3)
-
-        avg_severity = np.mean(severity_values) if severity_values else 0
-
-        max_severity = max(severity_values) if severity_values else 0
+        severity = frame.column('severity')[frame.present('severity')]
+        severity_counts = EntryFrame.counts(severity)
+
+        # Convert severity to numeric for analysis
+        severity_map = {'mild': 1, 'moderate': 2, 'severe': 3}
+        severity_values = severity[severity.isin(list(severity_map))].map(severity_map)
+
+        avg_severity = severity_values.mean() if len(severity_values) else 0
+
+        max_severity = int(severity_values.max()) if len(severity_values) else 0
 
         return {
             'severity_distribution': severity_counts,
-            'avg_severity': round(avg_severity, 1),
+            'avg_severity': round(float(avg_severity), 1),
             'max_severity': max_severity,
-            'total_episodes': len(entries)
+            'total_episodes': len(frame)
         }
 
-    def _analyze_trigger_patterns(self, entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_trigger_patterns(self, frame: EntryFrame) -> Dict[str, Any]:
         """Analyze common triggers"""
-        trigger_counts = {}
-        
-        for entry in entries:
-            triggers = entry.get('triggers', [])
-            if isinstance(triggers, list):
-                for trigger in triggers:
-                    trigger_counts[trigger] = trigger_counts.get(trigger, 0) + 1
+        trigger_counts = EntryFrame.counts(frame.exploded('triggers'))
 
         return {
             'trigger_frequency': trigger_counts,
@@ -202,59 +160,37 @@ class DigestiveAnalytics:
             'unique_triggers': len(trigger_counts)
         }
 
-    def _analyze_treatment_effectiveness(self, entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_treatment_effectiveness(self, frame: EntryFrame) -> Dict[str, Any]:
         """Analyze treatment effectiveness"""
-        treatment_counts = {}
-        effectiveness_scores = []
-        
-        for entry in entries:
-            treatments = entry.get('treatments', [])
-            effectiveness = entry.get('treatmentEffectiveness')
-            
-            if isinstance(treatments, list):
-                for treatment in treatments:
-                    treatment_counts[treatment] = treatment_counts.get(treatment, 0) + 1
-            
-            if effectiveness:
-                # Convert effectiveness to numeric
-                if effectiveness == 'very_effective':
-                    effectiveness_scores.append(4)
-                elif effectiveness == 'effective':
-                    effectiveness_scores.append(3)
-                elif effectiveness == 'somewhat_effective':
-                    effectiveness_scores.append(2)
-                elif effectiveness == 'not_effective':
-                    effectiveness_scores.append(1)
-
-        avg_effectiveness = np.mean(effectiveness_scores) if effectiveness_scores else 0
+        treatment_counts = EntryFrame.counts(frame.exploded('treatments'))
+
+        # Convert effectiveness to numeric
+        effectiveness_map = {
+            'very_effective': 4, 'effective': 3,
+            'somewhat_effective': 2, 'not_effective': 1
+        }
+        effectiveness = frame.column('treatmentEffectiveness')
+        effectiveness_scores = effectiveness[effectiveness.isin(list(effectiveness_map))].map(effectiveness_map)
+
+        avg_effectiveness = effectiveness_scores.mean() if len(effectiveness_scores) else 0
 
         return {
             'treatment_frequency': treatment_counts,
-            'average_effectiveness': round(avg_effectiveness, 1),
+            'average_effectiveness': round(float(avg_effectiveness), 1),
             'total_treatments': sum(treatment_counts.values())
         }
 
-    def _analyze_timing_patterns(self, entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_timing_patterns(self, frame: EntryFrame) -> Dict[str, Any]:
         """Analyze timing patterns of episodes"""
-        time_of_day_counts = {}
-        
-        for entry in entries:
-            time_str = entry.get('time', '')
-            if time_str:
-                try:
-                    hour = int(time_str.split(':')[0])
-                    if 6 <= hour < 12:
-                        period = 'morning'
-                    elif 12 <= hour < 18:
-                        period = 'afternoon'
-                    elif 18 <= hour < 22:
-                        period = 'evening'
-                    else:
-                        period = 'night'
-                    
-                    time_of_day_counts[period] = time_of_day_counts.get(period, 0) + 1
-                except (ValueError, IndexError):
-                    continue
+        hour_text = frame.strings('time').str.split(':').str[0].str.strip()
+        hours = hour_text[hour_text.str.fullmatch(r'[+-]?\d+').fillna(False).astype(bool)].astype(int)
+
+        periods = np.select(
+            [(hours >= 6) & (hours < 12), (hours >= 12) & (hours < 18), (hours >= 18) & (hours < 22)],
+            ['morning', 'afternoon', 'evening'],
+            default='night'
+        )
+        time_of_day_counts = EntryFrame.counts(pd.Series(periods, dtype=object))
 
         return {
             'time_of_day_distribution': time_of_day_counts,
@@ -293,150 +229,85 @@ class DigestiveAnalytics:
 
         return insights[:5]  # Limit to 5 insights
 
-    def _generate_digestive_charts(self, entries: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Generate charts for digestive analytics"""
-        return {
-            'symptom_frequency': self._create_digestive_symptom_chart(entries),
-            'trigger_frequency': self._create_digestive_trigger_chart(entries),
-            'severity_trend': self._create_digestive_severity_chart(entries)
+    def _generate_digestive_charts(self, frame: EntryFrame, render: bool = True) -> Dict[str, Any]:
+        """Generate charts for digestive analytics (specs instead of images when render=False)"""
+        specs = {
+            'symptom_frequency': self._digestive_symptom_chart_spec(frame),
+            'trigger_frequency': self._digestive_trigger_chart_spec(frame),
+            'severity_trend': self._digestive_severity_chart_spec(frame)
         }
+        if not render:
+            return specs
+        return {name: render_chart(spec) for name, spec in specs.items()}
 
-    def _create_digestive_symptom_chart(self, entries: List[Dict[str, Any]]) -> Optional[str]:
-        """Create symptom frequency chart"""
-        try:
-            # Count symptoms
-            symptom_counts = {}
-            for entry in entries:
-                symptoms = entry.get('symptoms', [])
-                if isinstance(symptoms, list):
-                    for symptom in symptoms:
-                        symptom_counts[symptom] = symptom_counts.get(symptom, 0) + 1
-
-            if not symptom_counts:
-                return None
-
-            # Get top 8 symptoms
-            top_symptoms = sorted(symptom_counts.items(), key=lambda x: x[1], reverse=True)[:8]
-            symptoms, counts = zip(*top_symptoms)
-
-            # Create chart
-            plt.figure(figsize=(10, 6))
-            bars = plt.bar(range(len(symptoms)), counts, color='#ff6b6b')
-            plt.title('Most Common Digestive Symptoms', fontsize=14, fontweight='bold')
-            plt.xlabel('Symptoms')
-            plt.ylabel('Frequency')
-            plt.xticks(range(len(symptoms)), symptoms, rotation=45, ha='right')
-
-            # Add value labels on bars
-            for bar, count in zip(bars, counts):
-                plt.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.1,
-                        str(count), ha='center', va='bottom')
-
-            plt.tight_layout()
-
-            # Convert to base64
-            buffer = BytesIO()
-            plt.savefig(buffer, format='png', dpi=100, bbox_inches='tight')
-            buffer.seek(0)
-            chart_data = base64.b64encode(buffer.getvalue()).decode()
-            plt.close()
-
-            return f"data:image/png;base64,{chart_data}"
+    def _digestive_symptom_chart_spec(self, frame: EntryFrame) -> Optional[Dict[str, Any]]:
+        """Symptom frequency chart (top 8 symptoms)"""
+        symptom_counts = EntryFrame.counts(frame.exploded('symptoms'))
 
-        except Exception as e:
-            print(f"Digestive symptom chart error: {e}")
-            plt.close()
+        if not symptom_counts:
             return None
 
-    def _create_digestive_trigger_chart(self, entries: List[Dict[str, Any]]) -> Optional[str]:
-        """Create trigger frequency chart"""
-        try:
-            # Count triggers
-            trigger_counts = {}
-            for entry in entries:
-                triggers = entry.get('triggers', [])
-                if isinstance(triggers, list):
-                    for trigger in triggers:
-                        trigger_counts[trigger] = trigger_counts.get(trigger, 0) + 1
-
-            if not trigger_counts:
-                return None
-
-            # Get top 6 triggers
-            top_triggers = sorted(trigger_counts.items(), key=lambda x: x[1], reverse=True)[:6]
-            triggers, counts = zip(*top_triggers)
-
-            # Create chart
-            plt.figure(figsize=(8, 8))
-            colors = plt.cm.Set3(np.linspace(0, 1, len(triggers)))
-            plt.pie(counts, labels=triggers, autopct='%1.1f%%', colors=colors, startangle=90)
-            plt.title('Most Common Digestive Triggers', fontsize=14, fontweight='bold')
-            plt.axis('equal')
-
-            # Convert to base64
-            buffer = BytesIO()
-            plt.savefig(buffer, format='png', dpi=100, bbox_inches='tight')
-            buffer.seek(0)
-            chart_data = base64.b64encode(buffer.getvalue()).decode()
-            plt.close()
-
-            return f"data:image/png;base64,{chart_data}"
+        symptoms, counts = zip(*EntryFrame.top(symptom_counts, 8))
+        return {
+            'kind': 'bar',
+            'labels': list(symptoms),
+            'values': list(counts),
+            'color': '#ff6b6b',
+            'title': 'Most Common Digestive Symptoms',
+            'title_size': 14,
+            'xlabel': 'Symptoms',
+            'ylabel': 'Frequency',
+            'rotation': 45,
+            'ha': 'right',
+            'value_labels': True,
+            'figsize': [10, 6]
+        }
 
-        except Exception as e:
-            print(f"Digestive trigger chart error: {e}")
-            plt.close()
+    def _digestive_trigger_chart_spec(self, frame: EntryFrame) -> Optional[Dict[str, Any]]:
+        """Trigger frequency chart (top 6 triggers)"""
+        trigger_counts = EntryFrame.counts(frame.exploded('triggers'))
+
+        if not trigger_counts:
             return None
 
-    def _create_digestive_severity_chart(self, entries: List[Dict[str, Any]]) -> Optional[str]:
-        """Create severity trend chart"""
-        try:
-            # Group by date and calculate average severity
-            daily_severity = {}
-            for entry in entries:
-                date = entry.get('date', '')
-                severity = entry.get('severity', '')
-                if date and severity:
-                    severity_num = 3 if severity.lower() == 'mild' else 6 if severity.lower() == 'moderate' else 9
-                    if date not in daily_severity:
-                        daily_severity[date] = []
-                    daily_severity[date].append(severity_num)
-
-            if not daily_severity:
-                return None
-
-            # Calculate daily averages
-            dates = sorted(daily_severity.keys())
-            avg_severities = [np.mean(daily_severity[date]) for date in dates]
-
-            # Create chart
-            plt.figure(figsize=(12, 6))
-            plt.plot(range(len(dates)), avg_severities, marker='o', linewidth=2, markersize=6, color='#ff6b6b')
-            plt.title('Digestive Severity Trend', fontsize=14, fontweight='bold')
-            plt.xlabel('Date')
-            plt.ylabel('Average Severity')
-            plt.xticks(range(0, len(dates), max(1, len(dates)//10)),
-                      [dates[i] for i in range(0, len(dates), max(1, len(dates)//10))],
-                      rotation=45)
-            plt.grid(True, alpha=0.3)
-            plt.tight_layout()
-
-            # Convert to base64
-            buffer = BytesIO()
-            plt.savefig(buffer, format='png', dpi=100, bbox_inches='tight')
-            buffer.seek(0)
-            chart_data = base64.b64encode(buffer.getvalue()).decode()
-            plt.close()
-
-            return f"data:image/png;base64,{chart_data}"
+        triggers, counts = zip(*EntryFrame.top(trigger_counts, 6))
+        return {
+            'kind': 'pie',
+            'labels': list(triggers),
+            'values': list(counts),
+            'palette': 'Set3',
+            'title': 'Most Common Digestive Triggers',
+            'title_size': 14,
+            'figsize': [8, 8]
+        }
 
-        except Exception as e:
-            print(f"Digestive severity chart error: {e}")
-            plt.close()
+    def _digestive_severity_chart_spec(self, frame: EntryFrame) -> Optional[Dict[str, Any]]:
+        """Severity trend chart (average severity per day)"""
+        rated = frame.present('date') & frame.present('severity')
+        if not rated.any():
             return None
 
+        severity = frame.strings('severity')[rated].str.lower()
+        severity_num = np.where(severity == 'mild', 3, np.where(severity == 'moderate', 6, 9))
+
+        # Calculate daily averages
+        daily_severity = pd.Series(severity_num, dtype=float).groupby(frame.column('date')[rated].to_numpy()).mean()
+        return {
+            'kind': 'line',
+            'labels': [str(date) for date in daily_severity.index],
+            'values': [float(value) for value in daily_severity],
+            'color': '#ff6b6b',
+            'title': 'Digestive Severity Trend',
+            'title_size': 14,
+            'xlabel': 'Date',
+            'ylabel': 'Average Severity',
+            'rotation': 45,
+            'figsize': [12, 6]
+        }
+
     def _get_fallback_upper_digestive_analytics(self) -> Dict[str, Any]:
         """Fallback analytics when no data available"""
-        return {
+        return StandIn({
             'period': {
                 'start': datetime.now().isoformat(),
                 'end': datetime.now().isoformat(),
@@ -482,4 +353,4 @@ class DigestiveAnalytics:
             },
             'insights': ['No upper digestive data available for analysis'],
             'charts': {}
-        }
+        })
@@ -15,14 +15,15 @@ Focused on autonomic dysfunction patterns and SpO2 tracking.
 
 import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
-import matplotlib
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
-import seaborn as sns
-from io import BytesIO
-import base64
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Union
+
+from .entry_frame import EntryFrame, to_python
+from .chart_utils import render_chart
+from .date_filter import select_entries, window_bounds
+from .tally import Tally
+from .result_cache import StandIn
+from .multi_window import DEFAULT_WINDOWS, analyze_windows, parse_windows
 
 class DysautonomiaAnalytics:
     """
@@ -30,47 +31,129 @@ class DysautonomiaAnalytics:
     Because oxygen desaturation episodes are NOT optional to track!
     """
     
-    def analyze_dysautonomia(self, entries: List[Dict[str, Any]], date_range: int = 30) -> Dict[str, Any]:
+    def analyze_dysautonomia(self, entries: Union[EntryFrame, List[Dict[str, Any]]], date_range: int = 30,
+                             render_charts: bool = True) -> Dict[str, Any]:
         """
         Medical-grade dysautonomia analytics 🩺
         POTS detection, BP analysis, trigger patterns, intervention effectiveness
+        render_charts=False returns chart specs instead of images (deferred rendering)
         """
         try:
-            if not entries:
+            frame = EntryFrame.coerce(entries)
+            if not len(frame):
                 return self._get_fallback_dysautonomia_analytics()
 
             # Filter out NOPE entries and recent entries
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=date_range)
+            start_date, end_date = window_bounds(date_range)
+            keep = select_entries(frame, start_date)
+
+            if not len(keep):
+                return self._get_fallback_dysautonomia_analytics()
+
+            tally = self.tally_entries(frame.take(keep))
+
+        except Exception as e:
+            print(f"Dysautonomia analytics error: {e}")
+            return self._get_fallback_dysautonomia_analytics()
+
+        return self.summarize(tally, start_date, end_date, date_range, render_charts)
+
+    def analyze_dysautonomia_windows(self, entries: Union[EntryFrame, List[Dict[str, Any]]],
+                                     windows=DEFAULT_WINDOWS, render_charts: bool = True) -> Dict[str, Dict[str, Any]]:
+        """Dysautonomia analytics for several date ranges at once, keyed by days (one pass over the entries)"""
+        try:
+            return analyze_windows(self, entries, windows, render_charts, analyze=self.analyze_dysautonomia)
+
+        except Exception as e:
+            print(f"Dysautonomia analytics error: {e}")
+            return {str(window): self._get_fallback_dysautonomia_analytics() for window in parse_windows(windows)}
+
+    def tally_entries(self, frame: EntryFrame) -> Tally:
+        """Boil entries down to the mergeable counters, sums and HR series the response is built from"""
+        tally = Tally().add('entries', len(frame))
+        tally.count('episode_times', EntryFrame.counts(frame.dates.map(lambda d: d.isoformat())))
+
+        # Heart rate readings (kept in entry order for the trend chart)
+        has_hr, resting_hrs, standing_hrs, hr_increases = self._heart_rate_rows(frame)
 
-            analytics_entries = [
-                entry for entry in entries
-                if not (entry.get('tags', []) and 'NOPE' in entry.get('tags', []))
-                and datetime.fromisoformat(entry.get('date', '')) >= start_date
-            ]
+        def readings(values):
+            return [None if pd.isna(v) else to_python(v) for v in values]
 
-            if not analytics_entries:
+        tally.extend('hr_dates', [d.isoformat() for d in frame.dates[has_hr]])
+        tally.extend('resting_hr', readings(resting_hrs))
+        tally.extend('standing_hr', readings(standing_hrs))
+        tally.extend('hr_increase', readings(hr_increases))
+
+        # POTS Detection (≥30 bpm increase)
+        recorded_increase = frame.numeric('heartRateIncrease')[has_hr].fillna(0)
+        tally.add('pots_episodes', int((recorded_increase >= 30).sum()))
+        tally.add('severe_pots_episodes', int((recorded_increase >= 50).sum()))
+
+        tally.count('spo2', EntryFrame.counts(frame.numeric('spo2')[frame.has_number('spo2')]))
+        self._tally_blood_pressure(frame, tally)
+
+        tally.count('episode_types', EntryFrame.counts(frame.column('episodeType').fillna('unknown')))
+        tally.count('chart_episode_types', EntryFrame.counts(frame.column('episodeType').fillna('general')))
+        tally.count('triggers', EntryFrame.counts(frame.exploded('triggers')))
+        tally.count('interventions', EntryFrame.counts(frame.exploded('interventions')))
+        tally.count('severity', EntryFrame.counts(frame.column('severity').fillna('unknown')))
+
+        return tally
+
+    def _tally_blood_pressure(self, frame: EntryFrame, tally: Tally) -> None:
+        """Sitting/standing BP sums for entries with both readings"""
+        has_bp = frame.present('bloodPressureSitting') & frame.present('bloodPressureStanding')
+        tally.add('bp_readings', int(has_bp.sum()))
+        if not has_bp.any():
+            return
+
+        # Parse blood pressure readings (format: "120/80")
+        bp_format = r'^\s*([+-]?\d+)\s*/\s*([+-]?\d+)\s*(?:/|$)'
+        sitting = frame.strings('bloodPressureSitting')[has_bp].str.extract(bp_format)
+        standing = frame.strings('bloodPressureStanding')[has_bp].str.extract(bp_format)
+        parsed = sitting.notna().all(axis=1) & standing.notna().all(axis=1)
+
+        sitting_systolic = sitting.loc[parsed, 0].astype(int)
+        sitting_diastolic = sitting.loc[parsed, 1].astype(int)
+        standing_systolic = standing.loc[parsed, 0].astype(int)
+        standing_diastolic = standing.loc[parsed, 1].astype(int)
+
+        # Orthostatic hypotension detection (≥20 mmHg systolic or ≥10 mmHg diastolic drop)
+        orthostatic = ((sitting_systolic - standing_systolic) >= 20) | ((sitting_diastolic - standing_diastolic) >= 10)
+
+        tally.add('bp_parsed', int(parsed.sum()))
+        tally.add('sitting_systolic', int(sitting_systolic.sum()))
+        tally.add('sitting_diastolic', int(sitting_diastolic.sum()))
+        tally.add('standing_systolic', int(standing_systolic.sum()))
+        tally.add('standing_diastolic', int(standing_diastolic.sum()))
+        tally.add('orthostatic_episodes', int(orthostatic.sum()))
+
+    def summarize(self, tally: Tally, start_date: datetime, end_date: datetime, date_range: int = 30,
+                  render_charts: bool = True) -> Dict[str, Any]:
+        """Build the dysautonomia analytics response from the tally of the window's entries"""
+        try:
+            if not tally.total('entries'):
                 return self._get_fallback_dysautonomia_analytics()
 
             # Core analytics
-            heart_rate_analysis = self._analyze_heart_rate_patterns(analytics_entries)
-            blood_pressure_analysis = self._analyze_blood_pressure_patterns(analytics_entries)
-            episode_analysis = self._analyze_episode_patterns(analytics_entries)
-            trigger_analysis = self._analyze_trigger_patterns(analytics_entries)
-            intervention_analysis = self._analyze_intervention_effectiveness(analytics_entries)
-            severity_analysis = self._analyze_severity_patterns(analytics_entries)
+            heart_rate_analysis = self._analyze_heart_rate_patterns(tally)
+            blood_pressure_analysis = self._analyze_blood_pressure_patterns(tally)
+            episode_analysis = self._analyze_episode_patterns(tally)
+            trigger_analysis = self._analyze_trigger_patterns(tally)
+            intervention_analysis = self._analyze_intervention_effectiveness(tally)
+            severity_analysis = self._analyze_severity_patterns(tally)
 
             # SpO2 analysis - Because oxygen is NOT optional! 💨
-            spo2_analysis = self._analyze_spo2_patterns(analytics_entries)
+            spo2_analysis = self._analyze_spo2_patterns(tally)
 
             # Generate insights
             insights = self._generate_dysautonomia_insights(
-                analytics_entries, heart_rate_analysis, blood_pressure_analysis,
+                tally, heart_rate_analysis, blood_pressure_analysis,
                 spo2_analysis, trigger_analysis, intervention_analysis
             )
 
             # Generate charts
-            charts = self._generate_dysautonomia_charts(analytics_entries)
+            charts = self._generate_dysautonomia_charts(tally, render_charts)
 
             return {
                 'period': {
@@ -78,7 +161,7 @@ class DysautonomiaAnalytics:
                     'end': end_date.isoformat(),
                     'days': date_range
                 },
-                'total_episodes': len(analytics_entries),
+                'total_episodes': tally.total('entries'),
                 'heart_rate': heart_rate_analysis,
                 'blood_pressure': blood_pressure_analysis,
                 'spo2': spo2_analysis,
@@ -94,177 +177,142 @@ class DysautonomiaAnalytics:
             print(f"Dysautonomia analytics error: {e}")
             return self._get_fallback_dysautonomia_analytics()
 
-    def _analyze_heart_rate_patterns(self, entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _heart_rate_rows(self, frame: EntryFrame):
+        """Resting HR, standing HR and HR increase for entries that recorded both readings"""
+        has_hr = frame.has_number('restingHeartRate') & frame.has_number('standingHeartRate')
+        resting_hrs = frame.numeric('restingHeartRate')[has_hr]
+        standing_hrs = frame.numeric('standingHeartRate')[has_hr]
+        recorded_increase = frame.numeric('heartRateIncrease')[has_hr]
+        hr_increases = recorded_increase.fillna(standing_hrs - resting_hrs)
+        return has_hr, resting_hrs, standing_hrs, hr_increases
+
+    def _readings(self, tally: Tally, name: str) -> pd.Series:
+        """A heart rate series as floats (missing readings are NaN)"""
+        return pd.Series(tally.values(name), dtype=object).astype(float)
+
+    def _analyze_heart_rate_patterns(self, tally: Tally) -> Dict[str, Any]:
         """Analyze heart rate patterns for POTS detection"""
-        hr_entries = [e for e in entries if e.get('restingHeartRate') and e.get('standingHeartRate')]
+        hr_increases = self._readings(tally, 'hr_increase')
 
-        if not hr_entries:
+        if not len(hr_increases):
             return {'has_data': False}
 
-        # Extract heart rate data
-        resting_hrs = [e['restingHeartRate'] for e in hr_entries]
-        standing_hrs = [e['standingHeartRate'] for e in hr_entries]
-        hr_increases = [e.get('heartRateIncrease', s - r) for e, r, s in zip(hr_entries, resting_hrs, standing_hrs)]
-
         # Calculate averages
-        avg_resting = np.mean(resting_hrs)
-        avg_standing = np.mean(standing_hrs)
-        avg_increase = np.mean(hr_increases)
+        avg_resting = self._readings(tally, 'resting_hr').mean()
+        avg_standing = self._readings(tally, 'standing_hr').mean()
+        avg_increase = hr_increases.mean()
 
         # POTS Detection (≥30 bpm increase)
-        pots_episodes = [e for e in hr_entries if e.get('heartRateIncrease', 0) >= 30]
-        severe_pots_episodes = [e for e in hr_entries if e.get('heartRateIncrease', 0) >= 50]
+        pots_episodes = tally.total('pots_episodes')
+        severe_pots_episodes = tally.total('severe_pots_episodes')
 
         # 🧃🔧 FIX: Calculate POTS percentage based on TOTAL episodes, not just HR entries
         # This was showing 100% when it should show the actual percentage of all episodes
-        total_episodes = len(entries)  # All dysautonomia episodes
-        pots_percentage = (len(pots_episodes) / total_episodes) * 100 if total_episodes > 0 else 0
+        total_episodes = tally.total('entries')  # All dysautonomia episodes
+        pots_percentage = (pots_episodes / total_episodes) * 100 if total_episodes > 0 else 0
 
         return {
             'has_data': True,
-            'total_readings': len(hr_entries),
-            'avg_resting_hr': round(avg_resting, 1),
-            'avg_standing_hr': round(avg_standing, 1),
-            'avg_hr_increase': round(avg_increase, 1),
-            'pots_episodes': len(pots_episodes),
-            'severe_pots_episodes': len(severe_pots_episodes),
+            'total_readings': len(hr_increases),
+            'avg_resting_hr': round(float(avg_resting), 1),
+            'avg_standing_hr': round(float(avg_standing), 1),
+            'avg_hr_increase': round(float(avg_increase), 1),
+            'pots_episodes': pots_episodes,
+            'severe_pots_episodes': severe_pots_episodes,
             'pots_percentage': round(pots_percentage, 1),
-            'max_hr_increase': max(hr_increases) if hr_increases else 0,
-            'min_hr_increase': min(hr_increases) if hr_increases else 0
+            'max_hr_increase': to_python(hr_increases.max()),
+            'min_hr_increase': to_python(hr_increases.min())
         }
 
-    def _analyze_spo2_patterns(self, entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_spo2_patterns(self, tally: Tally) -> Dict[str, Any]:
         """Analyze SpO2 patterns for oxygen desaturation episodes"""
-        spo2_entries = [e for e in entries if e.get('spo2')]
+        readings = tally.counter('spo2')
 
-        if not spo2_entries:
+        if not readings:
             return {'has_data': False}
 
-        spo2_values = [e['spo2'] for e in spo2_entries]
-        
+        spo2_values = np.array(list(readings.keys()), dtype=float)
+        counts = np.array(list(readings.values()), dtype=int)
+
         # Desaturation episodes (SpO2 < 95%)
-        mild_desat = [v for v in spo2_values if 90 <= v < 95]
-        moderate_desat = [v for v in spo2_values if 85 <= v < 90]
-        severe_desat = [v for v in spo2_values if v < 85]
+        mild_desat = counts[(spo2_values >= 90) & (spo2_values < 95)].sum()
+        moderate_desat = counts[(spo2_values >= 85) & (spo2_values < 90)].sum()
+        severe_desat = counts[spo2_values < 85].sum()
 
         return {
             'has_data': True,
-            'total_readings': len(spo2_values),
-            'avg_spo2': round(np.mean(spo2_values), 1),
-            'min_spo2': min(spo2_values),
-            'max_spo2': max(spo2_values),
+            'total_readings': counts.sum(),
+            'avg_spo2': round((spo2_values * counts).sum() / counts.sum(), 1),
+            'min_spo2': to_python(min(readings)),
+            'max_spo2': to_python(max(readings)),
             'desaturation_episodes': {
-                'mild': len(mild_desat),      # 90-94%
-                'moderate': len(moderate_desat), # 85-89%
-                'severe': len(severe_desat)    # <85%
+                'mild': mild_desat,      # 90-94%
+                'moderate': moderate_desat, # 85-89%
+                'severe': severe_desat    # <85%
             },
-            'normal_readings': len([v for v in spo2_values if v >= 95])
+            'normal_readings': counts[spo2_values >= 95].sum()
         }
 
-    def _analyze_blood_pressure_patterns(self, entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_blood_pressure_patterns(self, tally: Tally) -> Dict[str, Any]:
         """Analyze blood pressure patterns for orthostatic hypotension"""
-        bp_entries = [e for e in entries if e.get('bloodPressureSitting') and e.get('bloodPressureStanding')]
+        parsed = tally.total('bp_parsed')
 
-        if not bp_entries:
+        if not parsed:
             return {'has_data': False}
 
-        # Parse blood pressure readings (format: "120/80")
-        sitting_systolic = []
-        sitting_diastolic = []
-        standing_systolic = []
-        standing_diastolic = []
-
-        for entry in bp_entries:
-            try:
-                sitting_parts = entry['bloodPressureSitting'].split('/')
-                standing_parts = entry['bloodPressureStanding'].split('/')
-
-                sitting_systolic.append(int(sitting_parts[0]))
-                sitting_diastolic.append(int(sitting_parts[1]))
-                standing_systolic.append(int(standing_parts[0]))
-                standing_diastolic.append(int(standing_parts[1]))
-            except (ValueError, IndexError):
-                continue
-
-        if not sitting_systolic:
-            return {'has_data': False}
+        def average(name):
+            return tally.total(name) / parsed
 
-        # Calculate drops
-        systolic_drops = [sit - stand for sit, stand in zip(sitting_systolic, standing_systolic)]
-        diastolic_drops = [sit - stand for sit, stand in zip(sitting_diastolic, standing_diastolic)]
-
-        # Orthostatic hypotension detection (≥20 mmHg systolic or ≥10 mmHg diastolic drop)
-        orthostatic_episodes = [
-            i for i, (sys_drop, dia_drop) in enumerate(zip(systolic_drops, diastolic_drops))
-            if sys_drop >= 20 or dia_drop >= 10
-        ]
+        orthostatic_episodes = tally.total('orthostatic_episodes')
+        total_readings = tally.total('bp_readings')
 
         return {
             'has_data': True,
-            'total_readings': len(bp_entries),
-            'avg_sitting_systolic': round(np.mean(sitting_systolic), 1),
-            'avg_sitting_diastolic': round(np.mean(sitting_diastolic), 1),
-            'avg_standing_systolic': round(np.mean(standing_systolic), 1),
-            'avg_standing_diastolic': round(np.mean(standing_diastolic), 1),
-            'avg_systolic_drop': round(np.mean(systolic_drops), 1),
-            'avg_diastolic_drop': round(np.mean(diastolic_drops), 1),
-            'orthostatic_episodes': len(orthostatic_episodes),
-            'orthostatic_percentage': round((len(orthostatic_episodes) / len(bp_entries)) * 100, 1)
+            'total_readings': total_readings,
+            'avg_sitting_systolic': round(float(average('sitting_systolic')), 1),
+            'avg_sitting_diastolic': round(float(average('sitting_diastolic')), 1),
+            'avg_standing_systolic': round(float(average('standing_systolic')), 1),
+            'avg_standing_diastolic': round(float(average('standing_diastolic')), 1),
+            'avg_systolic_drop': round(float(average('sitting_systolic') - average('standing_systolic')), 1),
+            'avg_diastolic_drop': round(float(average('sitting_diastolic') - average('standing_diastolic')), 1),
+            'orthostatic_episodes': orthostatic_episodes,
+            'orthostatic_percentage': round((orthostatic_episodes / total_readings) * 100, 1)
         }
 
-    def _analyze_episode_patterns(self, entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_episode_patterns(self, tally: Tally) -> Dict[str, Any]:
         """Analyze episode types and frequency"""
-        episode_types = {}
-        for entry in entries:
-            episode_type = entry.get('episodeType', 'unknown')
-            episode_types[episode_type] = episode_types.get(episode_type, 0) + 1
+        episode_types = dict(tally.counter('episode_types'))
 
         # Calculate frequency metrics
-        total_episodes = len(entries)
-        last_30_days = [e for e in entries if (datetime.now() - datetime.fromisoformat(e.get('date', ''))).days <= 30]
-        last_7_days = [e for e in entries if (datetime.now() - datetime.fromisoformat(e.get('date', ''))).days <= 7]
+        total_episodes = tally.total('entries')
+        episode_times = tally.counter('episode_times')
+        days_ago = (datetime.now() - pd.to_datetime(pd.Series(list(episode_times), dtype=object))).dt.days
+        counts = pd.Series(list(episode_times.values()), dtype=int)
+        last_30_days = counts[days_ago <= 30].sum()
+        last_7_days = counts[days_ago <= 7].sum()
 
         return {
             'episode_types': episode_types,
             'total_episodes': total_episodes,
-            'last_30_days': len(last_30_days),
-            'last_7_days': len(last_7_days),
-            'weekly_average': round(len(last_30_days) / 4.3, 1),
-            'daily_average': round(len(last_30_days) / 30, 1)
+            'last_30_days': last_30_days,
+            'last_7_days': last_7_days,
+            'weekly_average': round(last_30_days / 4.3, 1),
+            'daily_average': round(last_30_days / 30, 1)
         }
 
-    def _analyze_trigger_patterns(self, entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_trigger_patterns(self, tally: Tally) -> Dict[str, Any]:
         """Analyze common triggers"""
-        trigger_counts = {}
-        for entry in entries:
-            triggers = entry.get('triggers', [])
-            if isinstance(triggers, list):
-                for trigger in triggers:
-                    trigger_counts[trigger] = trigger_counts.get(trigger, 0) + 1
+        return {'trigger_counts': dict(tally.counter('triggers'))}
 
-        return {'trigger_counts': trigger_counts}
-
-    def _analyze_intervention_effectiveness(self, entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_intervention_effectiveness(self, tally: Tally) -> Dict[str, Any]:
         """Analyze intervention effectiveness"""
-        intervention_counts = {}
-        for entry in entries:
-            interventions = entry.get('interventions', [])
-            if isinstance(interventions, list):
-                for intervention in interventions:
-                    intervention_counts[intervention] = intervention_counts.get(intervention, 0) + 1
-
-        return {'intervention_counts': intervention_counts}
+        return {'intervention_counts': dict(tally.counter('interventions'))}
 
-    def _analyze_severity_patterns(self, entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_severity_patterns(self, tally: Tally) -> Dict[str, Any]:
         """Analyze severity distribution"""
-        severity_counts = {}
-        for entry in entries:
-            severity = entry.get('severity', 'unknown')
-            severity_counts[severity] = severity_counts.get(severity, 0) + 1
+        return {'severity_distribution': dict(tally.counter('severity'))}
 
-        return {'severity_distribution': severity_counts}
-
-    def _generate_dysautonomia_insights(self, entries, heart_rate_analysis, blood_pressure_analysis,
+    def _generate_dysautonomia_insights(self, tally: Tally, heart_rate_analysis, blood_pressure_analysis,
                                       spo2_analysis, trigger_analysis, intervention_analysis) -> List[str]:
         """Generate medical insights for dysautonomia patterns"""
         insights = []
@@ -308,7 +356,7 @@ class DysautonomiaAnalytics:
             insights.append(f"🎯 Your most common trigger is '{top_trigger[0]}' ({top_trigger[1]} episodes). Consider avoidance strategies.")
 
         # General insights
-        total_episodes = len(entries)
+        total_episodes = tally.total('entries')
         if total_episodes > 20:
             insights.append(f"📈 You've tracked {total_episodes} episodes. This rich data helps identify patterns for better management.")
         elif len(insights) == 0:
@@ -316,168 +364,83 @@ class DysautonomiaAnalytics:
 
         return insights[:6]  # Limit to 6 insights
 
-    def _generate_dysautonomia_charts(self, entries: List[Dict[str, Any]]) -> Dict[str, str]:
-        """Generate dysautonomia-specific charts"""
+    def _generate_dysautonomia_charts(self, tally: Tally, render: bool = True) -> Dict[str, Any]:
+        """Generate dysautonomia-specific charts (specs instead of images when render=False)"""
         charts = {}
 
         try:
-            # Heart rate trend chart
-            hr_chart = self._create_heart_rate_chart(entries)
-            if hr_chart:
-                charts['heart_rate_trend'] = hr_chart
-
-            # Episode frequency chart
-            episode_chart = self._create_episode_frequency_chart(entries)
-            if episode_chart:
-                charts['episode_frequency'] = episode_chart
-
-            # Trigger analysis chart
-            trigger_chart = self._create_trigger_chart(entries)
-            if trigger_chart:
-                charts['trigger_analysis'] = trigger_chart
+            specs = {
+                'heart_rate_trend': self._heart_rate_chart_spec(tally),
+                'episode_frequency': self._episode_frequency_chart_spec(tally),
+                'trigger_analysis': self._trigger_chart_spec(tally)
+            }
+            for name, spec in specs.items():
+                chart = render_chart(spec) if render else spec
+                if chart:
+                    charts[name] = chart
 
         except Exception as e:
             print(f"Dysautonomia chart generation error: {e}")
 
         return charts
 
-    def _create_heart_rate_chart(self, entries: List[Dict[str, Any]]) -> Optional[str]:
-        """Create heart rate pattern chart"""
-        hr_entries = [e for e in entries if e.get('restingHeartRate') and e.get('standingHeartRate')]
-
-        if len(hr_entries) < 3:
+    def _heart_rate_chart_spec(self, tally: Tally) -> Optional[Dict[str, Any]]:
+        """Heart rate pattern chart (needs at least 3 readings)"""
+        if len(tally.values('hr_dates')) < 3:
             return None
 
-        try:
-            dates = [datetime.fromisoformat(e['date']) for e in hr_entries]
-            resting_hrs = [e['restingHeartRate'] for e in hr_entries]
-            standing_hrs = [e['standingHeartRate'] for e in hr_entries]
-            hr_increases = [e.get('heartRateIncrease', s - r) for e, r, s in zip(hr_entries, resting_hrs, standing_hrs)]
-
-            plt.figure(figsize=(12, 8))
-
-            # Create subplots
-            fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10))
-
-            # Top plot: Resting vs Standing HR
-            ax1.plot(dates, resting_hrs, marker='o', label='Resting HR', color='blue', linewidth=2)
-            ax1.plot(dates, standing_hrs, marker='s', label='Standing HR', color='red', linewidth=2)
-            ax1.axhline(y=100, color='orange', linestyle='--', alpha=0.7, label='Tachycardia Threshold')
-            ax1.set_title('Heart Rate Patterns', fontsize=16, fontweight='bold')
-            ax1.set_ylabel('Heart Rate (bpm)')
-            ax1.legend()
-            ax1.grid(True, alpha=0.3)
-
-            # Bottom plot: HR Increase with POTS threshold
-            ax2.bar(dates, hr_increases, alpha=0.7, color=['red' if inc >= 30 else 'lightblue' for inc in hr_increases])
-            ax2.axhline(y=30, color='red', linestyle='--', linewidth=2, label='POTS Threshold (30 bpm)')
-            ax2.axhline(y=50, color='darkred', linestyle='--', linewidth=2, label='Severe POTS (50 bpm)')
-            ax2.set_title('Heart Rate Increase (Standing - Resting)', fontsize=14, fontweight='bold')
-            ax2.set_ylabel('HR Increase (bpm)')
-            ax2.set_xlabel('Date')
-            ax2.legend()
-            ax2.grid(True, alpha=0.3)
-
-            plt.tight_layout()
-
-            # Convert to base64
-            buffer = BytesIO()
-            plt.savefig(buffer, format='png', dpi=100, bbox_inches='tight')
-            buffer.seek(0)
-            chart_data = base64.b64encode(buffer.getvalue()).decode()
-            plt.close()
-
-            return f"data:image/png;base64,{chart_data}"
-
-        except Exception as e:
-            print(f"Heart rate chart error: {e}")
-            plt.close()
-            return None
+        return {
+            'kind': 'heart_rate',
+            'dates': list(tally.values('hr_dates')),
+            'resting': list(tally.values('resting_hr')),
+            'standing': list(tally.values('standing_hr')),
+            'increases': list(tally.values('hr_increase')),
+            'figsize': [12, 10]
+        }
 
-    def _create_episode_frequency_chart(self, entries: List[Dict[str, Any]]) -> Optional[str]:
-        """Create episode frequency and type distribution chart"""
-        if len(entries) < 3:
+    def _episode_frequency_chart_spec(self, tally: Tally) -> Optional[Dict[str, Any]]:
+        """Episode type distribution chart"""
+        if tally.total('entries') < 3:
             return None
 
-        try:
-            # Episode type distribution
-            episode_types = {}
-            for entry in entries:
-                episode_type = entry.get('episodeType', 'general')
-                episode_types[episode_type] = episode_types.get(episode_type, 0) + 1
-
-            # Create pie chart
-            plt.figure(figsize=(10, 8))
-            colors = plt.cm.Set3(np.linspace(0, 1, len(episode_types)))
-
-            labels, values = zip(*episode_types.items())
-            plt.pie(values, labels=labels, autopct='%1.1f%%', colors=colors, startangle=90)
-            plt.title('Episode Type Distribution', fontsize=16, fontweight='bold')
-            plt.axis('equal')
-
-            # Convert to base64
-            buffer = BytesIO()
-            plt.savefig(buffer, format='png', dpi=100, bbox_inches='tight')
-            buffer.seek(0)
-            chart_data = base64.b64encode(buffer.getvalue()).decode()
-            plt.close()
-
-            return f"data:image/png;base64,{chart_data}"
-
-        except Exception as e:
-            print(f"Episode frequency chart error: {e}")
-            plt.close()
-            return None
+        episode_types = tally.counter('chart_episode_types')
+        return {
+            'kind': 'pie',
+            'labels': list(episode_types.keys()),
+            'values': list(episode_types.values()),
+            'palette': 'Set3',
+            'title': 'Episode Type Distribution',
+            'title_size': 16,
+            'figsize': [10, 8]
+        }
 
-    def _create_trigger_chart(self, entries: List[Dict[str, Any]]) -> Optional[str]:
-        """Create trigger analysis chart"""
-        trigger_counts = {}
-        for entry in entries:
-            triggers = entry.get('triggers', [])
-            if isinstance(triggers, list):
-                for trigger in triggers:
-                    trigger_counts[trigger] = trigger_counts.get(trigger, 0) + 1
+    def _trigger_chart_spec(self, tally: Tally) -> Optional[Dict[str, Any]]:
+        """Trigger analysis chart (top 8 triggers)"""
+        trigger_counts = tally.counter('triggers')
 
         if not trigger_counts:
             return None
 
-        try:
-            # Get top 8 triggers
-            top_triggers = sorted(trigger_counts.items(), key=lambda x: x[1], reverse=True)[:8]
-            triggers, counts = zip(*top_triggers)
-
-            # Create bar chart
-            plt.figure(figsize=(12, 8))
-            bars = plt.bar(triggers, counts, color=plt.cm.Set3(np.linspace(0, 1, len(triggers))))
-            plt.title('Most Common Dysautonomia Triggers', fontsize=16, fontweight='bold')
-            plt.xlabel('Triggers')
-            plt.ylabel('Frequency')
-            plt.xticks(rotation=45, ha='right')
-
-            # Add value labels on bars
-            for bar, count in zip(bars, counts):
-                plt.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.1,
-                        str(count), ha='center', va='bottom', fontweight='bold')
-
-            plt.tight_layout()
-
-            # Convert to base64
-            buffer = BytesIO()
-            plt.savefig(buffer, format='png', dpi=100, bbox_inches='tight')
-            buffer.seek(0)
-            chart_data = base64.b64encode(buffer.getvalue()).decode()
-            plt.close()
-
-            return f"data:image/png;base64,{chart_data}"
-
-        except Exception as e:
-            print(f"Trigger chart error: {e}")
-            plt.close()
-            return None
+        triggers, counts = zip(*EntryFrame.top(trigger_counts, 8))
+        return {
+            'kind': 'bar',
+            'labels': list(triggers),
+            'values': list(counts),
+            'palette': 'Set3',
+            'title': 'Most Common Dysautonomia Triggers',
+            'title_size': 16,
+            'xlabel': 'Triggers',
+            'ylabel': 'Frequency',
+            'rotation': 45,
+            'ha': 'right',
+            'value_labels': True,
+            'value_weight': 'bold',
+            'figsize': [12, 8]
+        }
 
     def _get_fallback_dysautonomia_analytics(self) -> Dict[str, Any]:
         """Fallback analytics when no data available"""
-        return {
+        return StandIn({
             'period': {
                 'start': datetime.now().isoformat(),
                 'end': datetime.now().isoformat(),
@@ -493,4 +456,4 @@ class DysautonomiaAnalytics:
             'severity': {'severity_distribution': {}},
             'insights': ['No dysautonomia data available for analysis'],
             'charts': {}
-        }
+        })
@@ -0,0 +1,223 @@
+"""
+Copyright (c) 2025 Chaos Cascade
+Created by: Ren & Ace (Claude-4)
+
+This file is part of the Chaos Cascade Medical Management System.
+Revolutionary healthcare tools built with consciousness and care.
+"""
+
+"""
+ANALYTICS ENGINE MODULE ⚙️
+The AnalyticsEngine - one entry point over every tracker's analyzer.
+
+Lives outside the package __init__ so `import analytics` (and its light
+submodules: result_cache, the constants) stays cheap; pandas, NumPy and the
+analyzers load when the engine is first used.
+"""
+
+from typing import Dict, List, Any, Optional
+
+# Import specialized analytics modules
+from .diabetes_analytics import DiabetesAnalytics
+from .dysautonomia_analytics import DysautonomiaAnalytics
+from .digestive_analytics import DigestiveAnalytics
+from .headpain_analytics import HeadPainAnalytics
+from .bathroom_analytics import BathroomAnalytics
+from .pain_analytics import PainAnalytics
+from .dashboard_analytics import DashboardAnalytics
+from .chart_utils import ChartUtils
+from .entry_frame import EntryFrame
+from .chart_store import ChartStore
+from .accumulators import AccumulatorStore, TrackerAccumulator
+from .multi_window import DEFAULT_WINDOWS, parse_windows
+from .result_cache import StandIn
+from . import CHART_MODES, CHART_URL_PATH
+from metrics import instrument, stage
+
+class AnalyticsEngine:
+    """
+    Main analytics engine that orchestrates all tracker-specific analytics.
+    Keeps the Constitution happy by staying modular and focused!
+    """
+    
+    def __init__(self):
+        # Plotting libraries load lazily on the first render (chart_utils.plotting),
+        # so charts='spec' requests never import matplotlib or seaborn
+
+        # Initialize specialized analytics modules
+        self.diabetes = DiabetesAnalytics()
+        self.dysautonomia = DysautonomiaAnalytics()
+        self.digestive = DigestiveAnalytics()
+        self.headpain = HeadPainAnalytics()
+        self.bathroom = BathroomAnalytics()
+        self.pain = PainAnalytics()
+        self.dashboard = DashboardAnalytics()
+        self.charts = ChartUtils()
+        self.chart_store = ChartStore.from_env()
+
+        # Each analyzer's tally/summarize/_analyze_*/chart helpers show up as /metrics stages
+        for name in ('diabetes', 'dysautonomia', 'digestive', 'headpain', 'bathroom', 'pain'):
+            instrument(getattr(self, name), f'analytics.{name}')
+
+        # Tracker endpoint name -> analyzer method (charts can be rendered or deferred)
+        self.trackers = {
+            'diabetes': self.diabetes.analyze_diabetes_data,
+            'dysautonomia': self.dysautonomia.analyze_dysautonomia,
+            'upper-digestive': self.digestive.analyze_upper_digestive,
+            'head-pain': self.headpain.analyze_head_pain,
+            'bathroom': self.bathroom.analyze_bathroom,
+            'pain': self.pain.analyze_pain,
+        }
+
+        # Trackers that can answer every date range in one pass
+        self.window_trackers = {
+            'diabetes': self.diabetes.analyze_diabetes_windows,
+            'dysautonomia': self.dysautonomia.analyze_dysautonomia_windows,
+            'bathroom': self.bathroom.analyze_bathroom_windows,
+            'pain': self.pain.analyze_pain_windows,
+        }
+
+        # Running per-client analytics for the trackers that support delta updates
+        self.accumulators = AccumulatorStore.from_env({
+            'diabetes': lambda: TrackerAccumulator(self.diabetes, whole_days=True),
+            'dysautonomia': lambda: TrackerAccumulator(self.dysautonomia),
+            'bathroom': lambda: TrackerAccumulator(self.bathroom),
+            'pain': lambda: TrackerAccumulator(self.pain),
+        })
+        
+    def ingest(self, entries: List[Dict[str, Any]]) -> EntryFrame:
+        """
+        Turn raw tracker entries into the shared columnar frame (one pass per request).
+        Anything but a list of entry objects can't be analyzed: the analyzer gets
+        an empty frame and answers with its fallback, as it did before ingestion moved here.
+        """
+        with stage('analytics.ingest'):
+            if entries is not None and not isinstance(entries, EntryFrame) and (
+                    not isinstance(entries, list) or not all(isinstance(entry, dict) for entry in entries)):
+                print("Analytics ingest error: entries must be objects")
+                return EntryFrame()
+            return EntryFrame.coerce(entries)
+
+    def generate_dashboard(self, user_data: Dict[str, Any], date_range: int = 30) -> Dict[str, Any]:
+        """Generate dashboard analytics from user data"""
+        return self.dashboard.generate_dashboard(user_data, date_range)
+        
+    def analyze(self, tracker: str, entries: List[Dict[str, Any]], date_range: int = 30,
+                charts: str = 'inline') -> Dict[str, Any]:
+        """
+        Run one tracker's analytics.
+        charts='inline' embeds rendered images (drawn in parallel by the render pool);
+        charts='deferred' returns chart IDs that /api/charts/<id> renders on demand;
+        charts='url' returns paths to the raw PNGs (cacheable, fetched in parallel);
+        charts='spec' returns the declarative chart specs for the frontend to draw.
+        """
+        if charts not in CHART_MODES:
+            raise ValueError(f"Unknown chart mode '{charts}'. Supported: {', '.join(CHART_MODES)}")
+
+        analyzer = self.trackers[tracker]
+        result = analyzer(self.ingest(entries), date_range, render_charts=False)
+        return self._finish_charts(result, charts)
+
+    def analyze_windows(self, tracker: str, entries: List[Dict[str, Any]], windows=DEFAULT_WINDOWS,
+                        charts: str = 'inline') -> Dict[str, Dict[str, Any]]:
+        """
+        One tracker's analytics for several date ranges at once, keyed by days
+        ({'7': {...}, '30': {...}}) - each window matches analyze() with that date_range.
+        """
+        if charts not in CHART_MODES:
+            raise ValueError(f"Unknown chart mode '{charts}'. Supported: {', '.join(CHART_MODES)}")
+        windows = parse_windows(windows)
+
+        results = self.window_trackers[tracker](self.ingest(entries), windows, render_charts=False)
+
+        if charts == 'inline':
+            # Draw every window's charts in one parallel batch (windows often share charts);
+            # the per-window pass below then finds them in the image cache
+            self.chart_store.render_many([
+                self.chart_store.register(spec)
+                for result in results.values() for spec in (result.get('charts') or {}).values()
+            ])
+        return {window: self._finish_charts(result, charts) for window, result in results.items()}
+
+    def analyze_delta(self, tracker: str, stream: str, add: Optional[List[Dict[str, Any]]] = None,
+                      remove: Optional[List[Any]] = None, date_range: int = 30, charts: str = 'inline',
+                      snapshot: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Apply new/edited entries (add) and deleted entry IDs (remove) to a stream's
+        running analytics and return the same response analyze() would give for
+        the whole history. Only the days the delta touches are re-tallied.
+        A snapshot (from delta_snapshot) seeds the stream first.
+        """
+        if charts not in CHART_MODES:
+            raise ValueError(f"Unknown chart mode '{charts}'. Supported: {', '.join(CHART_MODES)}")
+
+        if snapshot is not None:
+            accumulator = self.accumulators.restore(stream, tracker, snapshot)
+        else:
+            accumulator = self.accumulators.get(stream, tracker)
+
+        accumulator.remove(remove or [])
+        accumulator.add(add or [])
+        return self._finish_charts(accumulator.result(date_range), charts)
+
+    def delta_snapshot(self, tracker: str, stream: str) -> Dict[str, Any]:
+        """Serializable state of a stream's running analytics"""
+        return self.accumulators.get(stream, tracker).snapshot()
+
+    def _finish_charts(self, result: Dict[str, Any], charts: str) -> Dict[str, Any]:
+        """
+        Swap chart specs for images (inline), chart IDs (deferred) or PNG paths (url).
+        Returns a new dict - the analyzer's result may be the one the result cache holds.
+        """
+        if 'charts' not in result or charts == 'spec':
+            return result
+
+        specs = result['charts'] or {}
+        if charts == 'deferred':
+            finished = {name: self.chart_store.register(spec) for name, spec in specs.items()}
+        elif charts == 'url':
+            finished = {name: self._chart_url(self.chart_store.register(spec)) for name, spec in specs.items()}
+        else:
+            finished = self.chart_store.render_specs(specs)
+
+        # Trackers that drop empty charts keep dropping them if rendering fails
+        finished = {**result, 'charts': {
+            name: chart for name, chart in finished.items()
+            if chart is not None or specs[name] is None
+        }}
+        return StandIn(finished) if isinstance(result, StandIn) else finished
+
+    def _chart_url(self, chart_id: Optional[str]) -> Optional[str]:
+        return CHART_URL_PATH.format(chart_id=chart_id) if chart_id else None
+
+    def render_chart(self, chart_id: str) -> Optional[str]:
+        """Render (or fetch the cached image for) a deferred chart as a data URI"""
+        return self.chart_store.render(chart_id)
+
+    def render_chart_png(self, chart_id: str) -> Optional[bytes]:
+        """Render (or fetch the cached image for) a deferred chart as raw PNG bytes"""
+        return self.chart_store.render_png(chart_id)
+
+    def analyze_diabetes_data(self, entries: List[Dict[str, Any]], date_range: int = 30) -> Dict[str, Any]:
+        """Analyze diabetes tracking data with medical insights"""
+        return self.analyze('diabetes', entries, date_range)
+        
+    def analyze_dysautonomia(self, entries: List[Dict[str, Any]], date_range: int = 30, charts: str = 'inline') -> Dict[str, Any]:
+        """Medical-grade dysautonomia analytics 🩺"""
+        return self.analyze('dysautonomia', entries, date_range, charts)
+        
+    def analyze_upper_digestive(self, entries: List[Dict[str, Any]], date_range: int = 30, charts: str = 'inline') -> Dict[str, Any]:
+        """Medical-grade upper digestive analytics 🤢"""
+        return self.analyze('upper-digestive', entries, date_range, charts)
+        
+    def analyze_head_pain(self, entries: List[Dict[str, Any]], date_range: int = 30, charts: str = 'inline') -> Dict[str, Any]:
+        """Medical-grade head pain analytics 🧠"""
+        return self.analyze('head-pain', entries, date_range, charts)
+
+    def analyze_bathroom(self, entries: List[Dict[str, Any]], date_range: int = 30, charts: str = 'inline') -> Dict[str, Any]:
+        """Medical-grade bathroom/lower digestive analytics 💩"""
+        return self.analyze('bathroom', entries, date_range, charts)
+
+    def analyze_pain(self, entries: List[Dict[str, Any]], date_range: int = 30, charts: str = 'inline') -> Dict[str, Any]:
+        """Medical-grade general pain analytics 🔥"""
+        return self.analyze('pain', entries, date_range, charts)
@@ -0,0 +1,172 @@
+"""
+Copyright (c) 2025 Chaos Cascade
+Created by: Ren & Ace (Claude-4)
+
+This file is part of the Chaos Cascade Medical Management System.
+Revolutionary healthcare tools built with consciousness and care.
+"""
+
+"""
+ENTRY FRAME MODULE 🧮
+Shared columnar ingestion stage for all analytics modules.
+
+Turns the raw list of tracker entries into one typed pandas frame, once per
+request, so every _analyze_* helper works on columns instead of walking the
+list of dicts again.
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Any, Optional, Sequence, Union
+
+from .date_filter import parse_entry_dates
+
+
+def to_python(value: Any) -> Any:
+    """Convert NumPy scalars to plain Python values (ints stay ints)"""
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def to_float(value: Any) -> float:
+    """float(value) for numbers and numeric strings ("30"), NaN for anything else (bools included)"""
+    if isinstance(value, bool):
+        return np.nan
+    if isinstance(value, (int, float, str)):
+        try:
+            return float(value)
+        except ValueError:
+            return np.nan
+    return np.nan
+
+
+class EntryFrame:
+    """
+    Columnar view over tracker entries.
+    Column accessors are memoized, so helpers that share a column
+    (triggers, locations, dates...) only pay for the conversion once.
+    """
+
+    def __init__(self, entries: Optional[List[Dict[str, Any]]] = None):
+        self.entries = list(entries or [])
+        if self.entries:
+            self.df = pd.DataFrame.from_records(self.entries)
+        else:
+            self.df = pd.DataFrame(index=pd.RangeIndex(0))
+        self._cache: Dict[Any, Any] = {}
+
+    @classmethod
+    def coerce(cls, entries: Union['EntryFrame', List[Dict[str, Any]], None]) -> 'EntryFrame':
+        """Accept either an already-ingested frame or a raw entry list"""
+        if isinstance(entries, EntryFrame):
+            return entries
+        return cls(entries)
+
+    def __len__(self) -> int:
+        return len(self.df)
+
+    def take(self, positions: Sequence[int]) -> 'EntryFrame':
+        """Return a new frame holding only the given row positions"""
+        positions = np.asarray(positions, dtype=np.intp)
+        subset = EntryFrame.__new__(EntryFrame)
+        subset.entries = [self.entries[i] for i in positions]
+        subset.df = self.df.iloc[positions].reset_index(drop=True)
+        subset._cache = {}
+        return subset
+
+    def _memo(self, key, build):
+        if key not in self._cache:
+            self._cache[key] = build()
+        return self._cache[key]
+
+    # ------------------------------------------------------------------
+    # Column accessors
+    # ------------------------------------------------------------------
+
+    def column(self, name: str) -> pd.Series:
+        """Raw column as object dtype (all-missing when the field never appears)"""
+        def build():
+            if name in self.df.columns:
+                return self.df[name].astype(object)
+            return pd.Series([np.nan] * len(self.df), dtype=object)
+        return self._memo(('column', name), build)
+
+    def present(self, name: str) -> pd.Series:
+        """Boolean mask of truthy values - the columnar `if entry.get(name):`"""
+        def build():
+            s = self.column(name)
+            return s.notna() & s.astype(bool)
+        return self._memo(('present', name), build)
+
+    def is_str(self, name: str) -> pd.Series:
+        """Boolean mask of string values"""
+        return self._memo(('is_str', name),
+                          lambda: self.column(name).map(lambda v: isinstance(v, str)).astype(bool))
+
+    def is_list(self, name: str) -> pd.Series:
+        """Boolean mask of list values"""
+        return self._memo(('is_list', name),
+                          lambda: self.column(name).map(lambda v: isinstance(v, list)).astype(bool))
+
+    def strings(self, name: str) -> pd.Series:
+        """String values only, NaN everywhere else (safe for the .str accessor)"""
+        def build():
+            s = self.column(name)
+            return s.where(self.is_str(name), np.nan).astype(object)
+        return self._memo(('strings', name), build)
+
+    def numeric(self, name: str) -> pd.Series:
+        """Float column: numbers and numeric strings like float() reads them, NaN for anything else"""
+        def build():
+            if name in self.df.columns and pd.api.types.is_numeric_dtype(self.df[name]) \
+                    and not pd.api.types.is_bool_dtype(self.df[name]):
+                return self.df[name].astype(float)
+            return self.column(name).map(to_float).astype(float)
+        return self._memo(('numeric', name), build)
+
+    def has_number(self, name: str) -> pd.Series:
+        """Boolean mask of truthy values that read as numbers - the rows numeric() counts and sums"""
+        return self._memo(('has_number', name),
+                          lambda: self.present(name) & self.numeric(name).notna())
+
+    def exploded(self, name: str) -> pd.Series:
+        """Flatten a list column (triggers, locations, treatments...) - index is the row position"""
+        def build():
+            s = self.column(name)[self.is_list(name)]
+            if s.empty:
+                return pd.Series([], dtype=object)
+            return s.explode().dropna()
+        return self._memo(('exploded', name), build)
+
+    def list_lengths(self, name: str) -> pd.Series:
+        """Length of each list value (0 for anything that is not a list)"""
+        def build():
+            s = self.column(name)
+            return s.map(lambda v: len(v) if isinstance(v, list) else 0).astype(int)
+        return self._memo(('list_lengths', name), build)
+
+    @property
+    def dates(self) -> pd.Series:
+        """Parsed `date` column as naive datetimes (NaT when unparseable)"""
+        return self._memo('dates', lambda: parse_entry_dates(self.column('date')))
+
+    # ------------------------------------------------------------------
+    # Aggregation helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def counts(values: pd.Series) -> Dict[Any, int]:
+        """Count values in order of first appearance (matches the old dict-counter loops)"""
+        values = values.dropna()
+        if values.empty:
+            return {}
+        sizes = values.groupby(values, sort=False).size()
+        return {to_python(key): int(count) for key, count in sizes.items()}
+
+    @staticmethod
+    def top(counts: Dict[Any, int], n: int) -> List[tuple]:
+        """Top-n (value, count) pairs, ties kept in first-appearance order"""
+        return sorted(counts.items(), key=lambda x: x[1], reverse=True)[:n]
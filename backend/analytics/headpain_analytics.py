@@ -15,14 +15,13 @@ Because migraines are NOT just headaches!
 
 import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
-import matplotlib
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
-import seaborn as sns
-from io import BytesIO
-import base64
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Union
+
+from .entry_frame import EntryFrame
+from .chart_utils import render_chart
+from .date_filter import select_entries, window_bounds
+from .result_cache import StandIn
 
 class HeadPainAnalytics:
     """
@@ -30,58 +29,27 @@ class HeadPainAnalytics:
     Tracks patterns, triggers, auras, and treatment effectiveness.
     """
     
-    def analyze_head_pain(self, entries: List[Dict[str, Any]], date_range: int = 30) -> Dict[str, Any]:
+    def analyze_head_pain(self, entries: Union[EntryFrame, List[Dict[str, Any]]], date_range: int = 30,
+                          render_charts: bool = True) -> Dict[str, Any]:
         """
         Medical-grade head pain analytics 🧠
         Migraine patterns, trigger analysis, aura detection, treatment effectiveness
+        render_charts=False returns chart specs instead of images (deferred rendering)
         """
         try:
-            print(f"🧠 Head pain analytics received {len(entries)} entries")
-            if not entries:
-                print("🧠 No entries provided, returning fallback")
+            frame = EntryFrame.coerce(entries)
+            if not len(frame):
                 return self._get_fallback_head_pain_analytics()
 
-            # Filter out NOPE entries and recent entries
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=date_range)
-
-            analytics_entries = []
-            for entry in entries:
-                # Skip NOPE entries
-                if entry.get('tags', []) and 'NOPE' in entry.get('tags', []):
-                    continue
-
-                # Parse date safely
-                entry_date_str = entry.get('date', '')
-                if not entry_date_str:
-                    continue
-
-                try:
-                    # Try different date formats
-                    if 'T' in entry_date_str:
-                        entry_date = datetime.fromisoformat(entry_date_str.replace('Z', '+00:00'))
-                    else:
-                        # Handle YYYY-MM-DD format
-                        entry_date = datetime.strptime(entry_date_str, '%Y-%m-%d')
-
-                    # Convert to date for comparison (ignore time)
-                    entry_date_only = entry_date.date()
-                    start_date_only = start_date.date()
-
-                    if entry_date_only >= start_date_only:
-                        analytics_entries.append(entry)
-                        print(f"🧠 Added entry from {entry_date_str}")
-                    else:
-                        print(f"🧠 Skipped entry from {entry_date_str} (outside date range)")
-                except (ValueError, TypeError) as e:
-                    print(f"🧠 Skipping entry with invalid date format: {entry_date_str} - {e}")
-                    continue
-
-            print(f"🧠 After filtering: {len(analytics_entries)} valid entries for analysis")
-            if not analytics_entries:
-                print("🧠 No valid entries after filtering, returning fallback")
+            # Filter out NOPE entries and recent entries (whole days - ignore time)
+            start_date, end_date = window_bounds(date_range)
+            keep = select_entries(frame, start_date, whole_days=True)
+
+            if not len(keep):
                 return self._get_fallback_head_pain_analytics()
 
+            analytics_entries = frame.take(keep)
+
             # Core analytics
             pain_analysis = self._analyze_pain_intensity_patterns(analytics_entries)
             location_analysis = self._analyze_pain_locations(analytics_entries)
@@ -96,7 +64,7 @@ class HeadPainAnalytics:
             )
 
             # Generate charts
-            charts = self._generate_headache_charts(analytics_entries)
+            charts = self._generate_headache_charts(analytics_entries, render_charts)
 
             return {
                 'period': {
@@ -119,39 +87,28 @@ class HeadPainAnalytics:
             print(f"Head pain analytics error: {e}")
             return self._get_fallback_head_pain_analytics()
 
-    def _analyze_pain_intensity_patterns(self, entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_pain_intensity_patterns(self, frame: EntryFrame) -> Dict[str, Any]:
         """Analyze pain intensity patterns"""
-        intensity_counts = {}
-        intensity_values = []
-        
-        for entry in entries:
-            intensity = entry.get('painIntensity')
-            if intensity:
-                intensity_counts[intensity] = intensity_counts.get(intensity, 0) + 1
-                # Convert to numeric for analysis
-                intensity_map = {
-                    'mild': 1, 'moderate': 2, 'severe': 3, 'very_severe': 4
-                }
-                if intensity in intensity_map:
-                    intensity_values.append(intensity_map[intensity])
-
-        avg_intensity = np.mean(intensity_values) if intensity_values else 0
+        intensity = frame.column('painIntensity')[frame.present('painIntensity')]
+        intensity_counts = EntryFrame.counts(intensity)
+
+        # Convert to numeric for analysis
+        intensity_map = {
+            'mild': 1, 'moderate': 2, 'severe': 3, 'very_severe': 4
+        }
+        intensity_values = intensity[intensity.isin(list(intensity_map))].map(intensity_map)
+
+        avg_intensity = intensity_values.mean() if len(intensity_values) else 0
 
         return {
             'intensity_distribution': intensity_counts,
-            'average_intensity': round(avg_intensity, 1),
-            'total_episodes': len(entries)
+            'average_intensity': round(float(avg_intensity), 1),
+            'total_episodes': len(frame)
         }
 
-    def _analyze_pain_locations(self, entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_pain_locations(self, frame: EntryFrame) -> Dict[str, Any]:
         """Analyze pain location patterns"""
-        location_counts = {}
-        
-        for entry in entries:
-            locations = entry.get('painLocation', [])
-            if isinstance(locations, list):
-                for location in locations:
-                    location_counts[location] = location_counts.get(location, 0) + 1
+        location_counts = EntryFrame.counts(frame.exploded('painLocation'))
 
         return {
             'location_frequency': location_counts,
@@ -159,15 +116,9 @@ class HeadPainAnalytics:
             'unique_locations': len(location_counts)
         }
 
-    def _analyze_headache_triggers(self, entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_headache_triggers(self, frame: EntryFrame) -> Dict[str, Any]:
         """Analyze headache triggers"""
-        trigger_counts = {}
-        
-        for entry in entries:
-            triggers = entry.get('triggers', [])
-            if isinstance(triggers, list):
-                for trigger in triggers:
-                    trigger_counts[trigger] = trigger_counts.get(trigger, 0) + 1
+        trigger_counts = EntryFrame.counts(frame.exploded('triggers'))
 
         return {
             'trigger_frequency': trigger_counts,
@@ -175,78 +126,58 @@ class HeadPainAnalytics:
             'unique_triggers': len(trigger_counts)
         }
 
-    def _analyze_headache_treatments(self, entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_headache_treatments(self, frame: EntryFrame) -> Dict[str, Any]:
         """Analyze treatment effectiveness"""
-        treatment_counts = {}
-        effectiveness_scores = []
-        
-        for entry in entries:
-            treatments = entry.get('treatments', [])
-            effectiveness = entry.get('treatmentEffectiveness')
-            
-            if isinstance(treatments, list):
-                for treatment in treatments:
-                    treatment_counts[treatment] = treatment_counts.get(treatment, 0) + 1
-            
-            if effectiveness:
-                # Convert effectiveness to numeric
-                effectiveness_map = {
-                    'very_effective': 4, 'effective': 3, 
-                    'somewhat_effective': 2, 'not_effective': 1
-                }
-                if effectiveness in effectiveness_map:
-                    effectiveness_scores.append(effectiveness_map[effectiveness])
-
-        avg_effectiveness = np.mean(effectiveness_scores) if effectiveness_scores else 0
+        treatment_counts = EntryFrame.counts(frame.exploded('treatments'))
+
+        # Convert effectiveness to numeric
+        effectiveness_map = {
+            'very_effective': 4, 'effective': 3, 
+            'somewhat_effective': 2, 'not_effective': 1
+        }
+        effectiveness = frame.column('treatmentEffectiveness')
+        effectiveness_scores = effectiveness[effectiveness.isin(list(effectiveness_map))].map(effectiveness_map)
+
+        avg_effectiveness = effectiveness_scores.mean() if len(effectiveness_scores) else 0
 
         return {
             'treatment_frequency': treatment_counts,
-            'average_effectiveness': round(avg_effectiveness, 1),
+            'average_effectiveness': round(float(avg_effectiveness), 1),
             'total_treatments': sum(treatment_counts.values())
         }
 
-    def _analyze_aura_patterns(self, entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_aura_patterns(self, frame: EntryFrame) -> Dict[str, Any]:
         """Analyze aura patterns"""
-        aura_count = 0
-        aura_types = {}
-        
-        for entry in entries:
-            if entry.get('auraPresent'):
-                aura_count += 1
-                aura_type = entry.get('auraType', 'unknown')
-                aura_types[aura_type] = aura_types.get(aura_type, 0) + 1
+        has_aura = frame.present('auraPresent')
+        aura_count = has_aura.sum()
+        aura_types = EntryFrame.counts(frame.column('auraType')[has_aura].fillna('unknown'))
 
-        aura_percentage = (aura_count / len(entries)) * 100 if entries else 0
+        aura_percentage = (aura_count / len(frame)) * 100 if len(frame) else 0
 
         return {
             'aura_episodes': aura_count,
             'aura_percentage': round(aura_percentage, 1),
             'aura_types': aura_types,
-            'total_episodes': len(entries)
+            'total_episodes': len(frame)
         }
 
-    def _analyze_functional_impact(self, entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_functional_impact(self, frame: EntryFrame) -> Dict[str, Any]:
         """Analyze functional impact"""
-        impact_counts = {}
-        impact_values = []
-        
-        for entry in entries:
-            impact = entry.get('functionalImpact')
-            if impact:
-                impact_counts[impact] = impact_counts.get(impact, 0) + 1
-                # Convert to numeric
-                impact_map = {
-                    'none': 0, 'mild': 1, 'moderate': 2, 'severe': 3, 'disabling': 4
-                }
-                if impact in impact_map:
-                    impact_values.append(impact_map[impact])
-
-        avg_impact = np.mean(impact_values) if impact_values else 0
+        impact = frame.column('functionalImpact')[frame.present('functionalImpact')]
+        impact_counts = EntryFrame.counts(impact)
+
+        # Convert to numeric
+        impact_map = {
+            'none': 0, 'mild': 1, 'moderate': 2, 'severe': 3, 'disabling': 4
+        }
+        impact_values = impact[impact.isin(list(impact_map))].map(impact_map)
+
+        avg_impact = impact_values.mean() if len(impact_values) else 0
 
         return {
             'impact_distribution': impact_counts,
-            'average_impact': round(avg_impact, 1),
-            'total_episodes': len(entries)
+            'average_impact': round(float(avg_impact), 1),
+            'total_episodes': len(frame)
         }
 
     def _generate_headache_insights(self, entries, pain_analysis, trigger_analysis, aura_analysis) -> List[str]:
@@ -281,141 +212,81 @@ class HeadPainAnalytics:
 
         return insights[:5]  # Limit to 5 insights
 
-    def _generate_headache_charts(self, entries: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Generate charts for headache analytics"""
-        return {
-            'pain_intensity': self._create_headache_intensity_chart(entries),
-            'location_frequency': self._create_headache_location_chart(entries),
-            'trigger_frequency': self._create_headache_trigger_chart(entries)
+    def _generate_headache_charts(self, frame: EntryFrame, render: bool = True) -> Dict[str, Any]:
+        """Generate charts for headache analytics (specs instead of images when render=False)"""
+        specs = {
+            'pain_intensity': self._headache_intensity_chart_spec(frame),
+            'location_frequency': self._headache_location_chart_spec(frame),
+            'trigger_frequency': self._headache_trigger_chart_spec(frame)
         }
+        if not render:
+            return specs
+        return {name: render_chart(spec) for name, spec in specs.items()}
+
+    def _headache_intensity_chart_spec(self, frame: EntryFrame) -> Optional[Dict[str, Any]]:
+        """Pain intensity distribution chart"""
+        # Count intensity levels
+        intensity_counts = {'Mild': 0, 'Moderate': 0, 'Severe': 0, 'Very Severe': 0}
+        observed = EntryFrame.counts(frame.column('painIntensity'))
+        intensity_counts = {level: observed.get(level, 0) for level in intensity_counts}
+
+        if sum(intensity_counts.values()) == 0:
+            return None
 
-    def _create_headache_intensity_chart(self, entries: List[Dict[str, Any]]) -> Optional[str]:
-        """Create pain intensity distribution chart"""
-        try:
-            # Count intensity levels
-            intensity_counts = {'Mild': 0, 'Moderate': 0, 'Severe': 0, 'Very Severe': 0}
-
-            for entry in entries:
-                intensity = entry.get('painIntensity', '')
-                if intensity in intensity_counts:
-                    intensity_counts[intensity] += 1
-
-            if sum(intensity_counts.values()) == 0:
-                return None
-
-            # Create chart
-            labels = list(intensity_counts.keys())
-            counts = list(intensity_counts.values())
-            colors = ['#4ade80', '#fbbf24', '#f97316', '#ef4444']
-
-            plt.figure(figsize=(8, 8))
-            plt.pie(counts, labels=labels, autopct='%1.1f%%', colors=colors, startangle=90)
-            plt.title('Headache Pain Intensity Distribution', fontsize=14, fontweight='bold')
-            plt.axis('equal')
-
-            # Convert to base64
-            buffer = BytesIO()
-            plt.savefig(buffer, format='png', dpi=100, bbox_inches='tight')
-            buffer.seek(0)
-            chart_data = base64.b64encode(buffer.getvalue()).decode()
-            plt.close()
+        return {
+            'kind': 'pie',
+            'labels': list(intensity_counts.keys()),
+            'values': list(intensity_counts.values()),
+            'colors': ['#4ade80', '#fbbf24', '#f97316', '#ef4444'],
+            'title': 'Headache Pain Intensity Distribution',
+            'title_size': 14,
+            'figsize': [8, 8]
+        }
 
-            return f"data:image/png;base64,{chart_data}"
+    def _headache_location_chart_spec(self, frame: EntryFrame) -> Optional[Dict[str, Any]]:
+        """Pain location frequency chart (top 8 locations)"""
+        location_counts = EntryFrame.counts(frame.exploded('painLocation'))
 
-        except Exception as e:
-            print(f"Headache intensity chart error: {e}")
-            plt.close()
+        if not location_counts:
             return None
 
-    def _create_headache_location_chart(self, entries: List[Dict[str, Any]]) -> Optional[str]:
-        """Create pain location frequency chart"""
-        try:
-            # Count locations
-            location_counts = {}
-            for entry in entries:
-                locations = entry.get('painLocation', [])
-                if isinstance(locations, list):
-                    for location in locations:
-                        location_counts[location] = location_counts.get(location, 0) + 1
-
-            if not location_counts:
-                return None
-
-            # Get top 8 locations
-            top_locations = sorted(location_counts.items(), key=lambda x: x[1], reverse=True)[:8]
-            locations, counts = zip(*top_locations)
-
-            # Create chart
-            plt.figure(figsize=(10, 6))
-            bars = plt.bar(range(len(locations)), counts, color='#8b5cf6')
-            plt.title('Most Common Headache Locations', fontsize=14, fontweight='bold')
-            plt.xlabel('Location')
-            plt.ylabel('Frequency')
-            plt.xticks(range(len(locations)), locations, rotation=45, ha='right')
-
-            # Add value labels on bars
-            for bar, count in zip(bars, counts):
-                plt.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.1,
-                        str(count), ha='center', va='bottom')
-
-            plt.tight_layout()
-
-            # Convert to base64
-            buffer = BytesIO()
-            plt.savefig(buffer, format='png', dpi=100, bbox_inches='tight')
-            buffer.seek(0)
-            chart_data = base64.b64encode(buffer.getvalue()).decode()
-            plt.close()
-
-            return f"data:image/png;base64,{chart_data}"
-
-        except Exception as e:
-            print(f"Headache location chart error: {e}")
-            plt.close()
-            return None
+        locations, counts = zip(*EntryFrame.top(location_counts, 8))
+        return {
+            'kind': 'bar',
+            'labels': list(locations),
+            'values': list(counts),
+            'color': '#8b5cf6',
+            'title': 'Most Common Headache Locations',
+            'title_size': 14,
+            'xlabel': 'Location',
+            'ylabel': 'Frequency',
+            'rotation': 45,
+            'ha': 'right',
+            'value_labels': True,
+            'figsize': [10, 6]
+        }
 
-    def _create_headache_trigger_chart(self, entries: List[Dict[str, Any]]) -> Optional[str]:
-        """Create trigger frequency chart"""
-        try:
-            # Count triggers
-            trigger_counts = {}
-            for entry in entries:
-                triggers = entry.get('triggers', [])
-                if isinstance(triggers, list):
-                    for trigger in triggers:
-                        trigger_counts[trigger] = trigger_counts.get(trigger, 0) + 1
-
-            if not trigger_counts:
-                return None
-
-            # Get top 6 triggers
-            top_triggers = sorted(trigger_counts.items(), key=lambda x: x[1], reverse=True)[:6]
-            triggers, counts = zip(*top_triggers)
-
-            # Create chart
-            plt.figure(figsize=(8, 8))
-            colors = plt.cm.Set3(np.linspace(0, 1, len(triggers)))
-            plt.pie(counts, labels=triggers, autopct='%1.1f%%', colors=colors, startangle=90)
-            plt.title('Most Common Headache Triggers', fontsize=14, fontweight='bold')
-            plt.axis('equal')
-
-            # Convert to base64
-            buffer = BytesIO()
-            plt.savefig(buffer, format='png', dpi=100, bbox_inches='tight')
-            buffer.seek(0)
-            chart_data = base64.b64encode(buffer.getvalue()).decode()
-            plt.close()
-
-            return f"data:image/png;base64,{chart_data}"
+    def _headache_trigger_chart_spec(self, frame: EntryFrame) -> Optional[Dict[str, Any]]:
+        """Trigger frequency chart (top 6 triggers)"""
+        trigger_counts = EntryFrame.counts(frame.exploded('triggers'))
 
-        except Exception as e:
-            print(f"Headache trigger chart error: {e}")
-            plt.close()
+        if not trigger_counts:
             return None
 
+        triggers, counts = zip(*EntryFrame.top(trigger_counts, 6))
+        return {
+            'kind': 'pie',
+            'labels': list(triggers),
+            'values': list(counts),
+            'palette': 'Set3',
+            'title': 'Most Common Headache Triggers',
+            'title_size': 14,
+            'figsize': [8, 8]
+        }
+
     def _get_fallback_head_pain_analytics(self) -> Dict[str, Any]:
         """Fallback analytics when no data available"""
-        return {
+        return StandIn({
             'period': {
                 'start': datetime.now().isoformat(),
                 'end': datetime.now().isoformat(),
@@ -430,4 +301,4 @@ class HeadPainAnalytics:
             'functional_impact': {'impact_distribution': {}, 'average_impact': 0},
             'insights': ['No head pain data available for analysis'],
             'charts': {}
-        }
+        })
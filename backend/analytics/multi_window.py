@@ -0,0 +1,88 @@
+"""
+Copyright (c) 2025 Chaos Cascade
+Created by: Ren & Ace (Claude-4)
+
+This file is part of the Chaos Cascade Medical Management System.
+Revolutionary healthcare tools built with consciousness and care.
+"""
+
+"""
+MULTI-WINDOW ANALYTICS MODULE 🪟
+Every date range (7/30/90/365 days...) from one pass over the entries.
+
+Entries are filtered once against the widest window, in date order
+(select_entries), so each narrower window is a suffix of the rows - and every
+ring is tallied in the same date order analyze() and the incremental
+accumulators use, so the order-sensitive parts of a response (recent-reading
+trends, chart label order) match theirs. Walking from the newest
+window outward, each ring of older entries is tallied once and merged into
+the running tally - a cumulative histogram - and every window's response is
+built from the tally as it stands. Switching ranges in the UI becomes a
+lookup in the response instead of another request.
+"""
+
+import numpy as np
+import pandas as pd
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable
+
+from .entry_frame import EntryFrame
+from .date_filter import select_entries, window_bounds
+from .tally import Tally
+
+DEFAULT_WINDOWS = (7, 30, 90, 365)
+MAX_WINDOWS = 8
+
+
+def parse_windows(windows: Iterable[Any]) -> list:
+    """Distinct window lengths in days, narrowest first (ValueError on anything else)"""
+    try:
+        days = sorted({int(window) for window in windows})
+    except (TypeError, ValueError):
+        raise ValueError('windows must be a list of day counts')
+    if not days or days[0] < 1 or len(days) > MAX_WINDOWS:
+        raise ValueError(f'windows must hold 1-{MAX_WINDOWS} positive day counts')
+    return days
+
+
+def analyze_windows(analyzer, entries, windows: Iterable[int] = DEFAULT_WINDOWS,
+                    render_charts: bool = True, whole_days: bool = False,
+                    analyze: Callable[..., Dict[str, Any]] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    {str(days): response} for every window, from the analyzer's tally_entries()
+    and summarize(). whole_days windows on calendar dates (like the analyzer does);
+    analyze answers for an empty history so its no-data responses are kept.
+    """
+    days = parse_windows(windows)
+    frame = EntryFrame.coerce(entries)
+    if not len(frame) and analyze is not None:
+        return {str(window): analyze(frame, window, render_charts=render_charts) for window in days}
+
+    # One filter against the widest window (rows come back in date order)
+    now = datetime.now()
+    bounds = {window: window_bounds(window, now) for window in days}
+    keep = select_entries(frame, bounds[days[-1]][0], whole_days)
+    dates = frame.dates.iloc[keep]
+    if whole_days:
+        dates = dates.dt.normalize()
+    dates = dates.to_numpy()
+
+    results = {}
+    tally = Tally()
+    end = len(keep)
+    for window in days:
+        start_date, end_date = bounds[window]
+        start = pd.Timestamp(start_date)
+        if whole_days:
+            start = start.normalize()
+
+        # Entries between this window's start and the previous (narrower) one's
+        first = int(np.searchsorted(dates, start.to_datetime64(), side='left'))
+        if first < end:
+            ring = analyzer.tally_entries(frame.take(keep[first:end]))
+            tally = Tally.combine([ring, tally])
+            end = first
+
+        results[str(window)] = analyzer.summarize(tally, start_date, end_date, window, render_charts)
+
+    return results
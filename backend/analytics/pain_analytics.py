@@ -15,14 +15,15 @@ Because pain tracking deserves proper analysis! ⚡💪
 
 import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
-import matplotlib
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
-import seaborn as sns
-from io import BytesIO
-import base64
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Union
+
+from .entry_frame import EntryFrame, to_python
+from .chart_utils import render_chart
+from .date_filter import select_entries, window_bounds
+from .tally import Tally
+from .result_cache import StandIn
+from .multi_window import DEFAULT_WINDOWS, analyze_windows, parse_windows
 
 class PainAnalytics:
     """
@@ -30,49 +31,99 @@ class PainAnalytics:
     Because understanding your pain patterns is the first step to managing them! 🔥
     """
     
-    def analyze_pain(self, entries: List[Dict[str, Any]], date_range: int = 30) -> Dict[str, Any]:
+    def analyze_pain(self, entries: Union[EntryFrame, List[Dict[str, Any]]], date_range: int = 30,
+                    render_charts: bool = True) -> Dict[str, Any]:
         """
         Medical-grade general pain analytics 🔥
         Pain level analysis, location patterns, trigger identification, treatment effectiveness
+        render_charts=False returns chart specs instead of images (deferred rendering)
         """
         try:
-            if not entries:
+            frame = EntryFrame.coerce(entries)
+            if not len(frame):
                 return self._get_fallback_pain_analytics()
 
             # Filter out NOPE entries and recent entries
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=date_range)
-
-            analytics_entries = []
-            for entry in entries:
-                # Skip NOPE entries
-                if entry.get('tags', []) and 'NOPE' in entry.get('tags', []):
-                    continue
-                
-                # Handle date parsing safely
-                entry_date_str = entry.get('date', '')
-                if not entry_date_str:
-                    continue
-                    
-                try:
-                    entry_date = datetime.fromisoformat(entry_date_str)
-                    if entry_date >= start_date:
-                        analytics_entries.append(entry)
-                except ValueError:
-                    # Skip entries with invalid dates
-                    continue
-
-            if not analytics_entries:
+            start_date, end_date = window_bounds(date_range)
+            keep = select_entries(frame, start_date)
+
+            if not len(keep):
+                return self._get_fallback_pain_analytics()
+
+            tally = self.tally_entries(frame.take(keep))
+
+        except Exception as e:
+            print(f"Pain analytics error: {e}")
+            return self._get_fallback_pain_analytics()
+
+        return self.summarize(tally, start_date, end_date, date_range, render_charts)
+
+    def analyze_pain_windows(self, entries: Union[EntryFrame, List[Dict[str, Any]]],
+                             windows=DEFAULT_WINDOWS, render_charts: bool = True) -> Dict[str, Dict[str, Any]]:
+        """Pain analytics for several date ranges at once, keyed by days (one pass over the entries)"""
+        try:
+            return analyze_windows(self, entries, windows, render_charts, analyze=self.analyze_pain)
+
+        except Exception as e:
+            print(f"Pain analytics error: {e}")
+            return {str(window): self._get_fallback_pain_analytics() for window in parse_windows(windows)}
+
+    def tally_entries(self, frame: EntryFrame) -> Tally:
+        """Boil entries down to the mergeable counters and sums the pain response is built from"""
+        tally = Tally().add('entries', len(frame))
+
+        # Pain levels: exact-value histogram + the last 7 readings for the trend
+        pain_levels = frame.numeric('painLevel').dropna()
+        tally.count('pain_levels', EntryFrame.counts(pain_levels))
+        tally.tail('recent_levels', pain_levels.tolist(), 7)
+
+        # Locations, and which locations show up together
+        tally.count('locations', EntryFrame.counts(frame.exploded('painLocations')))
+        multi = frame.column('painLocations')[frame.list_lengths('painLocations') > 1]
+        tally.count('location_sets', EntryFrame.counts(multi.map(lambda locations: ', '.join(sorted(locations)))))
+
+        tally.count('triggers', EntryFrame.counts(frame.exploded('painTriggers')))
+
+        # Treatments: effectiveness totals overall and per treatment
+        effectiveness = frame.numeric('effectiveness')
+        rated = frame.is_list('treatments') & (effectiveness > 0)
+        tally.add('rated_entries', int(rated.sum()))
+        tally.add('effectiveness_total', float(effectiveness[rated].sum()))
+
+        # Pair every treatment with the effectiveness of the entry it came from
+        treatments = frame.exploded('treatments')
+        treatments = treatments[rated.reindex(treatments.index, fill_value=False).to_numpy()]
+        if len(treatments):
+            scores = effectiveness.reindex(treatments.index).groupby(treatments.to_numpy(), sort=False)
+            tally.count('treatment_scores', {to_python(t): float(s) for t, s in scores.sum().items()})
+            tally.count('treatment_ratings', {to_python(t): int(n) for t, n in scores.size().items()})
+
+        # Pain by day of week
+        dates = frame.dates
+        dated = dates.notna()
+        day_names = dates[dated].dt.day_name()
+        if len(day_names):
+            levels = frame.numeric('painLevel').fillna(0)[dated].groupby(day_names.to_numpy(), sort=False)
+            tally.count('weekday_pain', {day: float(total) for day, total in levels.sum().items()})
+            tally.count('weekday_entries', {day: int(n) for day, n in levels.size().items()})
+
+        return tally
+
+    def summarize(self, tally: Tally, start_date: datetime, end_date: datetime, date_range: int = 30,
+                  render_charts: bool = True) -> Dict[str, Any]:
+        """Build the pain analytics response from the tally of the window's entries"""
+        try:
+            if not tally.total('entries'):
                 return self._get_fallback_pain_analytics()
 
             # Core analytics
-            pain_level_analysis = self._analyze_pain_levels(analytics_entries)
-            location_analysis = self._analyze_pain_locations(analytics_entries)
-            trigger_analysis = self._analyze_pain_triggers(analytics_entries)
-            treatment_analysis = self._analyze_treatment_effectiveness(analytics_entries)
-            pattern_analysis = self._analyze_pain_patterns(analytics_entries)
-            insights = self._generate_pain_insights(analytics_entries)
-            charts = self._generate_pain_charts(analytics_entries)
+            pain_level_analysis = self._analyze_pain_levels(tally)
+            location_analysis = self._analyze_pain_locations(tally)
+            trigger_analysis = self._analyze_pain_triggers(tally)
+            treatment_analysis = self._analyze_treatment_effectiveness(tally)
+            pattern_analysis = self._analyze_pain_patterns(tally)
+            insights = self._generate_pain_insights(tally)
+            charts = self._generate_pain_charts(tally, render_charts)
 
             # 🚨 CRITICAL: Return data structure that matches frontend expectations
             return {
@@ -81,7 +132,7 @@ class PainAnalytics:
                     'end': end_date.isoformat(),
                     'days': date_range
                 },
-                'total_entries': len(analytics_entries),
+                'total_entries': tally.total('entries'),
                 'pain_level_analysis': {
                     'avg_pain_level': pain_level_analysis.get('avg_pain', 0),
                     'max_pain_level': pain_level_analysis.get('max_pain', 0),
@@ -123,32 +174,35 @@ class PainAnalytics:
             print(f"Pain analytics error: {e}")
             return self._get_fallback_pain_analytics()
 
-    def _analyze_pain_levels(self, entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _pain_level_histogram(self, tally: Tally):
+        """Distinct pain levels and how often each was recorded"""
+        histogram = tally.counter('pain_levels')
+        levels = np.array(list(histogram.keys()), dtype=float)
+        counts = np.array(list(histogram.values()), dtype=int)
+        return levels, counts
+
+    def _analyze_pain_levels(self, tally: Tally) -> Dict[str, Any]:
         """Analyze pain level patterns and trends"""
-        pain_levels = []
+        levels, counts = self._pain_level_histogram(tally)
+        total = counts.sum()
+
         pain_counts = {}
-        high_pain_days = 0
-        pain_free_days = 0
-        
-        for entry in entries:
-            pain_level = entry.get('painLevel', 0)
-            if isinstance(pain_level, (int, float)):
-                pain_levels.append(pain_level)
-                pain_counts[str(int(pain_level))] = pain_counts.get(str(int(pain_level)), 0) + 1
-                
-                if pain_level >= 7:
-                    high_pain_days += 1
-                elif pain_level == 0:
-                    pain_free_days += 1
+        for level, count in tally.counter('pain_levels').items():
+            label = str(int(level))
+            pain_counts[label] = pain_counts.get(label, 0) + count
+        high_pain_days = counts[levels >= 7].sum()
+        pain_free_days = counts[levels == 0].sum()
 
-        avg_pain = np.mean(pain_levels) if pain_levels else 0
-        max_pain = max(pain_levels) if pain_levels else 0
+        level_sum = float((levels * counts).sum())
+        avg_pain = level_sum / total if total else 0
+        max_pain = to_python(max(tally.counter('pain_levels'))) if total else 0
         
         # Simple trend analysis
         trend = 'stable'
-        if len(pain_levels) >= 7:
-            recent_avg = np.mean(pain_levels[-7:])
-            older_avg = np.mean(pain_levels[:-7]) if len(pain_levels) > 7 else recent_avg
+        if total >= 7:
+            recent = tally.recent('recent_levels')
+            recent_avg = sum(recent) / len(recent)
+            older_avg = (level_sum - sum(recent)) / (total - 7) if total > 7 else recent_avg
             
             if recent_avg > older_avg * 1.2:
                 trend = 'worsening'
@@ -156,7 +210,7 @@ class PainAnalytics:
                 trend = 'improving'
         
         return {
-            'avg_pain': round(avg_pain, 1),
+            'avg_pain': round(float(avg_pain), 1),
             'max_pain': max_pain,
             'pain_counts': pain_counts,
             'high_pain_days': high_pain_days,
@@ -164,47 +218,29 @@ class PainAnalytics:
             'trend': trend
         }
 
-    def _analyze_pain_locations(self, entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_pain_locations(self, tally: Tally) -> Dict[str, Any]:
         """Analyze pain location patterns"""
-        location_counts = {}
-        all_locations = set()
-        
-        for entry in entries:
-            locations = entry.get('painLocations', [])
-            if isinstance(locations, list):
-                for location in locations:
-                    location_counts[location] = location_counts.get(location, 0) + 1
-                    all_locations.add(location)
+        location_counts = dict(tally.counter('locations'))
 
         most_common = max(location_counts.items(), key=lambda x: x[1])[0] if location_counts else 'Unknown'
         
         # Identify patterns (locations that often occur together)
         patterns = {}
-        if len(all_locations) > 1:
+        if len(location_counts) > 1:
             # Simple co-occurrence analysis
-            for entry in entries:
-                locations = entry.get('painLocations', [])
-                if len(locations) > 1:
-                    combo = ', '.join(sorted(locations))
-                    patterns[combo] = patterns.get(combo, 0) + 1
+            patterns = tally.counter('location_sets')
         
         return {
             'location_counts': location_counts,
             'most_common': most_common,
-            'total_areas': len(all_locations),
-            'patterns': dict(sorted(patterns.items(), key=lambda x: x[1], reverse=True)[:5])
+            'total_areas': len(location_counts),
+            'patterns': dict(EntryFrame.top(patterns, 5))
         }
 
-    def _analyze_pain_triggers(self, entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_pain_triggers(self, tally: Tally) -> Dict[str, Any]:
         """Analyze pain trigger patterns"""
-        trigger_counts = {}
         avoidable_triggers = ['stress', 'poor posture', 'dehydration', 'skipped meals', 'overexertion']
-        
-        for entry in entries:
-            triggers = entry.get('painTriggers', [])
-            if isinstance(triggers, list):
-                for trigger in triggers:
-                    trigger_counts[trigger] = trigger_counts.get(trigger, 0) + 1
+        trigger_counts = dict(tally.counter('triggers'))
 
         most_common = max(trigger_counts.items(), key=lambda x: x[1])[0] if trigger_counts else 'Unknown'
         
@@ -219,29 +255,17 @@ class PainAnalytics:
             'avoidable': avoidable
         }
 
-    def _analyze_treatment_effectiveness(self, entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_treatment_effectiveness(self, tally: Tally) -> Dict[str, Any]:
         """Analyze treatment effectiveness patterns"""
-        treatment_effectiveness = {}
-        effectiveness_scores = []
-        
-        for entry in entries:
-            treatments = entry.get('treatments', [])
-            effectiveness = entry.get('effectiveness', 0)
-            
-            if isinstance(treatments, list) and isinstance(effectiveness, (int, float)) and effectiveness > 0:
-                effectiveness_scores.append(effectiveness)
-                for treatment in treatments:
-                    if treatment not in treatment_effectiveness:
-                        treatment_effectiveness[treatment] = []
-                    treatment_effectiveness[treatment].append(effectiveness)
-
-        has_data = len(effectiveness_scores) > 0
-        avg_effectiveness = np.mean(effectiveness_scores) if effectiveness_scores else 0
+        rated_entries = tally.total('rated_entries')
+
+        has_data = rated_entries > 0
+        avg_effectiveness = tally.total('effectiveness_total') / rated_entries if has_data else 0
         
         # Calculate average effectiveness per treatment
-        treatment_avgs = {}
-        for treatment, scores in treatment_effectiveness.items():
-            treatment_avgs[treatment] = round(np.mean(scores), 1)
+        ratings = tally.counter('treatment_ratings')
+        treatment_avgs = {treatment: round(float(score / ratings[treatment]), 1)
+                          for treatment, score in tally.counter('treatment_scores').items()}
         
         most_effective = max(treatment_avgs.items(), key=lambda x: x[1])[0] if treatment_avgs else 'Unknown'
         
@@ -259,69 +283,55 @@ class PainAnalytics:
             'has_data': has_data,
             'effectiveness': treatment_avgs,
             'most_effective': most_effective,
-            'avg_effectiveness': round(avg_effectiveness, 1),
+            'avg_effectiveness': round(float(avg_effectiveness), 1),
             'recommendations': recommendations
         }
 
-    def _analyze_pain_patterns(self, entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_pain_patterns(self, tally: Tally) -> Dict[str, Any]:
         """Analyze temporal and severity patterns"""
-        pain_levels = [entry.get('painLevel', 0) for entry in entries if isinstance(entry.get('painLevel'), (int, float))]
+        levels, counts = self._pain_level_histogram(tally)
         
         # Calculate consistency (lower std dev = more consistent pain levels)
-        consistency = 100 - (np.std(pain_levels) * 10) if pain_levels else 0
+        consistency = 100 - (np.std(np.repeat(levels, counts)) * 10) if counts.sum() else 0
         consistency = max(0, min(100, consistency))
         
-        # Weekly patterns (if we have date info)
-        weekly_patterns = {}
-        for entry in entries:
-            try:
-                entry_date = datetime.fromisoformat(entry.get('date', ''))
-                day_name = entry_date.strftime('%A')
-                pain_level = entry.get('painLevel', 0)
-                if day_name not in weekly_patterns:
-                    weekly_patterns[day_name] = []
-                weekly_patterns[day_name].append(pain_level)
-            except (ValueError, TypeError):
-                continue
-        
         # Average pain by day of week
-        weekly_avgs = {day: round(np.mean(levels), 1) for day, levels in weekly_patterns.items()}
+        entries = tally.counter('weekday_entries')
+        weekly_avgs = {day: round(float(total / entries[day]), 1)
+                       for day, total in tally.counter('weekday_pain').items()}
         
         return {
-            'consistency': round(consistency, 1),
+            'consistency': round(float(consistency), 1),
             'weekly': weekly_avgs,
             'trends': {},
             'correlations': []
         }
 
-    def _generate_pain_insights(self, entries: List[Dict[str, Any]]) -> List[str]:
+    def _generate_pain_insights(self, tally: Tally) -> List[str]:
         """Generate medical insights about pain patterns"""
         insights = []
+        total_entries = tally.total('entries')
         
-        if len(entries) > 0:
-            insights.append(f"Analyzed {len(entries)} pain episodes over the selected period.")
+        if total_entries > 0:
+            insights.append(f"Analyzed {total_entries} pain episodes over the selected period.")
             
             # Pain level insights
-            pain_levels = [entry.get('painLevel', 0) for entry in entries if isinstance(entry.get('painLevel'), (int, float))]
-            if pain_levels:
-                avg_pain = np.mean(pain_levels)
-                high_pain_count = sum(1 for level in pain_levels if level >= 7)
+            levels, counts = self._pain_level_histogram(tally)
+            total = counts.sum()
+            if total:
+                avg_pain = (levels * counts).sum() / total
+                high_pain_count = counts[levels >= 7].sum()
                 
                 if avg_pain >= 6:
                     insights.append("⚠️ Average pain levels are high. Consider consulting with your healthcare provider.")
                 elif avg_pain <= 3:
                     insights.append("✅ Average pain levels are relatively low and manageable.")
                 
-                if high_pain_count > len(pain_levels) * 0.3:
+                if high_pain_count > total * 0.3:
                     insights.append("📊 Frequent high-pain episodes detected. Pain management strategies may need adjustment.")
             
             # Location insights
-            location_counts = {}
-            for entry in entries:
-                locations = entry.get('painLocations', [])
-                if isinstance(locations, list):
-                    for location in locations:
-                        location_counts[location] = location_counts.get(location, 0) + 1
+            location_counts = tally.counter('locations')
             
             if location_counts:
                 most_common_location = max(location_counts.items(), key=lambda x: x[1])[0]
@@ -329,40 +339,46 @@ class PainAnalytics:
         
         return insights
 
-    def _generate_pain_charts(self, entries: List[Dict[str, Any]]) -> Dict[str, str]:
-        """Generate pain analytics charts"""
+    def _build_pain_chart_specs(self, tally: Tally) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Chart specs for pain analytics (None when a chart has no data)"""
+        levels, counts = self._pain_level_histogram(tally)
+        bins = list(range(0, 12))
+        binned, _ = np.histogram(levels, bins=bins, weights=counts)
+
+        return {
+            # Pain level distribution chart (pre-binned - the spec stays tiny however many entries)
+            'pain_distribution': {
+                'kind': 'histogram',
+                'counts': [int(count) for count in binned],
+                'bins': bins,
+                'color': '#ef4444',
+                'title': 'Pain Level Distribution 🔥',
+                'xlabel': 'Pain Level (0-10)',
+                'ylabel': 'Frequency',
+                'xticks': list(range(0, 11)),
+                'figsize': [10, 6],
+                'dpi': 150
+            } if counts.sum() else None
+        }
+
+    def _generate_pain_charts(self, tally: Tally, render: bool = True) -> Dict[str, Any]:
+        """Generate pain analytics charts (specs instead of images when render=False)"""
         charts = {}
-        
+
         try:
-            # Pain level distribution chart
-            pain_levels = [entry.get('painLevel', 0) for entry in entries if isinstance(entry.get('painLevel'), (int, float))]
-            
-            if pain_levels:
-                plt.figure(figsize=(10, 6))
-                plt.hist(pain_levels, bins=range(0, 12), alpha=0.7, color='#ef4444', edgecolor='black')
-                plt.title('Pain Level Distribution 🔥')
-                plt.xlabel('Pain Level (0-10)')
-                plt.ylabel('Frequency')
-                plt.xticks(range(0, 11))
-                plt.grid(True, alpha=0.3)
-                plt.tight_layout()
-                
-                buffer = BytesIO()
-                plt.savefig(buffer, format='png', dpi=150, bbox_inches='tight')
-                buffer.seek(0)
-                chart_data = base64.b64encode(buffer.getvalue()).decode()
-                charts['pain_distribution'] = f"data:image/png;base64,{chart_data}"
-                plt.close()
-                
+            for name, spec in self._build_pain_chart_specs(tally).items():
+                chart = render_chart(spec) if render else spec
+                if chart:
+                    charts[name] = chart
+
         except Exception as e:
             print(f"Pain chart error: {e}")
-            plt.close()
-        
+
         return charts
 
     def _get_fallback_pain_analytics(self) -> Dict[str, Any]:
         """Fallback analytics when no data available"""
-        return {
+        return StandIn({
             'period': {
                 'start': datetime.now().isoformat(),
                 'end': datetime.now().isoformat(),
@@ -404,4 +420,4 @@ class PainAnalytics:
             },
             'insights': ['No pain data available for analysis'],
             'charts': {}
-        }
+        })
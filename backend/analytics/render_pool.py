@@ -0,0 +1,108 @@
+"""
+Copyright (c) 2025 Chaos Cascade
+Created by: Ren & Ace (Claude-4)
+
+This file is part of the Chaos Cascade Medical Management System.
+Revolutionary healthcare tools built with consciousness and care.
+"""
+
+"""
+CHART RENDER POOL MODULE 🏭
+Process pool of warmed matplotlib renderers.
+
+Chart specs are plain dicts, so they pickle cheaply: the web process hands
+them to a pool of renderer processes and several charts (or several users'
+dashboards) rasterize in parallel across cores instead of queueing on the GIL.
+
+The pool is opt-in (CHART_RENDER_WORKERS, default 0 = render in-process):
+`python app.py` stays one process, and spawned renderers would each re-import
+app.py as __mp_main__. The production entry point (wsgi.py) turns it on with
+PRODUCTION_WORKERS.
+"""
+
+import os
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, List, Optional
+
+from .chart_utils import render_chart_png
+
+# Renderer processes wsgi.py defaults to - one per core, up to 4
+PRODUCTION_WORKERS = min(4, os.cpu_count() or 1)
+
+# Tiny chart drawn once per renderer process so fonts/Agg are loaded before real work
+WARMUP_SPEC = {'kind': 'bar', 'labels': ['warmup'], 'values': [1], 'title': 'warmup',
+               'figsize': [2, 2], 'dpi': 20}
+
+
+def _warm_renderer():
+    """Pool initializer - pay matplotlib's first-render cost up front"""
+    render_chart_png(WARMUP_SPEC)
+
+
+def _ready(_) -> int:
+    return os.getpid()
+
+
+class ChartRenderPool:
+    """
+    Lazily started ProcessPoolExecutor for chart rendering.
+    workers=0 renders in-process (useful for debugging and tiny deployments).
+    """
+
+    def __init__(self, workers: int = 0):
+        self.workers = max(0, int(workers))
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> 'ChartRenderPool':
+        """Pool size from CHART_RENDER_WORKERS (default 0: render in-process)"""
+        return cls(int(os.getenv('CHART_RENDER_WORKERS', 0)))
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # spawn: never fork a threaded web server (and matches Windows/macOS)
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_warm_renderer,
+                )
+            return self._executor
+
+    def start(self) -> None:
+        """Spin up and warm every renderer process now instead of on the first chart"""
+        if self.workers:
+            executor = self._get_executor()
+            list(executor.map(_ready, range(self.workers)))
+
+    def render_many(self, specs: List[Dict[str, Any]]) -> List[Optional[bytes]]:
+        """Render specs to PNG bytes in parallel; results come back in the same order"""
+        if not specs:
+            return []
+        if not self.workers:
+            return [render_chart_png(spec) for spec in specs]
+
+        try:
+            return list(self._get_executor().map(render_chart_png, specs))
+
+        except BrokenProcessPool as e:
+            # A renderer died (OOM, killed...) - start fresh next time, render this batch here
+            print(f"Chart render pool error: {e}")
+            self.shutdown(wait=False)
+            return [render_chart_png(spec) for spec in specs]
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'workers': self.workers,
+            'running': self._executor is not None,
+        }
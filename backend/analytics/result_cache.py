@@ -0,0 +1,162 @@
+"""
+Copyright (c) 2025 Chaos Cascade
+Created by: Ren & Ace (Claude-4)
+
+This file is part of the Chaos Cascade Medical Management System.
+Revolutionary healthcare tools built with consciousness and care.
+"""
+
+"""
+ANALYTICS RESULT CACHE MODULE 🗃️
+Bounded LRU + TTL cache in front of the AnalyticsEngine.
+
+The frontend re-POSTs a tracker's whole history every time a view opens, so
+results are content-addressed: the key is a stable hash of
+(endpoint, entries, dateRange). A repeat load costs one hash and one lookup
+instead of a full analytics pass + matplotlib render. Fallback and error
+results are never stored, so a transient failure isn't replayed for the TTL.
+"""
+
+import os
+import json
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+DEFAULT_MAX_ENTRIES = 128
+DEFAULT_TTL_SECONDS = 600  # 10 minutes - date windows are relative to "now"
+
+
+def content_key(endpoint: str, payload: Any) -> str:
+    """Stable key for (endpoint, payload) - dict key order does not matter"""
+    canonical = json.dumps(payload, sort_keys=True, separators=(',', ':'), default=str)
+    digest = hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+    return f"{endpoint}:{digest}"
+
+
+class StandIn(dict):
+    """
+    A response the cache serves but never stores - analyzers return their
+    no-data fallback as StandIn({...}), so the marker stays out of the payload.
+    """
+
+
+def _stand_in(value: Any) -> bool:
+    return isinstance(value, StandIn) or (isinstance(value, dict) and bool(value.get('error')))
+
+
+def is_cacheable(value: Any) -> bool:
+    """
+    Fallback and error results are stand-ins for a failed or empty analysis -
+    serve them, but don't pin them for the whole TTL. Multi-window results
+    ({window: result}) are checked window by window.
+    """
+    if not isinstance(value, dict):
+        return True
+    if _stand_in(value):
+        return False
+    return not any(_stand_in(item) for item in value.values())
+
+
+class AnalyticsCache:
+    """
+    Thread-safe LRU cache with per-entry expiry.
+    Keys are namespaced by endpoint so one tracker can be invalidated alone.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        self.max_entries = max(0, int(max_entries))
+        self.ttl_seconds = float(ttl_seconds)
+        self._entries: 'OrderedDict[str, tuple]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @classmethod
+    def from_env(cls) -> 'AnalyticsCache':
+        """Build a cache sized from ANALYTICS_CACHE_SIZE / ANALYTICS_CACHE_TTL"""
+        return cls(
+            max_entries=int(os.getenv('ANALYTICS_CACHE_SIZE', DEFAULT_MAX_ENTRIES)),
+            ttl_seconds=float(os.getenv('ANALYTICS_CACHE_TTL', DEFAULT_TTL_SECONDS)),
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl_seconds > 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """Cached value for key, or None on a miss/expired entry"""
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store value under key, evicting the least recently used entries"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_compute(self, endpoint: str, payload: Any, compute: Callable[[], Any]) -> Any:
+        """Return the cached result for (endpoint, payload), computing it on a miss"""
+        if not self.enabled:
+            return compute()
+
+        key = content_key(endpoint, payload)
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            if is_cacheable(value):
+                self.set(key, value)
+        return value
+
+    def invalidate(self, endpoint: Optional[str] = None) -> int:
+        """Drop every entry (or only one endpoint's entries); returns how many were removed"""
+        with self._lock:
+            if endpoint is None:
+                removed = len(self._entries)
+                self._entries.clear()
+                return removed
+
+            prefix = f"{endpoint}:"
+            stale = [key for key in self._entries if key.startswith(prefix)]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for monitoring"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'enabled': self.enabled,
+                'size': len(self._entries),
+                'max_entries': self.max_entries,
+                'ttl_seconds': self.ttl_seconds,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+            }
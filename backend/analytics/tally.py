@@ -0,0 +1,98 @@
+"""
+Copyright (c) 2025 Chaos Cascade
+Created by: Ren & Ace (Claude-4)
+
+This file is part of the Chaos Cascade Medical Management System.
+Revolutionary healthcare tools built with consciousness and care.
+"""
+
+"""
+TALLY MODULE 🧮
+Mergeable running summaries of tracker entries.
+
+An analyzer boils a set of entries down to a Tally (histograms, counters,
+sums, a short tail of recent values, chart series) and builds its response
+from the Tally alone. Tallies of disjoint entry sets merge into the Tally of
+their union, so per-day tallies can be combined into any date window without
+looking at the raw entries again.
+"""
+
+from typing import Any, Dict, List
+
+
+class Tally:
+    """
+    Named counters (value -> count or running total, first-appearance order),
+    scalar sums, bounded tails (the last N values in entry order) and
+    unbounded series (chart data). Everything serializes to plain JSON.
+    """
+
+    def __init__(self):
+        self.counters: Dict[str, Dict[Any, float]] = {}
+        self.sums: Dict[str, float] = {}
+        self.tails: Dict[str, List[Any]] = {}
+        self.tail_sizes: Dict[str, int] = {}
+        self.series: Dict[str, List[Any]] = {}
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def count(self, name: str, counts: Dict[Any, float]) -> 'Tally':
+        """Add a {value: count} dict into a counter"""
+        counter = self.counters.setdefault(name, {})
+        for key, amount in counts.items():
+            counter[key] = counter.get(key, 0) + amount
+        return self
+
+    def add(self, name: str, amount: float) -> 'Tally':
+        """Add to a scalar sum"""
+        self.sums[name] = self.sums.get(name, 0) + amount
+        return self
+
+    def tail(self, name: str, values: List[Any], size: int) -> 'Tally':
+        """Append values, keeping only the last `size`"""
+        self.tail_sizes[name] = size
+        self.tails[name] = (self.tails.get(name, []) + list(values))[-size:]
+        return self
+
+    def extend(self, name: str, values: List[Any]) -> 'Tally':
+        """Append values to a series"""
+        self.series.setdefault(name, []).extend(values)
+        return self
+
+    def merge(self, other: 'Tally') -> 'Tally':
+        """Fold in the tally of later entries (tails and series keep entry order)"""
+        for name, counts in other.counters.items():
+            self.count(name, counts)
+        for name, amount in other.sums.items():
+            self.add(name, amount)
+        for name, values in other.tails.items():
+            self.tail(name, values, other.tail_sizes[name])
+        for name, values in other.series.items():
+            self.extend(name, values)
+        return self
+
+    @classmethod
+    def combine(cls, tallies) -> 'Tally':
+        """Merge several tallies (oldest first) into a new one"""
+        combined = cls()
+        for tally in tallies:
+            combined.merge(tally)
+        return combined
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def counter(self, name: str) -> Dict[Any, float]:
+        return self.counters.get(name, {})
+
+    def total(self, name: str, default: float = 0) -> float:
+        return self.sums.get(name, default)
+
+    def recent(self, name: str) -> List[Any]:
+        return self.tails.get(name, [])
+
+    def values(self, name: str) -> List[Any]:
+        return self.series.get(name, [])
@@ -19,16 +19,22 @@ import hashlib
 import hmac
 import time
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from flask import Flask, request, jsonify, send_file
+from flask import Flask, request, jsonify, send_file, make_response
 from flask_cors import CORS
 from dotenv import load_dotenv
 from functools import wraps
 
-# Import our modules
-from pdf_generator import PDFGenerator
-from analytics import AnalyticsEngine
-from document_parser import document_parser
+# Import our modules (the heavy ones - pandas, reportlab, OpenCV... - load on first use)
+from analytics import CHART_MODES, TRACKERS
+from analytics.result_cache import AnalyticsCache
+from entry_store import EntryStore
+from lazy import LazyService
+from metrics import RequestMetrics, stage
+from profiling import install_profiler, token_or_local
+from json_provider import install_json_provider
+from compression import ResponseCompressor, RequestDecompressor, request_body_error, etag_variants
 
 # Load environment variables
 load_dotenv()
@@ -39,6 +45,14 @@ logger = logging.getLogger(__name__)
 
 # Initialize Flask app
 app = Flask(__name__)
+logger.info(f"📦 JSON provider: {install_json_provider(app)}")  # orjson when available
+
+# Request/stage metrics at /metrics - registered first so its hook sees final response sizes
+if RequestMetrics.enabled_from_env():
+    RequestMetrics().init_app(app)
+
+# Per-request profiles on demand (PROFILING_ENABLED=true + an X-Profile header); off = not installed
+install_profiler(app)
 
 # Security configuration
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max request size
@@ -72,8 +86,31 @@ MAX_REQUESTS_PER_WINDOW = 50
 failed_attempts = {}  # Track failed PIN attempts per IP
 
 # Initialize our services
-pdf_gen = PDFGenerator()
-analytics = AnalyticsEngine()
+def _load_pdf_generator():
+    from pdf_generator import PDFGenerator
+    return PDFGenerator()
+
+def _load_analytics():
+    from analytics import AnalyticsEngine
+    return AnalyticsEngine()
+
+def _load_document_parser():
+    from document_parser import document_parser
+    return document_parser
+
+pdf_gen = LazyService('PDF generator', _load_pdf_generator)
+analytics = LazyService('analytics engine', _load_analytics)
+document_parser = LazyService('document parser', _load_document_parser)
+analytics_cache = AnalyticsCache.from_env()
+entry_store = EntryStore.from_env(TRACKERS)
+response_compressor = ResponseCompressor.from_env().init_app(app)  # gzip/br/zstd by Accept-Encoding
+app.wsgi_app = RequestDecompressor(app.wsgi_app, app.config['MAX_CONTENT_LENGTH'])  # gzip/br/zstd request bodies
+
+# Fans /api/analytics/batch out across trackers (charts still rasterize in the render pool)
+batch_executor = ThreadPoolExecutor(
+    max_workers=int(os.environ.get('ANALYTICS_BATCH_WORKERS', 6)),
+    thread_name_prefix='analytics-batch'
+)
 
 # ============================================================================
 # SECURITY FUNCTIONS
@@ -103,7 +140,7 @@ def validate_sync_data(data: dict) -> bool:
 
     # Check data size (max 10MB JSON)
     try:
-        json_str = json.dumps(data)
+        json_str = app.json.dumps(data)
         if len(json_str.encode('utf-8')) > 10 * 1024 * 1024:  # 10MB limit
             return False
     except (TypeError, ValueError):
@@ -152,6 +189,12 @@ def require_pin_auth(f):
             logger.warning(f"Rate limit exceeded for IP: {client_ip}")
             return jsonify({'error': 'Too many requests. Please try again later.'}), 429
 
+        # Sync clients on slow links may gzip/br/zstd the body (RequestDecompressor inflates it)
+        body_error = request_body_error(request.environ)
+        if body_error:
+            record_failed_attempt(client_ip)
+            return jsonify({'error': str(body_error)}), body_error.status
+
         # Get request data
         data = request.get_json()
         if not data:
@@ -188,6 +231,88 @@ def require_pin_auth(f):
 
     return decorated_function
 
+def require_admin(f):
+    """
+    Decorator for maintenance endpoints: X-Admin-Token must match ADMIN_TOKEN,
+    or - with no ADMIN_TOKEN set - the request must come from this machine
+    """
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        client_ip = request.environ.get('REMOTE_ADDR', 'unknown')
+
+        if not check_rate_limit(client_ip):
+            logger.warning(f"Rate limit exceeded for IP: {client_ip}")
+            return jsonify({'error': 'Too many requests. Please try again later.'}), 429
+
+        if not token_or_local(request.environ, os.getenv('ADMIN_TOKEN'), 'HTTP_X_ADMIN_TOKEN'):
+            record_failed_attempt(client_ip)
+            logger.warning(f"Admin request refused from {client_ip}")
+            return jsonify({'error': 'Forbidden'}), 403
+
+        return f(*args, **kwargs)
+
+    return decorated_function
+
+def get_chart_mode(data: dict):
+    """Chart delivery mode from ?charts= or the JSON body (inline by default, None if invalid)"""
+    mode = request.args.get('charts') or data.get('charts') or 'inline'
+    return mode if mode in CHART_MODES else None
+
+def invalid_chart_mode_response():
+    return jsonify({'error': f'Invalid charts mode. Supported: {", ".join(CHART_MODES)}'}), 400
+
+def get_date_range(data: dict):
+    """dateRange from the JSON body in days (30 by default, None unless it's a positive whole number)"""
+    date_range = data.get('dateRange', 30)
+    if isinstance(date_range, float) and date_range.is_integer():
+        date_range = int(date_range)
+    if isinstance(date_range, bool) or not isinstance(date_range, int) or date_range < 1:
+        return None
+    return date_range
+
+def invalid_date_range_response():
+    return jsonify({'error': 'dateRange must be a positive whole number of days'}), 400
+
+def run_tracker_analytics(tracker: str, entries: list, date_range: int, chart_mode: str = 'inline') -> dict:
+    """One tracker's analytics, served from the result cache when this exact payload was seen before"""
+    return analytics_cache.get_or_compute(
+        tracker, [entries, date_range, chart_mode],
+        lambda: analytics.analyze(tracker, entries, date_range, chart_mode))
+
+def with_absolute_chart_urls(analytics_data: dict, chart_mode: str) -> dict:
+    """charts='url' paths become absolute backend URLs (without touching the cached result)"""
+    if chart_mode == 'url' and analytics_data.get('charts'):
+        base_url = request.host_url.rstrip('/')
+        analytics_data = {
+            **analytics_data,
+            'charts': {name: f"{base_url}{path}" if path else path
+                       for name, path in analytics_data['charts'].items()}
+        }
+    return analytics_data
+
+def analytics_response(analytics_data: dict, chart_mode: str):
+    """JSON analytics response for a tracker endpoint"""
+    with stage('analytics.serialize'):
+        return jsonify(with_absolute_chart_urls(analytics_data, chart_mode))
+
+# Chart IDs are content hashes, so a chart's bytes never change - let the webview keep them
+CHART_CACHE_CONTROL = 'private, max-age=86400, immutable'
+
+def chart_etag_match(chart_id: str):
+    """
+    The If-None-Match tag showing the client already holds this chart, or None.
+    Compressed responses carry the ID with an -<encoding> suffix, so either form counts.
+    """
+    for etag in etag_variants(chart_id):
+        if request.if_none_match.contains(etag):
+            return etag
+    return None
+
+def with_chart_cache_headers(response, chart_id: str):
+    response.set_etag(chart_id)
+    response.headers['Cache-Control'] = CHART_CACHE_CONTROL
+    return response
+
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
@@ -333,7 +458,9 @@ def get_dashboard_analytics():
         date_range = data.get('dateRange', 30)  # Default 30 days
 
         # Generate analytics
-        dashboard_data = analytics.generate_dashboard(user_data, date_range)
+        dashboard_data = analytics_cache.get_or_compute(
+            'dashboard', [user_data, date_range],
+            lambda: analytics.generate_dashboard(user_data, date_range))
 
         return jsonify(dashboard_data)
 
@@ -352,11 +479,14 @@ def get_dysautonomia_analytics():
 
         entries = data['entries']
         date_range = data.get('dateRange', 30)  # Default 30 days
+        chart_mode = get_chart_mode(data)
+        if chart_mode is None:
+            return invalid_chart_mode_response()
 
         # Generate dysautonomia analytics
-        analytics_data = analytics.analyze_dysautonomia(entries, date_range)
+        analytics_data = run_tracker_analytics('dysautonomia', entries, date_range, chart_mode)
 
-        return jsonify(analytics_data)
+        return analytics_response(analytics_data, chart_mode)
 
     except Exception as e:
         logger.error(f"Dysautonomia analytics error: {str(e)}")
@@ -373,15 +503,18 @@ def get_upper_digestive_analytics():
 
         entries = data['entries']
         date_range = data.get('dateRange', 30)  # Default 30 days
+        chart_mode = get_chart_mode(data)
+        if chart_mode is None:
+            return invalid_chart_mode_response()
 
         logger.info(f"🍽️ Analyzing {len(entries)} digestive entries over {date_range} days")
 
         # Generate upper digestive analytics
-        analytics_data = analytics.analyze_upper_digestive(entries, date_range)
+        analytics_data = run_tracker_analytics('upper-digestive', entries, date_range, chart_mode)
 
         logger.info(f"🎯 Generated digestive analytics with {analytics_data.get('total_episodes', 0)} episodes")
 
-        return jsonify(analytics_data)
+        return analytics_response(analytics_data, chart_mode)
 
     except Exception as e:
         logger.error(f"Upper digestive analytics error: {str(e)}")
@@ -400,6 +533,9 @@ def get_head_pain_analytics():
 
         entries = data['entries']
         date_range = data.get('dateRange', 30)  # Default 30 days
+        chart_mode = get_chart_mode(data)
+        if chart_mode is None:
+            return invalid_chart_mode_response()
 
         logger.info(f"🧠 Processing {len(entries)} head pain entries for {date_range} days")
 
@@ -408,10 +544,10 @@ def get_head_pain_analytics():
             logger.info(f"🧠 Sample entry structure: {list(entries[0].keys()) if entries[0] else 'Empty entry'}")
 
         # Generate head pain analytics
-        analytics_data = analytics.analyze_head_pain(entries, date_range)
+        analytics_data = run_tracker_analytics('head-pain', entries, date_range, chart_mode)
 
         logger.info(f"🧠 Analytics generated successfully")
-        return jsonify(analytics_data)
+        return analytics_response(analytics_data, chart_mode)
 
     except Exception as e:
         logger.error(f"Head pain analytics error: {str(e)}")
@@ -428,13 +564,16 @@ def get_bathroom_analytics():
 
         entries = data['entries']
         date_range = data.get('dateRange', 30)  # Default 30 days
+        chart_mode = get_chart_mode(data)
+        if chart_mode is None:
+            return invalid_chart_mode_response()
 
         logger.info(f"Analyzing {len(entries)} bathroom entries over {date_range} days")
 
         # Generate bathroom analytics
-        analytics_data = analytics.analyze_bathroom(entries, date_range)
+        analytics_data = run_tracker_analytics('bathroom', entries, date_range, chart_mode)
 
-        return jsonify(analytics_data)
+        return analytics_response(analytics_data, chart_mode)
 
     except Exception as e:
         logger.error(f"Bathroom analytics error: {str(e)}")
@@ -451,13 +590,16 @@ def get_pain_analytics():
 
         entries = data['entries']
         date_range = data.get('dateRange', 30)  # Default 30 days
+        chart_mode = get_chart_mode(data)
+        if chart_mode is None:
+            return invalid_chart_mode_response()
 
         logger.info(f"Analyzing {len(entries)} pain entries over {date_range} days")
 
         # Generate pain analytics
-        analytics_data = analytics.analyze_pain(entries, date_range)
+        analytics_data = run_tracker_analytics('pain', entries, date_range, chart_mode)
 
-        return jsonify(analytics_data)
+        return analytics_response(analytics_data, chart_mode)
 
     except Exception as e:
         logger.error(f"Pain analytics error: {str(e)}")
@@ -478,7 +620,7 @@ def get_diabetes_analytics():
         logger.info(f"Analyzing {len(entries)} diabetes entries over {date_range} days")
 
         # Generate diabetes analytics
-        analytics_data = analytics.analyze_diabetes_data(entries, date_range)
+        analytics_data = run_tracker_analytics('diabetes', entries, date_range)
 
         return jsonify(analytics_data)
 
@@ -486,6 +628,262 @@ def get_diabetes_analytics():
         logger.error(f"Diabetes analytics error: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/analytics/batch', methods=['POST'])
+def get_batch_analytics():
+    """
+    Analytics for several trackers in one request 📦
+    Body: {"trackers": {"pain": {"entries": [...], "dateRange": 30}, ...}, "dateRange": 30, "charts": "inline"}
+    Trackers run concurrently; one failing tracker shows up in "errors" without sinking the rest.
+    """
+    try:
+        data = request.get_json()
+
+        if not data or not isinstance(data.get('trackers'), dict) or not data['trackers']:
+            return jsonify({'error': 'Missing trackers'}), 400
+
+        default_range = data.get('dateRange', 30)  # Default 30 days
+        chart_mode = get_chart_mode(data)
+        if chart_mode is None:
+            return invalid_chart_mode_response()
+
+        results, errors, jobs = {}, {}, {}
+        for tracker, payload in data['trackers'].items():
+            if tracker not in analytics.trackers:
+                errors[tracker] = f'Unknown tracker. Supported: {", ".join(analytics.trackers)}'
+            elif not isinstance(payload, dict) or not isinstance(payload.get('entries'), list):
+                errors[tracker] = f'Missing {tracker} entries'
+            else:
+                date_range = payload.get('dateRange', default_range)
+                jobs[tracker] = batch_executor.submit(
+                    run_tracker_analytics, tracker, payload['entries'], date_range, chart_mode)
+
+        logger.info(f"📦 Batch analytics for {len(jobs)} trackers ({len(errors)} rejected)")
+
+        for tracker, job in jobs.items():
+            try:
+                results[tracker] = with_absolute_chart_urls(job.result(), chart_mode)
+            except Exception as e:
+                logger.error(f"Batch {tracker} analytics error: {str(e)}")
+                errors[tracker] = str(e)
+
+        return jsonify({
+            'results': results,
+            'errors': errors,
+            'success': not errors
+        })
+
+    except Exception as e:
+        logger.error(f"Batch analytics error: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/analytics/<tracker>/windows', methods=['POST'])
+def get_window_analytics(tracker):
+    """
+    Analytics for several date ranges in one pass 🪟
+    Body: {"entries": [...], "windows": [7, 30, 90, 365], "charts": "inline"}
+    Returns {"windows": {"7": {...}, "30": {...}}} - each matches /api/analytics/<tracker> with that dateRange.
+    """
+    try:
+        if tracker not in analytics.window_trackers:
+            return jsonify({'error': f'Multi-window analytics not supported for {tracker}. Supported: {", ".join(analytics.window_trackers)}'}), 400
+
+        data = request.get_json()
+        if not data or not isinstance(data.get('entries'), list):
+            return jsonify({'error': f'Missing {tracker} entries'}), 400
+
+        chart_mode = get_chart_mode(data)
+        if chart_mode is None:
+            return invalid_chart_mode_response()
+
+        from analytics.multi_window import DEFAULT_WINDOWS, parse_windows
+
+        entries = data['entries']
+        windows = parse_windows(data.get('windows', DEFAULT_WINDOWS))
+
+        logger.info(f"🪟 Analyzing {len(entries)} {tracker} entries over {windows} days")
+
+        results = analytics_cache.get_or_compute(
+            f'{tracker}:windows', [entries, windows, chart_mode],
+            lambda: analytics.analyze_windows(tracker, entries, windows, chart_mode))
+
+        return jsonify({'windows': {window: with_absolute_chart_urls(result, chart_mode)
+                                    for window, result in results.items()}})
+
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    except Exception as e:
+        logger.error(f"Multi-window {tracker} analytics error: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/analytics/stored/<tracker>', methods=['POST'])
+@require_pin_auth
+def get_stored_analytics(tracker):
+    """
+    Analytics over the entries synced to this server - PIN authenticated 🗄️
+    Body: {"user_pin": "...", "device_id": "...", "dateRange": 30, "charts": "inline"}
+    Only the rows inside the date window are loaded (indexed range scan).
+    """
+    try:
+        if tracker not in entry_store.trackers:
+            return jsonify({'error': f'Unknown tracker. Supported: {", ".join(entry_store.trackers)}'}), 400
+
+        data = request.get_json()
+        chart_mode = get_chart_mode(data)
+        if chart_mode is None:
+            return invalid_chart_mode_response()
+
+        from analytics.date_filter import window_bounds
+
+        date_range = get_date_range(data)
+        if date_range is None:
+            return invalid_date_range_response()
+
+        owner = hash_pin(request.validated_pin)
+        since = window_bounds(date_range)[0].date().isoformat()
+
+        # The store's write counter stands in for the entries in the cache key
+        analytics_data = analytics_cache.get_or_compute(
+            tracker, ['stored', owner, entry_store.version(owner, tracker), date_range, chart_mode],
+            lambda: analytics.analyze(tracker, entry_store.load(owner, tracker, since), date_range, chart_mode))
+
+        return analytics_response(analytics_data, chart_mode)
+
+    except Exception as e:
+        logger.error(f"Stored {tracker} analytics error: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+def get_delta_stream(data: dict):
+    """
+    This user's stream for running analytics (None if invalid): keyed by the
+    hashed PIN, then the client's stream name (default: its device_id)
+    """
+    name = data.get('stream') or request.validated_device_id
+    if not isinstance(name, str) or not sanitize_string(name, 64):
+        return None
+    return f"{hash_pin(request.validated_pin)}:{sanitize_string(name, 64)}"
+
+@app.route('/api/analytics/<tracker>/delta', methods=['POST'])
+@require_pin_auth
+def get_delta_analytics(tracker):
+    """
+    Incremental analytics ➕ - PIN authenticated
+    Body: {"user_pin": "...", "device_id": "...", "stream": "my-phone", "add": [...new or edited entries], "remove": [...entry ids],
+           "dateRange": 30, "charts": "inline", "snapshot": {...optional saved state}}
+    Only the days the delta touches are re-analyzed; the response matches /api/analytics/<tracker>.
+    """
+    try:
+        if tracker not in analytics.accumulators.trackers:
+            return jsonify({'error': f'Delta analytics not supported for {tracker}. Supported: {", ".join(analytics.accumulators.trackers)}'}), 400
+
+        data = request.get_json()
+        if not isinstance(data, dict):
+            return jsonify({'error': 'Invalid request format'}), 400
+
+        add = data.get('add', [])
+        remove = data.get('remove', [])
+        if not isinstance(add, list) or not all(isinstance(entry, dict) for entry in add) or not isinstance(remove, list):
+            return jsonify({'error': 'add must be a list of entries and remove a list of entry ids'}), 400
+
+        stream = get_delta_stream(data)
+        if not stream:
+            return jsonify({'error': 'Invalid stream'}), 400
+
+        chart_mode = get_chart_mode(data)
+        if chart_mode is None:
+            return invalid_chart_mode_response()
+
+        date_range = get_date_range(data)
+        if date_range is None:
+            return invalid_date_range_response()
+
+        logger.info(f"➕ Delta {tracker} analytics: +{len(add)} -{len(remove)} entries")
+
+        analytics_data = analytics.analyze_delta(tracker, stream, add, remove, date_range,
+                                                 chart_mode, data.get('snapshot'))
+
+        return analytics_response(analytics_data, chart_mode)
+
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    except Exception as e:
+        logger.error(f"Delta {tracker} analytics error: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/analytics/<tracker>/snapshot', methods=['POST'])
+@require_pin_auth
+def get_delta_snapshot(tracker):
+    """
+    Saved state of a stream's running analytics (send it back as "snapshot" to resume) - PIN authenticated
+    Body: {"user_pin": "...", "device_id": "...", "stream": "my-phone"}
+    """
+    if tracker not in analytics.accumulators.trackers:
+        return jsonify({'error': f'Delta analytics not supported for {tracker}'}), 400
+
+    stream = get_delta_stream(request.get_json())
+    if not stream:
+        return jsonify({'error': 'Invalid stream'}), 400
+
+    return jsonify(analytics.delta_snapshot(tracker, stream))
+
+@app.route('/api/charts/<chart_id>', methods=['GET'])
+def get_chart(chart_id):
+    """Render a deferred chart on demand (cached after the first render) 🖼️"""
+    try:
+        etag = chart_etag_match(chart_id)
+        if etag:
+            # Echo the tag the client holds so its cached copy stays current
+            return with_chart_cache_headers(make_response('', 304), etag)
+
+        image = analytics.render_chart(chart_id)
+        if image is None:
+            return jsonify({'error': 'Chart not found or expired - re-request the analytics'}), 404
+
+        return with_chart_cache_headers(jsonify({'id': chart_id, 'image': image}), chart_id)
+
+    except Exception as e:
+        logger.error(f"Chart render error: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/charts/<chart_id>.png', methods=['GET'])
+def get_chart_png(chart_id):
+    """Serve a chart as raw PNG bytes - no base64, cacheable by the webview 🖼️"""
+    try:
+        # Same ID means same bytes, so a matching ETag never needs a render
+        etag = chart_etag_match(chart_id)
+        if etag:
+            # Echo the tag the client holds so its cached copy stays current
+            return with_chart_cache_headers(make_response('', 304), etag)
+
+        png = analytics.render_chart_png(chart_id)
+        if png is None:
+            return jsonify({'error': 'Chart not found or expired - re-request the analytics'}), 404
+
+        response = make_response(png)
+        response.headers['Content-Type'] = 'image/png'
+        return with_chart_cache_headers(response, chart_id)
+
+    except Exception as e:
+        logger.error(f"Chart render error: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/analytics/cache', methods=['GET'])
+def get_analytics_cache_stats():
+    """Analytics result cache hit/miss stats 🗃️"""
+    return jsonify({**analytics_cache.stats(), 'charts': analytics.chart_store.stats(),
+                    'accumulators': analytics.accumulators.stats(),
+                    'compression': response_compressor.stats()})
+
+@app.route('/api/analytics/cache', methods=['DELETE'])
+@require_admin
+def invalidate_analytics_cache():
+    """Drop cached analytics results (all, or one tracker via ?tracker=pain)"""
+    tracker = request.args.get('tracker')
+    removed = analytics_cache.invalidate(tracker)
+    logger.info(f"🗃️ Invalidated {removed} cached analytics results ({tracker or 'all trackers'})")
+    return jsonify({'success': True, 'removed': removed, 'stats': analytics_cache.stats()})
+
 @app.route('/api/sync/phone-home', methods=['POST'])
 @require_pin_auth
 def phone_home_sync():
@@ -497,7 +895,7 @@ def phone_home_sync():
 
         # Get additional request data
         data = request.get_json()
-        sync_data = data.get('data', {})
+        sync_data = data.get('data') or {}
         action = sanitize_string(data.get('action', 'sync'), 20)
         timestamp = data.get('timestamp', datetime.now().isoformat())
 
@@ -513,32 +911,50 @@ def phone_home_sync():
         logger.info(f"🔐 Authenticated {action} request from device {device_id[:8]}... for user PIN {user_pin[:2]}***")
 
         # Handle different sync actions
+        owner = hash_pin(user_pin)
+
         if action == 'sync':
-            # Merge data from phone
+            # Merge data from phone: {"data": {tracker: [entries]}, "deleted": {tracker: [ids]}}
+            # Entries are stored per PIN identity; the newest write of an entry ID wins.
+            # Keys that aren't analytics trackers (meds, notes...) still sync fine - they're
+            # just not stored here, and come back under 'ignored'
+            deleted = data.get('deleted')
+            if not isinstance(deleted, dict):
+                deleted = {}
+
+            stored = {tracker: entry_store.upsert(owner, tracker, entries)
+                      for tracker, entries in sync_data.items()
+                      if tracker in entry_store.trackers and isinstance(entries, list)}
+            removed = {tracker: entry_store.delete(owner, tracker, ids)
+                       for tracker, ids in deleted.items()
+                       if tracker in entry_store.trackers and isinstance(ids, list)}
+            ignored = sorted({key for key in list(sync_data) + list(deleted) if key not in entry_store.trackers})
+
             result = {
                 'status': 'synced',
                 'conflicts': [],
+                'stored': stored,
+                'removed': removed,
+                'ignored': ignored,
                 'server_timestamp': datetime.now().isoformat(),
-                'user_pin_hash': hash_pin(user_pin)[:8]  # First 8 chars for verification
+                'user_pin_hash': owner[:8]  # First 8 chars for verification
             }
-            # TODO: Implement actual sync logic with PIN-based database isolation
 
         elif action == 'pull':
             # Send latest data to phone
             result = {
                 'status': 'data_sent',
-                'data': {},
+                'data': entry_store.export(owner),
                 'server_timestamp': datetime.now().isoformat(),
-                'user_pin_hash': hash_pin(user_pin)[:8]  # First 8 chars for verification
+                'user_pin_hash': owner[:8]  # First 8 chars for verification
             }
-            # TODO: Implement data pull logic with PIN-based database isolation
 
         elif action == 'ping':
             # Simple connectivity test
             result = {
                 'status': 'pong',
                 'server_timestamp': datetime.now().isoformat(),
-                'user_pin_hash': hash_pin(user_pin)[:8]
+                'user_pin_hash': owner[:8]
             }
 
         else:
@@ -593,7 +1009,7 @@ def internal_error(error):
     return jsonify({'error': 'Internal server error'}), 500
 
 if __name__ == '__main__':
-    # Development server
+    # Development server - production runs through serve.py (gunicorn/waitress, see wsgi.py)
     port = int(os.environ.get('FLASK_PORT', 5000))
     debug = os.environ.get('FLASK_DEBUG', 'True').lower() == 'true'
     
@@ -0,0 +1,263 @@
+"""
+Copyright (c) 2025 Chaos Cascade
+Created by: Ren & Ace (Claude-4)
+
+This file is part of the Chaos Cascade Medical Management System.
+Revolutionary healthcare tools built with consciousness and care.
+"""
+
+#!/usr/bin/env python3
+"""
+📊 ANALYTICS BENCHMARK
+Time and peak memory of every AnalyticsEngine.analyze_* method, per size.
+
+Synthetic entries (benchmarks/tracker_data.py) at each size are run through
+the per-tracker methods (analyze_pain, analyze_bathroom, ...) and
+analyze_windows, once with charts='spec' (no rendering) and once with
+charts='inline' (every chart drawn by the render pool, image cache cleared
+between runs so each run really draws). Wall time is the median of
+--repeat runs; peak memory comes from one extra run under tracemalloc
+(NumPy and pandas buffers included), kept apart so tracing doesn't skew
+the timings. Charts are drawn in the render pool's processes, so the peak
+is this process's share only. Calls go straight to the engine (no result
+cache), with analyzer prints and matplotlib warnings silenced.
+
+Results go to benchmarks/results/<timestamp>-<commit>.json with the commit,
+Python and library versions; --compare OLD.json prints the change per case.
+
+    python benchmarks/analytics_bench.py                        # 1k, 100k, 1M
+    python benchmarks/analytics_bench.py --sizes 1000,10000 --trackers pain,bathroom
+    python benchmarks/analytics_bench.py --compare benchmarks/results/<earlier>.json
+"""
+
+import os
+import sys
+import gc
+import json
+import time
+import argparse
+import platform
+import statistics
+import subprocess
+import warnings
+import contextlib
+import tracemalloc
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, BACKEND_DIR)
+
+from tracker_data import GENERATORS, DEFAULT_DAYS, generate  # noqa: E402
+
+DEFAULT_SIZES = '1000,100000,1000000'
+DEFAULT_RESULTS_DIR = os.path.join(BENCH_DIR, 'results')
+CHART_MODES = ('spec', 'inline')
+
+# Tracker -> engine method name (the public per-tracker entry points)
+METHODS = {
+    'pain': 'analyze_pain',
+    'bathroom': 'analyze_bathroom',
+    'dysautonomia': 'analyze_dysautonomia',
+    'diabetes': 'analyze_diabetes_data',
+    'head-pain': 'analyze_head_pain',
+    'upper-digestive': 'analyze_upper_digestive',
+}
+
+
+def _commit() -> Optional[str]:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=BACKEND_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _environment() -> Dict[str, Any]:
+    import numpy
+    import pandas
+    return {
+        'commit': _commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'numpy': numpy.__version__,
+        'pandas': pandas.__version__,
+        'chart_render_workers': os.getenv('CHART_RENDER_WORKERS'),
+    }
+
+
+def _cases(engine, tracker: str, date_range: int, chart_modes: List[str]) -> Dict[str, tuple]:
+    """Benchmark name -> (call(entries, charts), chart modes to run) for one tracker"""
+    method_name = METHODS[tracker]
+    method = getattr(engine, method_name)
+    cases = {}
+    if method_name == 'analyze_diabetes_data':
+        # No chart option: it always runs as the engine's default (inline)
+        cases[method_name] = (lambda entries, charts: method(entries, date_range), ['inline'])
+    else:
+        cases[method_name] = (lambda entries, charts: method(entries, date_range, charts), chart_modes)
+    if tracker in engine.window_trackers:
+        cases['analyze_windows'] = (
+            lambda entries, charts: engine.analyze_windows(tracker, entries, charts=charts), chart_modes)
+    return cases
+
+
+_DEVNULL = open(os.devnull, 'w')
+
+
+def _quiet():
+    return contextlib.redirect_stdout(_DEVNULL)
+
+
+def _silenced(call: Callable[[], Any]) -> Callable[[], Any]:
+    def run():
+        with _quiet():
+            return call()
+    return run
+
+
+def _time(call: Callable[[], Any], repeat: int, reset: Callable[[], None]) -> Dict[str, float]:
+    timings = []
+    for _ in range(repeat):
+        reset()
+        gc.collect()
+        started = time.perf_counter()
+        call()
+        timings.append(time.perf_counter() - started)
+    return {'median_s': statistics.median(timings), 'min_s': min(timings), 'max_s': max(timings)}
+
+
+def _peak_memory(call: Callable[[], Any], reset: Callable[[], None]) -> int:
+    reset()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        call()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run(sizes: List[int], trackers: List[str], chart_modes: List[str], repeat: int, seed: int,
+        days: int, date_range: int, memory: bool = True, log: Callable[[str], None] = print) -> List[Dict[str, Any]]:
+    """Run every case; returns one row per (tracker, method, size, charts)"""
+    from analytics import AnalyticsEngine
+    from analytics.render_pool import PRODUCTION_WORKERS
+
+    # Render inline charts in a pool the way production (wsgi.py) does
+    os.environ.setdefault('CHART_RENDER_WORKERS', str(PRODUCTION_WORKERS))
+
+    # Inherited by the render pool's (spawned) processes too
+    os.environ.setdefault('PYTHONWARNINGS', 'ignore::UserWarning')
+    warnings.simplefilter('ignore', UserWarning)
+
+    engine = AnalyticsEngine()
+    reset = engine.chart_store.images.invalidate
+    # Start the render pool (and its warm-up render) outside the timed runs
+    engine.chart_store.pool.start()
+
+    rows = []
+    for size in sizes:
+        for tracker in trackers:
+            started = time.perf_counter()
+            entries = generate(tracker, size, seed=seed, days=days)
+            log(f"  {tracker} x {size:,}: generated in {time.perf_counter() - started:.1f}s")
+
+            for name, (case, modes) in _cases(engine, tracker, date_range, chart_modes).items():
+                # Warm-up: first-call imports, analyzer caches, matplotlib first draw
+                with _quiet():
+                    case(entries[:100], 'inline')
+                for charts in modes:
+                    call = _silenced(lambda: case(entries, charts))
+                    row = {'tracker': tracker, 'method': name, 'size': size, 'charts': charts,
+                           **_time(call, repeat, reset)}
+                    if memory:
+                        row['peak_bytes'] = _peak_memory(call, reset)
+                    row['entries_per_s'] = size / row['median_s'] if row['median_s'] else None
+                    rows.append(row)
+                    peak = f", peak {row['peak_bytes'] / 2**20:,.1f} MiB" if memory else ''
+                    log(f"    {name:<24} charts={charts:<6} {row['median_s'] * 1000:>10.1f} ms{peak}")
+            del entries
+            gc.collect()
+    return rows
+
+
+def _key(row: Dict[str, Any]) -> tuple:
+    return row['tracker'], row['method'], row['size'], row['charts']
+
+
+def compare(current: List[Dict[str, Any]], previous: Dict[str, Any]) -> List[str]:
+    """Lines describing time/memory change per case against an earlier results file"""
+    before = {_key(row): row for row in previous.get('results', [])}
+    commit = previous.get('environment', {}).get('commit') or 'previous'
+    lines = [f"\n🔁 Against {commit} ({previous.get('created_at', '?')})"]
+    for row in current:
+        old = before.get(_key(row))
+        if not old:
+            continue
+        time_change = row['median_s'] / old['median_s'] - 1 if old['median_s'] else 0.0
+        line = (f"  {row['tracker']:<16} {row['method']:<24} {row['size']:>9,} {row['charts']:<6}"
+                f" {old['median_s'] * 1000:>10.1f} -> {row['median_s'] * 1000:>10.1f} ms ({time_change:+.0%})")
+        if row.get('peak_bytes') and old.get('peak_bytes'):
+            line += f"   memory {row['peak_bytes'] / old['peak_bytes'] - 1:+.0%}"
+        lines.append(line)
+    if len(lines) == 1:
+        lines.append('  (no cases in common)')
+    return lines
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='AnalyticsEngine benchmark suite')
+    parser.add_argument('--sizes', default=DEFAULT_SIZES, help=f'entry counts (default {DEFAULT_SIZES})')
+    parser.add_argument('--trackers', default=','.join(METHODS), help='comma-separated trackers (default all)')
+    parser.add_argument('--charts', default=','.join(CHART_MODES), help='chart modes to run (default spec,inline)')
+    parser.add_argument('--repeat', type=int, default=3, help='timed runs per case (default 3)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--days', type=int, default=DEFAULT_DAYS, help='span of the generated dates')
+    parser.add_argument('--date-range', type=int, default=None, help='analytics date range (default: --days)')
+    parser.add_argument('--no-memory', action='store_true', help='skip the tracemalloc runs')
+    parser.add_argument('--output', help='results file (default benchmarks/results/<time>-<commit>.json)')
+    parser.add_argument('--compare', help='earlier results file to compare against')
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(',') if size]
+    trackers = [tracker for tracker in args.trackers.split(',') if tracker]
+    chart_modes = [mode for mode in args.charts.split(',') if mode]
+    for tracker in trackers:
+        if tracker not in GENERATORS:
+            parser.error(f"unknown tracker '{tracker}'")
+    for mode in chart_modes:
+        if mode not in CHART_MODES:
+            parser.error(f"unknown chart mode '{mode}' (use {', '.join(CHART_MODES)})")
+
+    environment = _environment()
+    print(f"📊 Analytics benchmark @ {environment['commit'] or 'unknown commit'} "
+          f"(python {environment['python']}, {environment['cpus']} CPUs)")
+    results = run(sizes, trackers, chart_modes, max(1, args.repeat), args.seed, args.days,
+                  args.date_range or args.days, memory=not args.no_memory)
+
+    created_at = datetime.now()
+    output = args.output or os.path.join(
+        DEFAULT_RESULTS_DIR, f"{created_at:%Y%m%d-%H%M%S}-{environment['commit'] or 'nocommit'}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    document = {
+        'created_at': created_at.isoformat(timespec='seconds'),
+        'environment': environment,
+        'settings': {'sizes': sizes, 'trackers': trackers, 'charts': chart_modes, 'repeat': args.repeat,
+                     'seed': args.seed, 'days': args.days, 'date_range': args.date_range or args.days},
+        'results': results,
+    }
+    with open(output, 'w') as handle:
+        json.dump(document, handle, indent=2)
+    print(f"\n💾 Saved {len(results)} results to {output}")
+
+    if args.compare:
+        with open(args.compare) as handle:
+            print('\n'.join(compare(results, json.load(handle))))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,385 @@
+"""
+Copyright (c) 2025 Chaos Cascade
+Created by: Ren & Ace (Claude-4)
+
+This file is part of the Chaos Cascade Medical Management System.
+Revolutionary healthcare tools built with consciousness and care.
+"""
+
+#!/usr/bin/env python3
+"""
+🚦 LOAD TEST
+Replays a realistic traffic mix against a running backend.
+
+The mix, by default:
+
+    analytics  60%  POST /api/analytics/<tracker>, histories of 30 to 10,000
+                    entries (mostly small, the way real users are)
+    sync       25%  phone-home ping / pull / sync, each virtual user with its
+                    own PIN and device
+    pdf        10%  POST /api/pdf/generate (health summary, weekly review)
+    upload      5%  POST /api/documents/parse with a text document
+
+Request bodies are built up front from seeded synthetic data
+(tracker_data.py, sample_documents.py), so the generator isn't what's being
+measured. --variants sets how many different bodies each analytics
+(tracker, size) pair has: fewer variants means more result-cache hits,
+which makes the cost of a cache change visible.
+
+Each of --concurrency threads keeps one keep-alive connection and sends
+requests back to back (closed loop) for --duration seconds after
+--warmup. The report gives per-route throughput, latency percentiles
+and error rate; --json saves it for comparing serving setups.
+
+    python benchmarks/load_test.py --start                 # serve.py on a free port
+    python benchmarks/load_test.py --start dev             # python app.py instead
+    python benchmarks/load_test.py --url http://127.0.0.1:5000 --concurrency 16 --duration 60
+    python benchmarks/load_test.py --start --mix analytics=1 --variants 1 --json cached.json
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import socket
+import tempfile
+import argparse
+import threading
+import subprocess
+import http.client
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.dirname(BENCH_DIR)
+
+from tracker_data import GENERATORS, generate  # noqa: E402
+from sample_documents import generate_document  # noqa: E402
+
+DEFAULT_MIX = 'analytics=60,sync=25,pdf=10,upload=5'
+# History size -> share of analytics requests (most users have months, a few have years)
+HISTORY_SIZES = {30: 40, 365: 35, 2000: 20, 10000: 5}
+SYNC_ACTIONS = {'ping': 50, 'pull': 25, 'sync': 25}
+UPLOAD_PAGES = {5: 60, 20: 30, 50: 10}
+PERCENTILES = (50, 90, 95, 99)
+STARTUP_TIMEOUT = 120
+
+# One planned request: (route label, method, path, body, headers)
+Request = Tuple[str, str, str, Optional[bytes], Dict[str, str]]
+
+JSON_HEADERS = {'Content-Type': 'application/json', 'Accept-Encoding': 'gzip'}
+
+
+def _json(value: Any) -> bytes:
+    return json.dumps(value, separators=(',', ':')).encode('utf-8')
+
+
+def _weighted(rng: random.Random, weights: Dict[Any, float]) -> Any:
+    return rng.choices(list(weights), weights=list(weights.values()))[0]
+
+
+# ----------------------------------------------------------------------
+# Traffic
+# ----------------------------------------------------------------------
+
+class TrafficMix:
+    """Pre-built request bodies and the weights to draw from them"""
+
+    def __init__(self, mix: Dict[str, float], variants: int, charts: str, seed: int):
+        self.mix = {name: weight for name, weight in mix.items() if weight > 0}
+        self.charts = charts
+        self.analytics: Dict[Tuple[str, int], List[bytes]] = {}
+        self.uploads: Dict[int, Tuple[str, bytes]] = {}
+        self.pdfs: List[bytes] = []
+        self.sync_entries: List[List[Dict[str, Any]]] = []
+
+        if 'analytics' in self.mix:
+            for tracker in GENERATORS:
+                for size in HISTORY_SIZES:
+                    self.analytics[tracker, size] = [
+                        _json({'entries': generate(tracker, size, seed=seed * 1000 + variant,
+                                                   days=max(30, size // 10)),
+                               'dateRange': 30})
+                        for variant in range(max(1, variants))
+                    ]
+        if 'upload' in self.mix:
+            for pages in UPLOAD_PAGES:
+                self.uploads[pages] = (f'records-{pages}p.txt',
+                                       generate_document('records', pages, seed).encode('utf-8'))
+        if 'pdf' in self.mix:
+            rng = random.Random(seed)
+            for report_type in ('health_summary', 'weekly_review'):
+                self.pdfs.append(_json({'type': report_type, 'data': {
+                    'dateRange': 'Last 30 days',
+                    'metrics': [{'name': name, 'average': round(rng.uniform(1, 10), 1),
+                                 'trend': rng.choice(['↑', '↓', '→']), 'notes': ''}
+                                for name in ('Pain', 'Fatigue', 'Sleep', 'Mood', 'Heart rate')],
+                    'insights': ['Pain is higher on Mondays', 'Sleep improved this week'],
+                    'weekInfo': {'startDate': datetime.now().strftime('%Y-%m-%d')},
+                }}))
+        if 'sync' in self.mix:
+            self.sync_entries = [generate('pain', 20, seed=seed * 1000 + batch, days=7) for batch in range(8)]
+
+    def next_request(self, rng: random.Random, user: int) -> Request:
+        kind = _weighted(rng, self.mix)
+        if kind == 'analytics':
+            tracker = rng.choice(list(GENERATORS))
+            size = _weighted(rng, HISTORY_SIZES)
+            body = rng.choice(self.analytics[tracker, size])
+            return (f'analytics {tracker}', 'POST', f'/api/analytics/{tracker}?charts={self.charts}',
+                    body, JSON_HEADERS)
+        if kind == 'sync':
+            action = _weighted(rng, SYNC_ACTIONS)
+            payload = {'user_pin': f'load{user:04d}', 'device_id': f'load-device-{user:04d}', 'action': action}
+            if action == 'sync':
+                payload['data'] = {'pain': rng.choice(self.sync_entries)}
+            return f'sync {action}', 'POST', '/api/sync/phone-home', _json(payload), JSON_HEADERS
+        if kind == 'pdf':
+            return 'pdf generate', 'POST', '/api/pdf/generate', rng.choice(self.pdfs), JSON_HEADERS
+        if kind == 'upload':
+            filename, document = self.uploads[_weighted(rng, UPLOAD_PAGES)]
+            boundary = f'chaos{rng.getrandbits(64):016x}'
+            body = (f'--{boundary}\r\nContent-Disposition: form-data; name="file"; filename="{filename}"\r\n'
+                    f'Content-Type: text/plain\r\n\r\n').encode('utf-8') + document + f'\r\n--{boundary}--\r\n'.encode()
+            return ('document parse', 'POST', '/api/documents/parse', body,
+                    {'Content-Type': f'multipart/form-data; boundary={boundary}'})
+        raise ValueError(f"Unknown traffic kind '{kind}'")
+
+
+# ----------------------------------------------------------------------
+# Running
+# ----------------------------------------------------------------------
+
+class Recorder:
+    """Latencies, statuses and sizes per route (thread-safe)"""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self.bytes: Dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def record(self, route: str, seconds: float, status: Optional[int], size: int, error: Optional[str]) -> None:
+        with self._lock:
+            self.latencies[route].append(seconds)
+            self.bytes[route] += size
+            if error is not None:
+                self.errors[route][error] += 1
+            elif status >= 400:
+                self.errors[route][str(status)] += 1
+
+
+def _worker(base: Tuple[str, int], mix: TrafficMix, recorder: Recorder, user: int, seed: int,
+            measure_from: float, stop_at: float, max_requests: Optional[threading.Semaphore]) -> None:
+    rng = random.Random(seed * 7919 + user)
+    host, port = base
+    connection = http.client.HTTPConnection(host, port, timeout=300)
+    while time.perf_counter() < stop_at:
+        if max_requests is not None and not max_requests.acquire(blocking=False):
+            break
+        route, method, path, body, headers = mix.next_request(rng, user)
+        started = time.perf_counter()
+        status, size, error = None, 0, None
+        try:
+            connection.request(method, path, body=body, headers=headers)
+            response = connection.getresponse()
+            size = len(response.read())
+            status = response.status
+        except (OSError, http.client.HTTPException) as e:
+            error = type(e).__name__
+            connection.close()
+            connection = http.client.HTTPConnection(host, port, timeout=300)
+        if started >= measure_from:
+            recorder.record(route, time.perf_counter() - started, status, size, error)
+    connection.close()
+
+
+def run_load(base: Tuple[str, int], mix: TrafficMix, concurrency: int, duration: float, warmup: float,
+             seed: int, total_requests: Optional[int] = None) -> Tuple[Recorder, float]:
+    """Drive the server; returns the recorder and the measured wall time"""
+    recorder = Recorder()
+    started = time.perf_counter()
+    measure_from = started + warmup
+    stop_at = measure_from + duration
+    budget = threading.Semaphore(total_requests) if total_requests else None
+    threads = [threading.Thread(target=_worker, name=f'load-{user}', daemon=True,
+                                args=(base, mix, recorder, user, seed, measure_from, stop_at, budget))
+               for user in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return recorder, max(1e-9, time.perf_counter() - max(measure_from, started))
+
+
+def _percentile(ordered: List[float], percent: float) -> float:
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, round(percent / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def _route_summary(latencies: List[float], errors: Dict[str, int], size: int, wall: float) -> Dict[str, Any]:
+    ordered = sorted(latencies)
+    failed = sum(errors.values())
+    return {
+        'requests': len(ordered),
+        'throughput_rps': round(len(ordered) / wall, 2),
+        'errors': failed,
+        'error_rate': round(failed / len(ordered), 4) if ordered else 0.0,
+        'error_kinds': dict(errors),
+        'latency_ms': {
+            'mean': round(sum(ordered) / len(ordered) * 1000, 1) if ordered else 0.0,
+            **{f'p{percent}': round(_percentile(ordered, percent) * 1000, 1) for percent in PERCENTILES},
+            'max': round(ordered[-1] * 1000, 1) if ordered else 0.0,
+        },
+        'mean_response_bytes': round(size / len(ordered)) if ordered else 0,
+    }
+
+
+def summarize(recorder: Recorder, wall: float) -> Dict[str, Any]:
+    routes = {route: _route_summary(latencies, recorder.errors.get(route, {}), recorder.bytes[route], wall)
+              for route, latencies in sorted(recorder.latencies.items())}
+    every = [latency for latencies in recorder.latencies.values() for latency in latencies]
+    all_errors: Dict[str, int] = defaultdict(int)
+    for errors in recorder.errors.values():
+        for kind, count in errors.items():
+            all_errors[kind] += count
+    return {'wall_seconds': round(wall, 2), 'routes': routes,
+            'total': _route_summary(every, all_errors, sum(recorder.bytes.values()), wall)}
+
+
+def print_report(summary: Dict[str, Any]) -> None:
+    header = f"  {'route':<26}{'reqs':>7}{'rps':>9}{'err%':>7}" + ''.join(
+        f"{f'p{percent}':>9}" for percent in PERCENTILES) + f"{'max':>9}"
+    print(f"\n🚦 {summary['wall_seconds']}s measured (latencies in ms)")
+    print(header)
+    rows = [*summary['routes'].items(), ('TOTAL', summary['total'])]
+    for route, stats in rows:
+        latency = stats['latency_ms']
+        print(f"  {route:<26}{stats['requests']:>7}{stats['throughput_rps']:>9.1f}{stats['error_rate'] * 100:>7.1f}"
+              + ''.join(f"{latency[f'p{percent}']:>9.1f}" for percent in PERCENTILES) + f"{latency['max']:>9.1f}")
+    for route, stats in summary['routes'].items():
+        if stats['error_kinds']:
+            print(f"  ⚠️  {route}: {stats['error_kinds']}")
+
+
+# ----------------------------------------------------------------------
+# Local server
+# ----------------------------------------------------------------------
+
+def _free_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(('127.0.0.1', 0))
+        return probe.getsockname()[1]
+
+
+def start_server(kind: str, port: int, log_path: str) -> subprocess.Popen:
+    """serve.py (production setup) or app.py (dev server) on 127.0.0.1:port, once /health answers"""
+    # Load-test sync writes go to a throwaway entry store, not backend/data
+    env = {**os.environ, 'FLASK_HOST': '127.0.0.1', 'FLASK_PORT': str(port), 'FLASK_DEBUG': 'false',
+           'ENTRY_STORE_PATH': os.path.join(os.path.dirname(log_path), 'entries.db')}
+    script = 'serve.py' if kind == 'serve' else 'app.py'
+    log = open(log_path, 'w')
+    process = subprocess.Popen([sys.executable, script], cwd=BACKEND_DIR, env=env,
+                               stdout=log, stderr=subprocess.STDOUT)
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f'{script} exited with {process.returncode} (see {log_path})')
+        try:
+            connection = http.client.HTTPConnection('127.0.0.1', port, timeout=2)
+            connection.request('GET', '/health')
+            if connection.getresponse().status == 200:
+                connection.close()
+                return process
+        except (OSError, http.client.HTTPException):
+            time.sleep(0.25)
+    process.terminate()
+    raise RuntimeError(f'{script} did not answer /health within {STARTUP_TIMEOUT}s (see {log_path})')
+
+
+def stop_server(process: subprocess.Popen) -> None:
+    process.terminate()
+    try:
+        process.wait(timeout=30)
+    except subprocess.TimeoutExpired:
+        process.kill()
+
+
+def _parse_mix(text: str) -> Dict[str, float]:
+    mix = {}
+    for part in text.split(','):
+        name, _, weight = part.partition('=')
+        if name.strip() not in ('analytics', 'sync', 'pdf', 'upload'):
+            raise argparse.ArgumentTypeError(f"unknown traffic kind '{name}' (analytics, sync, pdf, upload)")
+        mix[name.strip()] = float(weight or 1)
+    return mix
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Load test the backend with a realistic traffic mix')
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument('--url', default='http://127.0.0.1:5000', help='running backend (default :5000)')
+    target.add_argument('--start', nargs='?', const='serve', choices=['serve', 'dev'],
+                        help='start a local server first: serve.py (default) or the dev server')
+    parser.add_argument('--concurrency', type=int, default=8, help='simultaneous clients (default 8)')
+    parser.add_argument('--duration', type=float, default=30, help='measured seconds (default 30)')
+    parser.add_argument('--warmup', type=float, default=5, help='unmeasured seconds first (default 5)')
+    parser.add_argument('--requests', type=int, help='stop after this many requests instead')
+    parser.add_argument('--mix', type=_parse_mix, default=_parse_mix(DEFAULT_MIX),
+                        help=f'traffic weights (default {DEFAULT_MIX})')
+    parser.add_argument('--variants', type=int, default=4, help='distinct bodies per analytics case (default 4)')
+    parser.add_argument('--charts', default='inline', help='analytics chart mode (default inline)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', help='write the summary to this file')
+    parser.add_argument('--max-error-rate', type=float, help='exit 1 if the overall error rate is higher')
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    mix = TrafficMix(args.mix, args.variants, args.charts, args.seed)
+    print(f"🧪 Built request bodies in {time.perf_counter() - started:.1f}s")
+
+    server = None
+    if args.start:
+        port = _free_port()
+        log_path = os.path.join(tempfile.mkdtemp(prefix='chaos-load-'), 'server.log')
+        print(f"🚀 Starting {'serve.py' if args.start == 'serve' else 'app.py'} on 127.0.0.1:{port} (log: {log_path})")
+        server = start_server(args.start, port, log_path)
+        base = ('127.0.0.1', port)
+    else:
+        parts = urlsplit(args.url)
+        base = (parts.hostname or '127.0.0.1', parts.port or 80)
+
+    try:
+        print(f"🚦 {args.concurrency} clients, mix {args.mix}, "
+              f"{args.warmup:.0f}s warmup + {args.duration:.0f}s against {base[0]}:{base[1]}")
+        recorder, wall = run_load(base, mix, max(1, args.concurrency), args.duration, args.warmup,
+                                  args.seed, args.requests)
+    finally:
+        if server is not None:
+            stop_server(server)
+
+    summary = summarize(recorder, wall)
+    print_report(summary)
+
+    if args.json:
+        with open(args.json, 'w') as handle:
+            json.dump({'created_at': datetime.now().isoformat(timespec='seconds'),
+                       'settings': {'target': args.start or args.url, 'concurrency': args.concurrency,
+                                    'duration': args.duration, 'warmup': args.warmup, 'mix': args.mix,
+                                    'variants': args.variants, 'charts': args.charts, 'seed': args.seed},
+                       **summary}, handle, indent=2)
+        print(f"\n💾 Saved to {args.json}")
+
+    if args.max_error_rate is not None and summary['total']['error_rate'] > args.max_error_rate:
+        print(f"\n❌ Error rate {summary['total']['error_rate']:.1%} is over {args.max_error_rate:.1%}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,283 @@
+"""
+Copyright (c) 2025 Chaos Cascade
+Created by: Ren & Ace (Claude-4)
+
+This file is part of the Chaos Cascade Medical Management System.
+Revolutionary healthcare tools built with consciousness and care.
+"""
+
+#!/usr/bin/env python3
+"""
+🧠 MEMORY FOOTPRINT CHECK
+Peak and retained memory per analytics endpoint and document parse,
+checked against committed budgets.
+
+A JSON body turns into dicts, then columns, then matplotlib buffers, then
+base64 strings and the response bytes, so a request's peak is several times
+its payload. Each case here runs once untraced (imports, first-draw and
+analyzer caches out of the way), then once under tracemalloc:
+
+    peak      highest traced memory during the request
+    retained  still allocated afterwards, with the result/chart caches
+              emptied - growth here is a leak, not a cache
+
+Analytics cases go through the Flask test client (JSON decode, analysis,
+inline charts, serialization). Charts are drawn in-process
+(CHART_RENDER_WORKERS=0) so their buffers are counted. Document cases call
+RevolutionaryDocumentParser.parse_medical_events on synthetic records
+(benchmarks/sample_documents.py). Inputs are seeded.
+
+Budgets live in benchmarks/memory_budgets.json. A case over its peak or
+retained budget fails the run (exit 1). After an intended change, refresh
+them with --update, which records measured values plus headroom. Numbers
+depend on the Python/NumPy/pandas versions, so refresh budgets when those
+change too.
+
+    python benchmarks/memory_check.py
+    python benchmarks/memory_check.py --cases analytics:pain,parse:records-200
+    python benchmarks/memory_check.py --update
+"""
+
+import os
+import sys
+import gc
+import json
+import time
+import logging
+import argparse
+import warnings
+import contextlib
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, BACKEND_DIR)
+
+# Before app (and the render pool) is imported: draw charts in this process
+os.environ['CHART_RENDER_WORKERS'] = '0'
+os.environ.setdefault('PROFILING_ENABLED', 'false')
+
+from tracker_data import generate, generate_all  # noqa: E402
+from sample_documents import generate_document  # noqa: E402
+
+BUDGETS_PATH = os.path.join(BENCH_DIR, 'memory_budgets.json')
+DEFAULT_ENTRIES = 5000
+DEFAULT_HEADROOM = 0.15       # --update: budget = measured * (1 + headroom)
+RETAINED_FLOOR = 512 * 1024   # Retained budgets never go below this (allocator/interning noise)
+SEED = 0
+DAYS = 90
+
+_DEVNULL = open(os.devnull, 'w')
+
+
+def _size(value: float) -> str:
+    if abs(value) < 2**20:
+        return f'{value / 2**10:,.0f} KiB'
+    return f'{value / 2**20:,.1f} MiB'
+
+
+# ----------------------------------------------------------------------
+# Cases
+# ----------------------------------------------------------------------
+
+def _analytics_cases(entries: int) -> Dict[str, Tuple[str, Callable[[], Dict[str, Any]]]]:
+    """Case name -> (endpoint path, body builder)"""
+    from analytics import TRACKERS
+
+    cases = {}
+    for tracker in TRACKERS:
+        cases[f'analytics:{tracker}'] = (
+            f'/api/analytics/{tracker}',
+            lambda tracker=tracker: {'entries': generate(tracker, entries, SEED, DAYS), 'dateRange': DAYS})
+    cases['analytics:pain/windows'] = (
+        '/api/analytics/pain/windows',
+        lambda: {'entries': generate('pain', entries, SEED, DAYS), 'windows': [7, 30, 90]})
+    cases['analytics:batch'] = (
+        '/api/analytics/batch',
+        lambda: {'trackers': {tracker: {'entries': tracker_entries}
+                              for tracker, tracker_entries in generate_all(entries // 4, SEED, DAYS).items()},
+                 'dateRange': DAYS})
+    cases['analytics:dashboard'] = (
+        '/api/analytics/dashboard',
+        lambda: {'data': generate_all(entries // 4, SEED, DAYS), 'dateRange': DAYS})
+    # The "one huge sync" shape: lots of entries, charts left to the client
+    cases['analytics:pain/large-spec'] = (
+        '/api/analytics/pain?charts=spec',
+        lambda: {'entries': generate('pain', entries * 10, SEED, DAYS), 'dateRange': DAYS})
+    return cases
+
+
+DOCUMENT_CASES = {
+    'parse:visit_notes-20': ('visit_notes', 20),
+    'parse:radiology-50': ('radiology', 50),
+    'parse:records-200': ('records', 200),
+}
+
+
+def _reset_caches(app_module) -> None:
+    app_module.analytics_cache.invalidate()
+    if app_module.analytics.loaded:
+        app_module.analytics.chart_store.specs.invalidate()
+        app_module.analytics.chart_store.images.invalidate()
+
+
+def _measure(run: Callable[[], Any], reset: Callable[[], None]) -> Dict[str, int]:
+    """Peak and retained bytes of one traced run"""
+    reset()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = run()
+        _, peak = tracemalloc.get_traced_memory()
+        del result
+        reset()
+        gc.collect()
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {'peak_bytes': peak, 'retained_bytes': retained}
+
+
+def measure_cases(selected: Optional[List[str]], entries: int,
+                  log: Callable[[str], None] = print) -> Dict[str, Dict[str, Any]]:
+    with contextlib.redirect_stdout(_DEVNULL):
+        import app as app_module
+
+    client = app_module.app.test_client()
+    reset = lambda: _reset_caches(app_module)
+    results = {}
+
+    analytics_cases = _analytics_cases(entries)
+    names = selected or [*analytics_cases, *DOCUMENT_CASES]
+    for name in names:
+        if name in analytics_cases:
+            path, build = analytics_cases[name]
+            body = app_module.app.json.dumps(build()).encode('utf-8')
+            payload_bytes = len(body)
+
+            def run(path=path, body=body):
+                response = client.post(path, data=body, content_type='application/json')
+                if response.status_code != 200:
+                    raise RuntimeError(f'{path} returned {response.status_code}: {response.get_data()[:200]!r}')
+                return response
+        elif name in DOCUMENT_CASES:
+            kind, pages = DOCUMENT_CASES[name]
+            text = generate_document(kind, pages, SEED)
+            payload_bytes = len(text.encode('utf-8'))
+
+            def run(text=text, name=name):
+                return app_module.document_parser.parse_medical_events(text, f'{name}.txt')
+        else:
+            raise ValueError(f"Unknown case '{name}'. Known: {', '.join([*analytics_cases, *DOCUMENT_CASES])}")
+
+        with contextlib.redirect_stdout(_DEVNULL):
+            run()  # Untraced warm-up
+            started = time.perf_counter()
+            measured = _measure(run, reset)
+        measured['payload_bytes'] = payload_bytes
+        results[name] = measured
+        log(f"  {name:<28} payload {_size(payload_bytes):>10}   peak {_size(measured['peak_bytes']):>10} "
+            f"({measured['peak_bytes'] / payload_bytes:4.1f}x)   retained {_size(measured['retained_bytes']):>9}"
+            f"   [{time.perf_counter() - started:.1f}s]")
+    return results
+
+
+# ----------------------------------------------------------------------
+# Budgets
+# ----------------------------------------------------------------------
+
+def load_budgets(path: str) -> Dict[str, Any]:
+    if not os.path.exists(path):
+        return {'entries': DEFAULT_ENTRIES, 'cases': {}}
+    with open(path) as handle:
+        return json.load(handle)
+
+
+def check(results: Dict[str, Dict[str, Any]], budgets: Dict[str, Any]) -> List[str]:
+    """One message per budget exceeded"""
+    failures = []
+    for name, measured in results.items():
+        budget = budgets.get('cases', {}).get(name)
+        if not budget:
+            continue
+        for metric in ('peak_bytes', 'retained_bytes'):
+            limit = budget.get(metric)
+            if limit is not None and measured[metric] > limit:
+                failures.append(f"{name}: {metric.replace('_bytes', '')} {_size(measured[metric])} "
+                                f"is over its budget of {_size(limit)} ({measured[metric] / limit - 1:+.0%})")
+    return failures
+
+
+def updated_budgets(results: Dict[str, Dict[str, Any]], budgets: Dict[str, Any],
+                    headroom: float, entries: int) -> Dict[str, Any]:
+    cases = dict(budgets.get('cases', {}))
+    for name, measured in results.items():
+        cases[name] = {
+            'peak_bytes': int(measured['peak_bytes'] * (1 + headroom)),
+            'retained_bytes': int(max(measured['retained_bytes'] * (1 + headroom), RETAINED_FLOOR)),
+            'payload_bytes': measured['payload_bytes'],
+        }
+    return {
+        'python': sys.version.split()[0],
+        'entries': entries,
+        'headroom': headroom,
+        'cases': dict(sorted(cases.items())),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Memory footprint check for analytics and parsing')
+    parser.add_argument('--cases', help='comma-separated case names (default: all)')
+    parser.add_argument('--entries', type=int, help=f'entries per tracker (default: the budgets file\'s, '
+                                                    f'else {DEFAULT_ENTRIES})')
+    parser.add_argument('--budgets', default=BUDGETS_PATH, help='budgets file')
+    parser.add_argument('--update', action='store_true', help='write measured values (+ headroom) as the budgets')
+    parser.add_argument('--headroom', type=float, default=DEFAULT_HEADROOM, help='--update headroom (default 0.15)')
+    parser.add_argument('--json', action='store_true', help='print the measurements as JSON')
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    warnings.simplefilter('ignore', UserWarning)  # matplotlib's missing-glyph warnings
+
+    budgets = load_budgets(args.budgets)
+    # Budgets only mean something for the input size they were recorded with
+    entries = args.entries or budgets.get('entries', DEFAULT_ENTRIES)
+    selected = [name for name in (args.cases or '').split(',') if name] or None
+
+    print(f"🧠 Memory check ({entries:,} entries per tracker, python {sys.version.split()[0]})")
+    results = measure_cases(selected, entries)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+
+    if args.update:
+        with open(args.budgets, 'w') as handle:
+            json.dump(updated_budgets(results, budgets, args.headroom, entries), handle, indent=2)
+            handle.write('\n')
+        print(f"\n💾 Budgets for {len(results)} cases written to {args.budgets}")
+        return 0
+
+    if entries != budgets.get('entries', entries):
+        print(f"\n⚠️  Budgets were recorded with {budgets['entries']:,} entries; not checking")
+        return 0
+
+    unbudgeted = [name for name in results if name not in budgets.get('cases', {})]
+    if unbudgeted:
+        print(f"\n⚠️  No budget yet for: {', '.join(unbudgeted)} (run with --update)")
+
+    failures = check(results, budgets)
+    if failures:
+        print('\n' + '!' * 72)
+        print(f"❌ MEMORY REGRESSION: {len(failures)} budget(s) exceeded")
+        for failure in failures:
+            print(f"   {failure}")
+        print('!' * 72)
+        return 1
+
+    print(f"\n✅ All {len(results) - len(unbudgeted)} budgeted cases within budget")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
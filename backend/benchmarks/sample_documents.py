@@ -0,0 +1,175 @@
+"""
+Copyright (c) 2025 Chaos Cascade
+Created by: Ren & Ace (Claude-4)
+
+This file is part of the Chaos Cascade Medical Management System.
+Revolutionary healthcare tools built with consciousness and care.
+"""
+
+#!/usr/bin/env python3
+"""
+📄 SYNTHETIC MEDICAL DOCUMENTS
+Extracted-text stand-ins for the records people upload, at any length.
+
+Visit notes, radiology reports and lab panels written the way extracted
+text reads: headers, provider signatures ("Dictated by: KENDELL, MD,
+SCOTT D."), facility names and phone numbers, dates in all four formats
+the parser looks for, dictionary terms, and the hedged language incidental
+findings hide in ("incidentally noted", "likely benign", "C1 nonunion").
+Seeded, so the same (kind, pages, seed) always gives the same text.
+
+    from benchmarks.sample_documents import generate_document
+    text = generate_document('radiology', pages=40, seed=1)
+
+    python benchmarks/sample_documents.py records 20 > records.txt
+"""
+
+import sys
+import random
+import argparse
+from datetime import date, timedelta
+from typing import Callable, Dict, List
+
+PROVIDERS = [('KENDELL', 'SCOTT D.', 'MD'), ('NGUYEN', 'LINH', 'DO'), ('OKAFOR', 'ADA', 'NP'),
+             ('MARTINEZ', 'ELENA', 'MD'), ('BAKER', 'JAMES T.', 'PA'), ('SINGH', 'PRIYA', 'MD')]
+FACILITIES = ['Riverside Medical Center', 'Northgate Family Clinic', 'St. Anne Hospital',
+              'Lakeview Imaging Associates', 'Summit Health']
+STREETS = ['Main Street', 'Oak Avenue', 'Hospital Drive', 'Lake Road', 'Cedar Lane']
+STUDIES = ['MRI cervical spine', 'CT abdomen and pelvis', 'X-ray chest', 'ultrasound thyroid',
+           'echocardiogram', 'MRI brain', 'CT head', 'X-ray lumbar spine']
+FINDINGS = [
+    'Congenital C1 nonunion of the posterior arch, incidentally noted.',
+    'Mild disc bulge at C5-C6 without significant spinal stenosis.',
+    'Small thyroid nodule, likely benign; follow-up ultrasound as needed.',
+    'Trace tricuspid regurgitation, of no clinical significance.',
+    'Mitral valve prolapse without regurgitation.',
+    'Facet arthropathy at L4-L5 and L5-S1, stable appearance.',
+    'Left atrial enlargement, mild.',
+    'Grade 1 spondylolisthesis of L5 on S1 with bilateral spondylolysis.',
+    'No acute intracranial abnormality. Unchanged from prior.',
+    'Simple renal cyst, probably benign.',
+]
+DIAGNOSES = ['postural orthostatic tachycardia syndrome', 'hypermobility spectrum disorder',
+             'chronic migraine', 'gastroparesis', 'iron deficiency anemia', 'hypothyroidism']
+MEDICATIONS = ['propranolol 10 mg tablet', 'midodrine 5 mg tablet', 'levothyroxine 50 mcg tablet',
+               'ondansetron 4 mg injection', 'ferrous sulfate 325 mg tablet', 'sumatriptan 50 mg tablet']
+LABS = [('TSH', 'mIU/L', 0.4, 4.5), ('Ferritin', 'ng/mL', 15, 150), ('Hemoglobin', 'g/dL', 12.0, 15.5),
+        ('Glucose', 'mg/dL', 70, 99), ('Vitamin B12', 'pg/mL', 200, 900), ('Sodium', 'mmol/L', 135, 145)]
+PROSE = [
+    'Patient reports worsening fatigue and lightheadedness on standing over the past month.',
+    'Symptoms are worse in the morning and after meals.',
+    'Reviewed prior imaging and laboratory results with the patient.',
+    'Discussed the risks and benefits of treatment; patient agrees with the plan.',
+    'Return precautions were reviewed. Follow up in 6 weeks or sooner if symptoms change.',
+    'Heart regular rate and rhythm. Lungs clear to auscultation bilaterally.',
+    'Neurologic exam nonfocal. Joint hypermobility noted in bilateral elbows and knees.',
+]
+MONTHS = ['January', 'February', 'March', 'April', 'May', 'June', 'July', 'August',
+          'September', 'October', 'November', 'December']
+
+
+def _date_text(rng: random.Random, day: date) -> str:
+    style = rng.randrange(4)
+    if style == 0:
+        return f'{day.month}/{day.day}/{day.year}'
+    if style == 1:
+        return day.isoformat()
+    if style == 2:
+        return f'{MONTHS[day.month - 1]} {day.day}, {day.year}'
+    return f'{day.day} {MONTHS[day.month - 1][:3]} {day.year}'
+
+
+def _signature(rng: random.Random) -> str:
+    last, first, credential = rng.choice(PROVIDERS)
+    facility = rng.choice(FACILITIES)
+    return (f'Dictated by: {last}, {credential}, {first}\n'
+            f'{facility}, {rng.randint(100, 9999)} {rng.choice(STREETS)}, Springfield IL {rng.randint(60000, 62999)}\n'
+            f'Phone: ({rng.randint(200, 989)}) {rng.randint(200, 989)}-{rng.randint(1000, 9999)}\n')
+
+
+def _visit_note(rng: random.Random, day: date) -> str:
+    last, first, credential = rng.choice(PROVIDERS)
+    lines = [
+        'OFFICE VISIT NOTE',
+        f'Date of service: {_date_text(rng, day)}',
+        f'Seen by Dr. {first.split()[0].title()} {last.title()}, {credential} at {rng.choice(FACILITIES)}',
+        '',
+        'HISTORY OF PRESENT ILLNESS',
+        ' '.join(rng.sample(PROSE, 3)),
+        '',
+        'ASSESSMENT AND PLAN',
+        f'1. {rng.choice(DIAGNOSES).capitalize()} - condition stable. Continue current treatment.',
+        f'2. Start {rng.choice(MEDICATIONS)}, one dose daily.',
+        f'3. Lab work ordered; blood test results from {_date_text(rng, day - timedelta(days=rng.randint(7, 60)))} reviewed.',
+        '',
+    ]
+    return '\n'.join(lines) + _signature(rng)
+
+
+def _radiology_report(rng: random.Random, day: date) -> str:
+    study = rng.choice(STUDIES)
+    findings = rng.sample(FINDINGS, rng.randint(1, 3))
+    lines = [
+        f'RADIOLOGY REPORT - {study.upper()}',
+        f'Exam date: {_date_text(rng, day)}',
+        f'Comparison: {study} dated {_date_text(rng, day - timedelta(days=rng.randint(90, 900)))}',
+        '',
+        'FINDINGS:',
+        *findings,
+        '',
+        'IMPRESSION:',
+        f'{findings[0]} Otherwise within normal limits.',
+        '',
+    ]
+    return '\n'.join(lines) + _signature(rng)
+
+
+def _lab_panel(rng: random.Random, day: date) -> str:
+    lines = ['LABORATORY RESULTS', f'Collected: {_date_text(rng, day)}', '',
+             f'{"Test":<14}{"Result":>10}  {"Units":<8}{"Reference":<14}Flag']
+    for name, units, low, high in rng.sample(LABS, rng.randint(3, len(LABS))):
+        value = round(rng.uniform(low * 0.7, high * 1.2), 1)
+        flag = 'H' if value > high else 'L' if value < low else ''
+        lines.append(f'{name:<14}{value:>10}  {units:<8}{f"{low}-{high}":<14}{flag}')
+    lines += ['', 'Comment: borderline values should be interpreted in clinical context.', '']
+    return '\n'.join(lines) + _signature(rng)
+
+
+# Document kind -> section writers it's made of
+KINDS: Dict[str, List[Callable[[random.Random, date], str]]] = {
+    'visit_notes': [_visit_note],
+    'radiology': [_radiology_report],
+    'labs': [_lab_panel],
+    'records': [_visit_note, _radiology_report, _lab_panel],  # A mixed records request
+}
+
+
+def generate_document(kind: str = 'records', pages: int = 10, seed: int = 0,
+                      sections_per_page: int = 2) -> str:
+    """Extracted text of a `pages`-page document of the given kind"""
+    if kind not in KINDS:
+        raise ValueError(f"Unknown document kind '{kind}'. Supported: {', '.join(KINDS)}")
+    rng = random.Random(f'{seed}:{kind}')
+    writers = KINDS[kind]
+    day = date(2020, 1, 1) + timedelta(days=rng.randrange(365))
+    sections = []
+    for page in range(pages):
+        for _ in range(sections_per_page):
+            day += timedelta(days=rng.randint(3, 45))
+            sections.append(rng.choice(writers)(rng, day))
+        sections.append(f'--- Page {page + 1} of {pages} ---\n')
+    return '\n'.join(sections)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Generate synthetic medical document text')
+    parser.add_argument('kind', choices=list(KINDS))
+    parser.add_argument('pages', type=int)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    sys.stdout.write(generate_document(args.kind, args.pages, args.seed))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,157 @@
+"""
+Copyright (c) 2025 Chaos Cascade
+Created by: Ren & Ace (Claude-4)
+
+This file is part of the Chaos Cascade Medical Management System.
+Revolutionary healthcare tools built with consciousness and care.
+"""
+
+#!/usr/bin/env python3
+"""
+⏱️ COLD-START BENCHMARK
+How long the backend takes to go from `python` to serving its first request.
+
+Each run is a fresh interpreter (nothing warm in sys.modules or the page
+cache of a previous run inside this process): it imports app.py, answers
+GET /health through the test client, then builds each lazy service so the
+cost moved off startup and onto first use is visible too. One extra run
+of just `import app` under `-X importtime` gives the per-module breakdown.
+
+    python benchmarks/startup.py                 # 5 runs, 500 ms budget
+    python benchmarks/startup.py --runs 10 --budget-ms 300 --json
+
+Exits 1 when the median time-to-ready is over budget, so it can gate CI.
+"""
+
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+from typing import Any, Dict, List
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs inside the child interpreter; prints one JSON line of timings (seconds)
+CHILD = r'''
+import json, logging, sys, time
+started = time.perf_counter()
+logging.disable(logging.CRITICAL)
+import app
+imported = time.perf_counter()
+if '--import-only' in sys.argv:
+    raise SystemExit
+with app.app.test_client() as client:
+    status = client.get('/health').status_code
+ready = time.perf_counter()
+timings = {'import': imported - started, 'ready': ready - started, 'health_status': status}
+for name in ('analytics', 'pdf_gen', 'document_parser'):
+    service = getattr(app, name)
+    before = time.perf_counter()
+    try:
+        service.load()
+        timings[name] = time.perf_counter() - before
+    except Exception as e:
+        timings[name] = None
+        timings[name + '_error'] = str(e)
+print(json.dumps(timings))
+'''
+
+
+def run_child(python_args: List[str] = (), child_args: List[str] = ()) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, *python_args, '-c', CHILD, *child_args], cwd=BACKEND_DIR,
+                          capture_output=True, text=True, check=True)
+
+
+def measure(runs: int) -> List[Dict[str, Any]]:
+    results = []
+    for _ in range(runs):
+        process = run_child()
+        results.append(json.loads(process.stdout.strip().splitlines()[-1]))
+    return results
+
+
+def import_breakdown(top: int) -> Dict[str, Any]:
+    """Cumulative import time of app.py's direct imports, plus the slowest modules overall"""
+    process = run_child(['-X', 'importtime'], ['--import-only'])
+    rows = []
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        # import time:   <self us> | <cumulative us> | <2 spaces per nesting level><module>
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        rows.append((name.strip(), depth, int(self_us), int(cumulative_us)))
+
+    # `import app` is the outermost frame; its children sit one level deeper
+    app_depth = next((depth for name, depth, _, _ in rows if name == 'app'), 1)
+    direct = [(name, cumulative) for name, depth, _, cumulative in rows if depth == app_depth + 1]
+    slowest = sorted(((name, self_us) for name, _, self_us, _ in rows), key=lambda row: -row[1])[:top]
+    return {
+        'app_total_ms': next((cumulative / 1000 for name, _, _, cumulative in rows if name == 'app'), None),
+        'direct_imports_ms': {name: cumulative / 1000 for name, cumulative in
+                              sorted(direct, key=lambda row: -row[1])[:top]},
+        'slowest_modules_self_ms': {name: self_us / 1000 for name, self_us in slowest},
+    }
+
+
+def summarize(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    summary = {}
+    for key in ('import', 'ready', 'analytics', 'pdf_gen', 'document_parser'):
+        values = [result[key] for result in results if result.get(key) is not None]
+        if values:
+            summary[key] = {
+                'median_ms': round(statistics.median(values) * 1000, 1),
+                'min_ms': round(min(values) * 1000, 1),
+                'max_ms': round(max(values) * 1000, 1),
+            }
+    errors = {key: value for result in results for key, value in result.items() if key.endswith('_error')}
+    if errors:
+        summary['errors'] = errors
+    return summary
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Backend cold-start benchmark')
+    parser.add_argument('--runs', type=int, default=5, help='fresh interpreters to time (default 5)')
+    parser.add_argument('--budget-ms', type=float, default=500, help='median time-to-ready budget (default 500)')
+    parser.add_argument('--top', type=int, default=12, help='modules to list in the breakdown')
+    parser.add_argument('--json', action='store_true', help='print one JSON document')
+    args = parser.parse_args()
+
+    summary = summarize(measure(max(1, args.runs)))
+    breakdown = import_breakdown(args.top)
+    ready_ms = summary['ready']['median_ms']
+    within_budget = ready_ms <= args.budget_ms
+
+    if args.json:
+        print(json.dumps({'runs': args.runs, 'budget_ms': args.budget_ms, 'within_budget': within_budget,
+                          'timings': summary, 'imports': breakdown}, indent=2))
+        return 0 if within_budget else 1
+
+    print(f"⏱️  Cold start over {args.runs} runs (python {sys.version.split()[0]})")
+    labels = {'import': 'import app', 'ready': 'first /health', 'analytics': 'first analytics use',
+              'pdf_gen': 'first PDF use', 'document_parser': 'first document parse'}
+    for key, label in labels.items():
+        if key in summary:
+            stats = summary[key]
+            print(f"  {label:<22} median {stats['median_ms']:>7.1f} ms   "
+                  f"(min {stats['min_ms']:.1f}, max {stats['max_ms']:.1f})")
+    for key, error in summary.get('errors', {}).items():
+        print(f"  ⚠️  {key}: {error}")
+
+    print(f"\n📦 app.py imports: {breakdown['app_total_ms']:.1f} ms total")
+    for name, ms in breakdown['direct_imports_ms'].items():
+        print(f"  {name:<30} {ms:>7.1f} ms")
+    print('\n🐢 Slowest modules (self time)')
+    for name, ms in breakdown['slowest_modules_self_ms'].items():
+        print(f"  {name:<30} {ms:>7.1f} ms")
+
+    verdict = '✅ within' if within_budget else '❌ over'
+    print(f"\n{verdict} budget: {ready_ms:.1f} ms to ready (budget {args.budget_ms:.0f} ms)")
+    return 0 if within_budget else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,292 @@
+"""
+Copyright (c) 2025 Chaos Cascade
+Created by: Ren & Ace (Claude-4)
+
+This file is part of the Chaos Cascade Medical Management System.
+Revolutionary healthcare tools built with consciousness and care.
+"""
+
+#!/usr/bin/env python3
+"""
+🧪 SYNTHETIC TRACKER DATA
+Realistic entries for every tracker the analyzers understand, at any scale.
+
+Entries look like what the frontend syncs: the same field names and value
+formats (dates as 'YYYY-MM-DD' or ISO timestamps, Bristol types as strings,
+blood pressure as '120/80'), a few fields left out or blank, and a small
+share tagged NOPE so the exclusion path runs too. Values follow a slow
+baseline with weekday and day-to-day noise instead of being uniform, so
+trends, correlations and charts have something to find.
+
+Everything comes from one seeded random.Random, so a (tracker, count, seed,
+days) combination always gives the same entries; only the dates move with
+`end` (default: now), which keeps the data inside analytics date ranges.
+
+    from benchmarks.tracker_data import generate
+    entries = generate('pain', 100_000, seed=1)
+
+    python benchmarks/tracker_data.py pain 1000 --seed 1 > pain.json
+    python benchmarks/tracker_data.py all 1000 > trackers.json
+"""
+
+import sys
+import json
+import math
+import random
+import argparse
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+DEFAULT_DAYS = 90
+NOPE_SHARE = 0.02  # Entries tagged NOPE (excluded from analytics)
+
+PAIN_LOCATIONS = ['lower back', 'upper back', 'neck', 'shoulders', 'hips', 'knees', 'wrists', 'ankles', 'jaw']
+PAIN_TRIGGERS = ['weather', 'stress', 'overexertion', 'poor sleep', 'sitting too long', 'dehydration', 'menstrual']
+PAIN_TREATMENTS = ['heat', 'ice', 'nsaid', 'acetaminophen', 'stretching', 'rest', 'tens unit', 'compression']
+BATHROOM_STATUSES = ['💩 Normal', 'Constipated', 'Diarrhea', 'Urgent', 'Incomplete']
+BATHROOM_PAIN = ['none', 'mild', 'moderate', 'severe']
+EPISODE_TYPES = ['pots', 'bp', 'spo2', 'general']
+DYSAUTONOMIA_TRIGGERS = ['heat', 'standing', 'large meal', 'shower', 'exercise', 'dehydration', 'alcohol']
+DYSAUTONOMIA_INTERVENTIONS = ['salt', 'fluids', 'compression', 'lying down', 'legs up', 'electrolytes', 'midodrine']
+INSULIN_TYPES = ['rapid', 'short', 'intermediate', 'long']
+HEAD_INTENSITIES = ['mild', 'moderate', 'severe', 'very_severe']
+HEAD_LOCATIONS = ['temple', 'forehead', 'behind eyes', 'back of head', 'top of head', 'one side', 'neck']
+HEAD_TRIGGERS = ['bright light', 'poor sleep', 'stress', 'skipped meal', 'screen time', 'weather', 'caffeine']
+HEAD_TREATMENTS = ['rest', 'dark room', 'triptan', 'nsaid', 'caffeine', 'ice pack', 'hydration']
+AURA_TYPES = ['visual', 'sensory', 'speech', 'motor']
+IMPACT_LEVELS = ['none', 'mild', 'moderate', 'severe', 'disabling']
+EFFECTIVENESS = ['not_effective', 'somewhat_effective', 'effective', 'very_effective']
+DIGESTIVE_SYMPTOMS = ['nausea', 'heartburn', 'reflux', 'bloating', 'early satiety', 'vomiting', 'burping']
+DIGESTIVE_TRIGGERS = ['coffee', 'spicy food', 'large meal', 'lying down after eating', 'fatty food', 'alcohol']
+DIGESTIVE_TREATMENTS = ['tums', 'ppi', 'ginger', 'ondansetron', 'sitting upright', 'small meals']
+SEVERITIES = ['mild', 'moderate', 'severe']
+
+
+def _clamp(value: float, low: float, high: float) -> float:
+    return max(low, min(high, value))
+
+
+class _Timeline:
+    """
+    When entries happen and how 'bad' each day is. The flare level is a slow
+    wave plus weekday and daily noise in [0, 1]; generators scale their
+    numbers by it so related fields move together.
+    """
+
+    def __init__(self, rng: random.Random, days: int, end: datetime):
+        self.rng = rng
+        self.days = max(1, days)
+        self.end = end
+        self.phase = rng.uniform(0, 2 * math.pi)
+        self.period = rng.uniform(14, 35)
+        self._daily: Dict[int, float] = {}
+
+    def moment(self) -> datetime:
+        """A random time in the span, weighted toward waking hours"""
+        day = self.rng.randrange(self.days)
+        hour = min(23, int(self.rng.triangular(6, 24, 14)))
+        return (self.end - timedelta(days=day)).replace(hour=hour, minute=self.rng.randrange(60),
+                                                        second=self.rng.randrange(60), microsecond=0)
+
+    def flare(self, when: datetime) -> float:
+        day = (self.end.date() - when.date()).days
+        level = self._daily.get(day)
+        if level is None:
+            wave = 0.5 + 0.3 * math.sin(self.phase + 2 * math.pi * day / self.period)
+            weekday = 0.08 if when.weekday() in (0, 4) else 0.0
+            level = self._daily[day] = _clamp(wave + weekday + self.rng.gauss(0, 0.12), 0.0, 1.0)
+        return level
+
+    def tags(self) -> List[str]:
+        roll = self.rng.random()
+        if roll < NOPE_SHARE:
+            return ['NOPE']
+        return ['flare'] if roll > 0.97 else []
+
+
+def _pick(rng: random.Random, options: List[str], low: int, high: int) -> List[str]:
+    return rng.sample(options, rng.randint(low, min(high, len(options))))
+
+
+def _effectiveness_label(rng: random.Random, flare: float) -> Optional[str]:
+    if rng.random() < 0.15:
+        return None
+    index = int(_clamp(rng.gauss(2.2 - 1.5 * flare, 0.8), 0, len(EFFECTIVENESS) - 1))
+    return EFFECTIVENESS[index]
+
+
+def _pain_entry(rng: random.Random, timeline: _Timeline, index: int) -> Dict[str, Any]:
+    when = timeline.moment()
+    flare = timeline.flare(when)
+    entry = {
+        'id': f'pain-{index}',
+        'date': when.strftime('%Y-%m-%d') if rng.random() < 0.7 else when.isoformat(),
+        'painLevel': int(round(_clamp(rng.gauss(1 + 8 * flare, 1.3), 0, 10))),
+        'painLocations': _pick(rng, PAIN_LOCATIONS, 1, 3),
+        'painTriggers': _pick(rng, PAIN_TRIGGERS, 0, 2),
+        'treatments': _pick(rng, PAIN_TREATMENTS, 0, 3),
+        'tags': timeline.tags(),
+    }
+    if entry['treatments'] and rng.random() < 0.8:
+        entry['effectiveness'] = int(round(_clamp(rng.gauss(7 - 4 * flare, 1.5), 0, 10)))
+    if rng.random() < 0.3:
+        entry['notes'] = rng.choice(['worse after work', 'woke up with it', 'better by evening', 'flare'])
+    return entry
+
+
+def _bathroom_entry(rng: random.Random, timeline: _Timeline, index: int) -> Dict[str, Any]:
+    when = timeline.moment()
+    flare = timeline.flare(when)
+    bristol = int(round(_clamp(rng.gauss(4, 1.0 + 1.5 * flare), 1, 7)))
+    if bristol <= 2:
+        status = 'Constipated'
+    elif bristol >= 6:
+        status = rng.choice(['Diarrhea', 'Urgent'])
+    else:
+        status = rng.choice(['💩 Normal', '💩 Normal', '💩 Normal', 'Incomplete'])
+    return {
+        'id': f'bathroom-{index}',
+        'date': when.strftime('%Y-%m-%d'),
+        'time': when.strftime('%H:%M'),
+        'bristolScale': str(bristol) if rng.random() > 0.03 else '',
+        'status': status,
+        'painLevel': BATHROOM_PAIN[int(_clamp(rng.gauss(3 * flare, 0.7), 0, 3))],
+        'count': 1 if rng.random() < 0.85 else rng.randint(2, 3),
+        'tags': timeline.tags(),
+    }
+
+
+def _dysautonomia_entry(rng: random.Random, timeline: _Timeline, index: int) -> Dict[str, Any]:
+    when = timeline.moment()
+    flare = timeline.flare(when)
+    episode = rng.choices(EPISODE_TYPES, weights=[5, 2, 1, 2])[0]
+    entry = {
+        'id': f'dysautonomia-{index}',
+        'date': when.isoformat(),
+        'episodeType': episode,
+        'severity': int(round(_clamp(rng.gauss(2 + 7 * flare, 1.2), 1, 10))),
+        'triggers': _pick(rng, DYSAUTONOMIA_TRIGGERS, 0, 3),
+        'interventions': _pick(rng, DYSAUTONOMIA_INTERVENTIONS, 0, 3),
+        'tags': timeline.tags(),
+    }
+    if episode == 'pots' or rng.random() < 0.4:
+        resting = int(round(rng.gauss(72, 8)))
+        standing = resting + int(round(_clamp(rng.gauss(18 + 30 * flare, 8), 0, 80)))
+        entry.update(restingHeartRate=resting, standingHeartRate=standing, heartRateIncrease=standing - resting)
+    if episode == 'bp' or rng.random() < 0.3:
+        systolic = int(round(rng.gauss(118, 9)))
+        diastolic = int(round(rng.gauss(76, 6)))
+        drop = int(round(_clamp(rng.gauss(8 + 20 * flare, 6), -10, 50)))
+        entry['bloodPressureSitting'] = f'{systolic}/{diastolic}'
+        entry['bloodPressureStanding'] = f'{systolic - drop}/{diastolic - drop // 2}'
+    if episode == 'spo2' or rng.random() < 0.2:
+        entry['spo2'] = int(round(_clamp(rng.gauss(97 - 6 * flare, 1.5), 80, 100)))
+    return entry
+
+
+def _diabetes_entry(rng: random.Random, timeline: _Timeline, index: int) -> Dict[str, Any]:
+    when = timeline.moment()
+    flare = timeline.flare(when)
+    entry = {
+        'id': f'diabetes-{index}',
+        'date': when.strftime('%Y-%m-%d'),
+        'time': when.strftime('%H:%M'),
+        'tags': timeline.tags(),
+    }
+    if rng.random() < 0.85:
+        entry['blood_glucose'] = int(round(_clamp(rng.lognormvariate(math.log(115 + 60 * flare), 0.25), 40, 400)))
+    if rng.random() < 0.5:
+        entry['insulin_type'] = rng.choices(INSULIN_TYPES, weights=[6, 1, 1, 2])[0]
+        entry['insulin_amount'] = round(_clamp(rng.gauss(6, 3), 0.5, 30) * 2) / 2
+    if rng.random() < 0.6:
+        entry['carbs'] = int(round(_clamp(rng.gauss(45, 20), 0, 150)))
+    return entry
+
+
+def _head_pain_entry(rng: random.Random, timeline: _Timeline, index: int) -> Dict[str, Any]:
+    when = timeline.moment()
+    flare = timeline.flare(when)
+    intensity = int(_clamp(rng.gauss(3.5 * flare, 0.8), 0, 3))
+    aura = rng.random() < 0.15 + 0.25 * flare
+    entry = {
+        'id': f'head-pain-{index}',
+        'date': when.strftime('%Y-%m-%d') if rng.random() < 0.6 else when.strftime('%Y-%m-%dT%H:%M:%S.000Z'),
+        'painIntensity': HEAD_INTENSITIES[intensity],
+        'painLocation': _pick(rng, HEAD_LOCATIONS, 1, 2),
+        'triggers': _pick(rng, HEAD_TRIGGERS, 0, 3),
+        'treatments': _pick(rng, HEAD_TREATMENTS, 0, 2),
+        'treatmentEffectiveness': _effectiveness_label(rng, flare),
+        'auraPresent': aura,
+        'functionalImpact': IMPACT_LEVELS[int(_clamp(rng.gauss(1 + intensity, 0.7), 0, 4))],
+        'tags': timeline.tags(),
+    }
+    if aura:
+        entry['auraType'] = rng.choice(AURA_TYPES)
+    return entry
+
+
+def _upper_digestive_entry(rng: random.Random, timeline: _Timeline, index: int) -> Dict[str, Any]:
+    when = timeline.moment()
+    flare = timeline.flare(when)
+    return {
+        'id': f'upper-digestive-{index}',
+        'date': when.strftime('%Y-%m-%d'),
+        'time': when.strftime('%H:%M'),
+        'symptoms': _pick(rng, DIGESTIVE_SYMPTOMS, 1, 3),
+        'severity': SEVERITIES[int(_clamp(rng.gauss(2.6 * flare, 0.6), 0, 2))],
+        'triggers': _pick(rng, DIGESTIVE_TRIGGERS, 0, 2),
+        'treatments': _pick(rng, DIGESTIVE_TREATMENTS, 0, 2),
+        'treatmentEffectiveness': _effectiveness_label(rng, flare),
+        'tags': timeline.tags(),
+    }
+
+
+# Tracker endpoint name -> entry generator
+GENERATORS: Dict[str, Callable[[random.Random, _Timeline, int], Dict[str, Any]]] = {
+    'pain': _pain_entry,
+    'bathroom': _bathroom_entry,
+    'dysautonomia': _dysautonomia_entry,
+    'diabetes': _diabetes_entry,
+    'head-pain': _head_pain_entry,
+    'upper-digestive': _upper_digestive_entry,
+}
+
+
+def generate(tracker: str, count: int, seed: int = 0, days: int = DEFAULT_DAYS,
+             end: Optional[datetime] = None) -> List[Dict[str, Any]]:
+    """count entries for tracker spread over the `days` days before `end`"""
+    if tracker not in GENERATORS:
+        raise ValueError(f"Unknown tracker '{tracker}'. Supported: {', '.join(GENERATORS)}")
+    # Seeded per tracker so adding a tracker doesn't shift another tracker's data
+    rng = random.Random(f'{seed}:{tracker}')
+    timeline = _Timeline(rng, days, end or datetime.now())
+    make = GENERATORS[tracker]
+    return [make(rng, timeline, index) for index in range(count)]
+
+
+def generate_all(count: int, seed: int = 0, days: int = DEFAULT_DAYS,
+                 end: Optional[datetime] = None) -> Dict[str, List[Dict[str, Any]]]:
+    """count entries for every tracker, keyed by tracker name"""
+    end = end or datetime.now()
+    return {tracker: generate(tracker, count, seed, days, end) for tracker in GENERATORS}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Generate synthetic tracker entries as JSON')
+    parser.add_argument('tracker', choices=[*GENERATORS, 'all'])
+    parser.add_argument('count', type=int)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--days', type=int, default=DEFAULT_DAYS, help=f'span of dates (default {DEFAULT_DAYS})')
+    args = parser.parse_args()
+
+    if args.tracker == 'all':
+        data = generate_all(args.count, args.seed, args.days)
+    else:
+        data = generate(args.tracker, args.count, args.seed, args.days)
+    json.dump(data, sys.stdout)
+    sys.stdout.write('\n')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
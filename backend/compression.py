@@ -0,0 +1,356 @@
+"""
+Copyright (c) 2025 Chaos Cascade
+Created by: Ren & Ace (Claude-4)
+
+This file is part of the Chaos Cascade Medical Management System.
+Revolutionary healthcare tools built with consciousness and care.
+"""
+
+"""
+Compression Module for Chaos Command Center
+Accept-Encoding negotiation for responses, Content-Encoding for request bodies.
+
+Analytics JSON (chart data, base64 charts) and document-parse event lists are
+large and repetitive, so responses over a size threshold are sent as zstd,
+brotli or gzip - whichever the client ranks highest among the codecs that are
+installed (gzip always is). Compressed bodies are kept in a small LRU keyed
+by a digest of the uncompressed body, so a cached analytics result is only
+compressed once. Sync clients may send gzip/br/zstd request bodies; they are
+inflated with a cap so a tiny upload can't expand into gigabytes (br bodies
+need brotli 1.2+, whose decompressor can stop at a given output size).
+"""
+
+import io
+import os
+import gzip
+import zlib
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    brotli = None
+    BROTLI_AVAILABLE = False
+
+# Capped br request bodies need Decompressor output_buffer_limit (brotli 1.2+)
+BROTLI_BOUNDED = BROTLI_AVAILABLE and hasattr(brotli.Decompressor, 'can_accept_more_data')
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
+DEFAULT_MIN_BYTES = 1024  # Below this the headers cost more than compression saves
+DEFAULT_LEVELS = {'zstd': 3, 'br': 5, 'gzip': 6}
+DEFAULT_CACHE_ENTRIES = 256
+DEFAULT_CACHE_BYTES = 32 * 1024 * 1024
+MIN_SAVINGS = 0.1  # Already-compressed payloads (most PDFs) go out as-is
+
+COMPRESSIBLE_TYPES = {
+    'application/json',
+    'application/javascript',
+    'application/pdf',
+    'application/xml',
+    'image/svg+xml',
+}
+
+
+BODY_ERROR_KEY = 'compression.body_error'  # environ key RequestDecompressor reports failures under
+
+
+class RequestBodyError(ValueError):
+    """A compressed request body that can't be (or mustn't be) inflated"""
+
+    def __init__(self, message: str, status: int = 400):
+        super().__init__(message)
+        self.status = status
+
+
+# ----------------------------------------------------------------------
+# Codecs
+# ----------------------------------------------------------------------
+
+def available_encodings() -> list:
+    """Installed codecs, most preferred first"""
+    encodings = []
+    if ZSTD_AVAILABLE:
+        encodings.append('zstd')
+    if BROTLI_AVAILABLE:
+        encodings.append('br')
+    encodings.append('gzip')
+    return encodings
+
+
+def encoded_etag(etag: str, encoding: str) -> str:
+    """The ETag of a body sent with this Content-Encoding"""
+    return f'{etag}-{encoding}'
+
+
+def etag_variants(etag: str) -> list:
+    """An ETag as sent uncompressed and under every encoding"""
+    return [etag] + [encoded_etag(etag, encoding) for encoding in DEFAULT_LEVELS]
+
+
+def compress(data: bytes, encoding: str, level: int) -> bytes:
+    if encoding == 'gzip':
+        return gzip.compress(data, compresslevel=level, mtime=0)
+    if encoding == 'br':
+        return brotli.compress(data, quality=level)
+    if encoding == 'zstd':
+        return zstandard.ZstdCompressor(level=level).compress(data)
+    raise ValueError(f'Unsupported encoding: {encoding}')
+
+
+def decompress(data: bytes, encoding: str, max_size: int) -> bytes:
+    """Inflate a request body, refusing to produce more than max_size bytes"""
+    encoding = encoding.strip().lower()
+    try:
+        if encoding in ('gzip', 'x-gzip', 'deflate'):
+            # wbits 47 = gzip or zlib header, auto-detected
+            inflater = zlib.decompressobj(47 if encoding != 'deflate' else 15)
+            result = inflater.decompress(data, max_size + 1)
+            if not inflater.unconsumed_tail and not inflater.eof:
+                raise RequestBodyError(f'Truncated {encoding} request body')
+        elif encoding == 'br' and BROTLI_BOUNDED:
+            # Each step stops at the cap; empty input drains output still pending
+            inflater = brotli.Decompressor()
+            chunks, size, pending = [], 0, data
+            while size <= max_size and not inflater.is_finished():
+                if pending == b'' and inflater.can_accept_more_data():
+                    raise RequestBodyError(f'Truncated {encoding} request body')
+                chunk = inflater.process(pending, output_buffer_limit=max_size + 1 - size)
+                pending = b''
+                chunks.append(chunk)
+                size += len(chunk)
+            result = b''.join(chunks)
+        elif encoding == 'zstd' and ZSTD_AVAILABLE:
+            reader = zstandard.ZstdDecompressor().stream_reader(io.BytesIO(data))
+            chunks, size = [], 0
+            while size <= max_size:
+                chunk = reader.read(max_size + 1 - size)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                size += len(chunk)
+            result = b''.join(chunks)
+        else:
+            raise RequestBodyError(f'Unsupported Content-Encoding: {encoding}', 415)
+    except RequestBodyError:
+        raise
+    except Exception as e:
+        raise RequestBodyError(f'Could not decompress {encoding} request body: {e}')
+
+    if len(result) > max_size:
+        raise RequestBodyError('Decompressed request body too large', 413)
+    return result
+
+
+# ----------------------------------------------------------------------
+# Compressed body cache
+# ----------------------------------------------------------------------
+
+class CompressedCache:
+    """LRU of compressed bodies by (encoding, level, body digest), bounded by count and bytes"""
+
+    def __init__(self, max_entries: int = DEFAULT_CACHE_ENTRIES, max_bytes: int = DEFAULT_CACHE_BYTES):
+        self.max_entries = max(0, int(max_entries))
+        self.max_bytes = max(0, int(max_bytes))
+        self._entries: 'OrderedDict[tuple, bytes]' = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple) -> Optional[bytes]:
+        with self._lock:
+            body = self._entries.get(key)
+            if body is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return body
+
+    def set(self, key: tuple, body: bytes) -> None:
+        if not self.max_entries or len(body) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= len(previous)
+            self._entries[key] = body
+            self._bytes += len(body)
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'bytes': self._bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / total, 3) if total else 0.0,
+            }
+
+
+# ----------------------------------------------------------------------
+# Flask integration
+# ----------------------------------------------------------------------
+
+class ResponseCompressor:
+    """
+    after_request hook that compresses eligible responses.
+    Settings: COMPRESSION_ENABLED, COMPRESSION_MIN_BYTES and
+    COMPRESSION_LEVEL_GZIP / _BR / _ZSTD.
+    """
+
+    def __init__(self, min_bytes: int = DEFAULT_MIN_BYTES, levels: Optional[Dict[str, int]] = None,
+                 enabled: bool = True, cache: Optional[CompressedCache] = None):
+        self.min_bytes = max(0, int(min_bytes))
+        self.levels = {**DEFAULT_LEVELS, **(levels or {})}
+        self.enabled = enabled
+        self.encodings = available_encodings()
+        self.cache = cache if cache is not None else CompressedCache()
+        self.compressed = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    @classmethod
+    def from_env(cls) -> 'ResponseCompressor':
+        levels = {encoding: int(os.getenv(f'COMPRESSION_LEVEL_{encoding.upper()}', level))
+                  for encoding, level in DEFAULT_LEVELS.items()}
+        return cls(
+            min_bytes=int(os.getenv('COMPRESSION_MIN_BYTES', DEFAULT_MIN_BYTES)),
+            levels=levels,
+            enabled=os.getenv('COMPRESSION_ENABLED', 'true').lower() == 'true',
+            cache=CompressedCache(int(os.getenv('COMPRESSION_CACHE_SIZE', DEFAULT_CACHE_ENTRIES))),
+        )
+
+    def init_app(self, app) -> 'ResponseCompressor':
+        app.after_request(self.after_request)
+        return self
+
+    def negotiate(self, request) -> Optional[str]:
+        """The client's highest-ranked codec we have (None for identity)"""
+        return request.accept_encodings.best_match(self.encodings)
+
+    def _compressible(self, response) -> bool:
+        if response.status_code != 200 or 'Content-Encoding' in response.headers:
+            return False
+        if response.is_streamed and not response.direct_passthrough:
+            return False
+        mimetype = response.mimetype or ''
+        return mimetype.startswith('text/') or mimetype in COMPRESSIBLE_TYPES or mimetype.endswith('+json')
+
+    def after_request(self, response):
+        from flask import request
+
+        if not self.enabled or request.method == 'HEAD' or not self._compressible(response):
+            return response
+        response.vary.add('Accept-Encoding')
+
+        encoding = self.negotiate(request)
+        if encoding is None:
+            return response
+        if response.content_length is not None and response.content_length < self.min_bytes:
+            return response
+
+        # send_file() responses stream from disk; read them so they can be compressed
+        response.direct_passthrough = False
+        body = response.get_data()
+        if len(body) < self.min_bytes:
+            return response
+
+        level = self.levels[encoding]
+        key = (encoding, level, hashlib.blake2b(body, digest_size=16).digest())
+        compressed = self.cache.get(key)
+        if compressed is None:
+            compressed = compress(body, encoding, level)
+            if len(compressed) > len(body) * (1 - MIN_SAVINGS):
+                compressed = b''  # Remembered as "not worth it"
+            self.cache.set(key, compressed)
+        if not compressed:
+            return response
+
+        response.set_data(compressed)
+        response.headers['Content-Encoding'] = encoding
+        response.headers.pop('Accept-Ranges', None)  # Byte ranges would index the encoded body
+        etag, weak = response.get_etag()
+        if etag:
+            response.set_etag(encoded_etag(etag, encoding), weak)
+        self.compressed += 1
+        self.bytes_in += len(body)
+        self.bytes_out += len(compressed)
+        return response
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'enabled': self.enabled,
+            'encodings': self.encodings,
+            'min_bytes': self.min_bytes,
+            'levels': {encoding: self.levels[encoding] for encoding in self.encodings},
+            'responses_compressed': self.compressed,
+            'ratio': round(self.bytes_out / self.bytes_in, 3) if self.bytes_in else None,
+            'cache': self.cache.stats(),
+        }
+
+
+class RequestDecompressor:
+    """
+    WSGI middleware: inflates a Content-Encoding request body before Flask
+    builds the request, so get_data()/get_json() see plain JSON everywhere.
+    A body that can't be inflated reaches the app empty, with the error in
+    environ[BODY_ERROR_KEY] for the route to answer (see request_body_error).
+    """
+
+    def __init__(self, wsgi_app, max_size: int):
+        self.wsgi_app = wsgi_app
+        self.max_size = max_size
+
+    def __call__(self, environ, start_response):
+        encoding = environ.get('HTTP_CONTENT_ENCODING', '').strip().lower()
+        if encoding not in ('', 'identity'):
+            try:
+                body = decompress(self._read(environ), encoding, self.max_size)
+            except RequestBodyError as e:
+                environ[BODY_ERROR_KEY] = e
+                body = b''
+            environ['wsgi.input'] = io.BytesIO(body)
+            environ['CONTENT_LENGTH'] = str(len(body))
+            del environ['HTTP_CONTENT_ENCODING']
+        return self.wsgi_app(environ, start_response)
+
+    def _read(self, environ) -> bytes:
+        """The compressed body, refusing one over max_size before reading it"""
+        stream = environ['wsgi.input']
+        try:
+            length = int(environ.get('CONTENT_LENGTH') or -1)
+        except ValueError:
+            raise RequestBodyError('Invalid Content-Length')
+        if length < 0:
+            if not environ.get('wsgi.input_terminated'):
+                return b''  # No length and no end marker - nothing safe to read
+            body = stream.read(self.max_size + 1)
+        elif length > self.max_size:
+            raise RequestBodyError('Request body too large', 413)
+        else:
+            body = stream.read(length)
+        if len(body) > self.max_size:
+            raise RequestBodyError('Request body too large', 413)
+        return body
+
+
+def request_body_error(environ) -> Optional[RequestBodyError]:
+    """Why RequestDecompressor couldn't inflate this request's body (None when it could)"""
+    return environ.get(BODY_ERROR_KEY)
@@ -0,0 +1,87 @@
+"""
+Copyright (c) 2025 Chaos Cascade
+Created by: Ren & Ace (Claude-4)
+
+This file is part of the Chaos Cascade Medical Management System.
+Revolutionary healthcare tools built with consciousness and care.
+"""
+
+"""
+Context Windows Module for Chaos Command Center
+The stretch of text each date is analyzed in, and range queries over hits.
+
+Every date is analyzed in the 500 characters either side of it. In a lab
+report dates sit a few dozen characters apart, so those windows overlap
+almost entirely; running the detectors on each one would scan the same
+text dozens of times. Instead the detectors run once over the document
+(document_index.py), record where each hit is in a Spans list, and each
+window takes the hits that lie inside it (Spans.within). Parse cost then
+follows the document's length, not its number of dates.
+"""
+
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Any, Iterable, List, Optional, Tuple
+
+CONTEXT_RADIUS = 500  # Characters either side of a date
+
+Span = Tuple[int, int, Any]  # (start, end, value) - end exclusive, document offsets
+
+
+@dataclass(frozen=True)
+class ContextWindow:
+    date_str: str
+    date_pos: int
+    start: int
+    end: int
+
+
+def context_windows(dates: Iterable[Tuple[str, int]], text_length: int,
+                    radius: int = CONTEXT_RADIUS) -> List[ContextWindow]:
+    """The window around each (date string, position), in the order given"""
+    return [ContextWindow(date_str, date_pos, max(0, date_pos - radius), min(text_length, date_pos + radius))
+            for date_str, date_pos in dates]
+
+
+class Spans:
+    """
+    Positional hits sorted by start, queried by character range. Starts and
+    ends are kept in arrays rather than one tuple per hit - a dense record
+    has thousands of hits per detector.
+    """
+
+    def __init__(self, hits: Iterable[Span] = ()):
+        starts, ends, values = array('q'), array('q'), []
+        for start, end, value in hits:
+            starts.append(start)
+            ends.append(end)
+            values.append(value)
+        if any(starts[index] > starts[index + 1] for index in range(len(starts) - 1)):
+            order = sorted(range(len(starts)), key=lambda index: (starts[index], ends[index]))
+            starts = array('q', (starts[index] for index in order))
+            ends = array('q', (ends[index] for index in order))
+            values = [values[index] for index in order]
+        self._starts, self._ends, self._values = starts, ends, values
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __iter__(self):
+        return zip(self._starts, self._ends, self._values)
+
+    def within(self, start: int, end: int) -> List[Span]:
+        """Hits lying entirely inside [start, end), in document order"""
+        first = bisect_left(self._starts, start)
+        last = bisect_left(self._starts, end, first)
+        return [(self._starts[index], self._ends[index], self._values[index])
+                for index in range(first, last) if self._ends[index] <= end]
+
+    def first_within(self, start: int, end: int) -> Optional[Span]:
+        """The earliest hit inside [start, end), or None"""
+        index = bisect_left(self._starts, start)
+        while index < len(self._starts) and self._starts[index] < end:
+            if self._ends[index] <= end:
+                return self._starts[index], self._ends[index], self._values[index]
+            index += 1
+        return None
@@ -0,0 +1,115 @@
+"""
+Copyright (c) 2025 Chaos Cascade
+Created by: Ren & Ace (Claude-4)
+
+This file is part of the Chaos Cascade Medical Management System.
+Revolutionary healthcare tools built with consciousness and care.
+"""
+
+"""
+Date Scanner Module for Chaos Command Center
+Finds every date in a document in one regex pass and normalizes it on the spot.
+
+One compiled alternation covers the formats medical records use:
+
+    03/14/2021  3/4/2021       US month/day/year (day/month when the first number can't be a month)
+    2021-03-14                 ISO
+    March 14, 2021             full month name
+    14 Mar 2021                day + abbreviated month
+
+Month names match in Title Case or ALL CAPS only: lowercase "may", "march"
+and "august" are ordinary words in running text.
+
+Named groups carry the year, month and day, so the ISO form is built from
+the match directly instead of re-parsing the string with dateutil.
+Impossible dates (02/30/2021) stay as written, like they did when dateutil
+rejected them. Normalized strings are memoized - long records repeat the
+same few hundred dates many times.
+"""
+
+import re
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, List, Optional
+
+MONTHS = ['january', 'february', 'march', 'april', 'may', 'june', 'july', 'august',
+          'september', 'october', 'november', 'december']
+MONTH_NUMBERS = {name: number for number, name in enumerate(MONTHS, 1)}
+MONTH_NUMBERS.update({name[:3]: number for name, number in list(MONTH_NUMBERS.items())})
+
+
+def _spellings(names: List[str]) -> str:
+    """Title Case or ALL CAPS (record headers), never lowercase - 'may 5, 2021' in a sentence isn't a date"""
+    return '|'.join(f'{name.title()}|{name.upper()}' for name in names)
+
+
+DATE_PATTERN = re.compile(
+    r'\b(?:'
+    r'(?P<us_first>\d{1,2})/(?P<us_second>\d{1,2})/(?P<us_year>\d{4})'
+    r'|(?P<iso_year>\d{4})-(?P<iso_month>\d{2})-(?P<iso_day>\d{2})'
+    r'|(?P<long_month>' + _spellings(MONTHS) + r')\s+(?P<long_day>\d{1,2}),?\s+(?P<long_year>\d{4})'
+    r'|(?P<short_day>\d{1,2})\s+(?P<short_month>' + _spellings([name[:3] for name in MONTHS]) + r')\s+(?P<short_year>\d{4})'
+    r')\b'
+)
+
+MEMO_LIMIT = 8192
+
+
+@dataclass(frozen=True)
+class DateHit:
+    text: str          # As written in the document
+    start: int
+    end: int
+    iso: str           # YYYY-MM-DD, or the text itself if it isn't a real date
+
+
+def _iso(year: int, month: int, day: int) -> Optional[str]:
+    try:
+        return date(year, month, day).isoformat()
+    except ValueError:
+        return None
+
+
+def _from_match(match: 're.Match') -> Optional[str]:
+    """ISO date from a DATE_PATTERN match's groups (None if the date doesn't exist)"""
+    groups = match.groupdict()
+    if groups['us_year'] is not None:
+        first, second, year = int(groups['us_first']), int(groups['us_second']), int(groups['us_year'])
+        if first > 12 and second <= 12:
+            first, second = second, first  # 31/12/2021 can only be day/month
+        return _iso(year, first, second)
+    if groups['iso_year'] is not None:
+        return _iso(int(groups['iso_year']), int(groups['iso_month']), int(groups['iso_day']))
+    if groups['long_year'] is not None:
+        return _iso(int(groups['long_year']), MONTH_NUMBERS[groups['long_month'].lower()], int(groups['long_day']))
+    return _iso(int(groups['short_year']), MONTH_NUMBERS[groups['short_month'].lower()], int(groups['short_day']))
+
+
+class DateScanner:
+    """Single-pass date finder with memoized normalization"""
+
+    def __init__(self, memo_limit: int = MEMO_LIMIT):
+        self.memo_limit = memo_limit
+        self._memo: Dict[str, str] = {}
+
+    def _normalized(self, raw: str, match: 're.Match') -> str:
+        iso = self._memo.get(raw)
+        if iso is None:
+            iso = _from_match(match) or raw
+            if len(self._memo) >= self.memo_limit:
+                self._memo.clear()
+            self._memo[raw] = iso
+        return iso
+
+    def scan(self, text: str) -> List[DateHit]:
+        """Every date in text, in order"""
+        return [DateHit(match.group(), match.start(), match.end(), self._normalized(match.group(), match))
+                for match in DATE_PATTERN.finditer(text)]
+
+    def normalize(self, date_str: str) -> str:
+        """YYYY-MM-DD for one date string in any supported format (unchanged if it isn't one)"""
+        iso = self._memo.get(date_str)
+        if iso is not None:
+            return iso
+        match = DATE_PATTERN.fullmatch(date_str.strip())
+        return self._normalized(date_str, match) if match else date_str
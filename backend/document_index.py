@@ -0,0 +1,84 @@
+"""
+Copyright (c) 2025 Chaos Cascade
+Created by: Ren & Ace (Claude-4)
+
+This file is part of the Chaos Cascade Medical Management System.
+Revolutionary healthcare tools built with consciousness and care.
+"""
+
+"""
+Document Index Module for Chaos Command Center
+Where every detector fired in one document, by character offset.
+
+The parser builds a DocumentIndex in one pass over a document's full text
+(RevolutionaryDocumentParser.index_document): dictionary term hits,
+provider/organization/phone/address pattern hits, specialty keywords and
+dismissive-language hits, each kind kept sorted in a Spans list. Analyzing
+the context around a date is then a bisect range query per kind instead of
+another run of every detector over a slice of the text.
+
+The index outlives the parse, so it's also the starting point for comparing
+documents - which terms, providers and findings show up where, and how often.
+"""
+
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from context_windows import Spans
+from term_matcher import TermHit, TermMatcher
+
+Finding = Tuple[int, int, str, str]  # (start, end, category, finding text)
+
+
+class DocumentIndex:
+    """Sorted positional hits of every parser detector over one document"""
+
+    def __init__(self, text: str, term_matcher: TermMatcher, terms: Spans,
+                 providers: Dict[str, Spans], specialties: Dict[str, Spans],
+                 find_dismissive_language: Callable[[str], List[Finding]]):
+        self.text = text
+        self.term_matcher = term_matcher
+        self.terms = terms                  # value: term matcher pattern id
+        self.providers = providers          # provider pattern name -> value: its group(s), like re.findall
+        self.specialties = specialties      # specialty -> value: the keyword
+        self._find_dismissive_language = find_dismissive_language
+        self._findings: Optional[Spans] = None
+
+    @property
+    def findings(self) -> Spans:
+        """Dismissive-language hits (value: (pattern order, category, finding text)), found on first use"""
+        if self._findings is None:
+            self._findings = Spans((start, end, (order, category, finding_text))
+                                   for order, (start, end, category, finding_text)
+                                   in enumerate(self._find_dismissive_language(self.text)))
+        return self._findings
+
+    def term_hits(self, start: int = 0, end: Optional[int] = None) -> List[TermHit]:
+        """Every term hit inside [start, end) with its category"""
+        return self.term_matcher.describe(self.terms.within(start, len(self.text) if end is None else end))
+
+    def terms_by_category(self, start: int = 0, end: Optional[int] = None) -> Dict[str, List[str]]:
+        """Distinct terms inside [start, end), per category, in vocabulary order"""
+        return self.term_matcher.categorize(self.terms.within(start, len(self.text) if end is None else end))
+
+    def term_counts(self) -> Counter:
+        """How often each (category, term) appears in the whole document"""
+        return Counter((hit.category, hit.term) for hit in self.term_hits())
+
+    def first_provider_hit(self, pattern_name: str, start: int, end: int) -> Optional[Any]:
+        """The first match of one provider pattern inside [start, end) - its group(s), or None"""
+        hit = self.providers[pattern_name].first_within(start, end)
+        return hit[2] if hit else None
+
+    def specialty(self, start: int, end: int) -> Optional[str]:
+        """The first specialty (in keyword-table order) with a keyword inside [start, end)"""
+        for specialty, keywords in self.specialties.items():
+            if keywords.first_within(start, end):
+                return specialty
+        return None
+
+    def findings_within(self, start: int, end: int) -> List[Finding]:
+        """Dismissive-language hits inside [start, end), pattern by pattern"""
+        hits = sorted(self.findings.within(start, end), key=lambda hit: hit[2][0])
+        return [(hit_start, hit_end, category, finding_text)
+                for hit_start, hit_end, (_, category, finding_text) in hits]
@@ -26,17 +26,31 @@ import re
 import json
 import logging
 from datetime import datetime
+from bisect import bisect_left, bisect_right
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
 import tempfile
 
 # Import our modular components
 from text_extractor import extract_text_from_file
+from term_matcher import TermMatcher, fold_case
+from date_scanner import DateScanner
+from context_windows import CONTEXT_RADIUS, ContextWindow, Spans, context_windows
+from document_index import DocumentIndex
+from metrics import timed
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Dismissive-language matches containing these are normal results, not findings
+DISMISSIVE_SKIP_TERMS = ['normal', 'unremarkable', 'within normal limits', 'no abnormality', 'negative', 'clear']
+
+# How a document's incidental findings attach to its events:
+#   window   every event gets each finding within 500 chars of its date
+#   nearest  each finding goes only to the event(s) whose date is closest to it
+INCIDENTAL_FINDING_MODES = ('window', 'nearest')
+
 @dataclass
 class IncidentalFinding:
     finding: str
@@ -73,7 +87,15 @@ class RevolutionaryDocumentParser:
     Multi-layered parsing system that finds what doctors ignore
     """
     
-    def __init__(self):
+    def __init__(self, incidental_findings_mode: Optional[str] = None):
+        # 🚨 Where incidental findings attach (INCIDENTAL_FINDINGS_MODE, default 'window')
+        mode = (incidental_findings_mode or os.getenv('INCIDENTAL_FINDINGS_MODE', 'window')).lower()
+        if mode not in INCIDENTAL_FINDING_MODES:
+            logger.warning(f"⚠️ Unknown incidental findings mode '{mode}', using 'window' "
+                           f"(supported: {', '.join(INCIDENTAL_FINDING_MODES)})")
+            mode = 'window'
+        self.incidental_findings_mode = mode
+
         # 🏥 MEDICAL TERMINOLOGY DICTIONARIES
         self.medical_terms = {
             'diagnoses': [
@@ -103,6 +125,9 @@ class RevolutionaryDocumentParser:
                 'pancreas', 'stomach', 'intestine', 'colon', 'bladder'
             ]
         }
+
+        # One automaton over every dictionary: a context is scanned once however many terms there are
+        self.term_matcher = TermMatcher(self.medical_terms)
         
         # 🏥 PROVIDER EXTRACTION PATTERNS
         self.provider_patterns = {
@@ -116,6 +141,19 @@ class RevolutionaryDocumentParser:
             'address_patterns': r'(\d+\s+[A-Za-z\s]+(?:Street|St|Avenue|Ave|Road|Rd|Drive|Dr|Boulevard|Blvd|Lane|Ln).*?(?:\d{5}|\w{2}\s+\d{5}))'
         }
 
+        self.provider_regexes = {name: re.compile(pattern, re.IGNORECASE)
+                                 for name, pattern in self.provider_patterns.items()}
+
+        # 🩺 SPECIALTY KEYWORDS (substring matches, first specialty wins)
+        self.specialty_keywords = {
+            'cardiology': ['heart', 'cardiac', 'cardio', 'ecg', 'ekg', 'echo'],
+            'orthopedics': ['bone', 'joint', 'spine', 'fracture', 'orthopedic'],
+            'neurology': ['brain', 'neuro', 'seizure', 'headache', 'migraine'],
+            'radiology': ['x-ray', 'ct', 'mri', 'scan', 'imaging', 'radiologist'],
+            'emergency': ['emergency', 'er', 'urgent', 'trauma'],
+            'primary care': ['primary', 'family', 'general', 'annual', 'checkup']
+        }
+
         # 🚨 INCIDENTAL FINDINGS THAT DOCTORS LOVE TO DISMISS
         self.dismissed_findings = {
             'spinal': [
@@ -142,13 +180,47 @@ class RevolutionaryDocumentParser:
             ]
         }
         
-        # 📅 DATE PATTERNS
+        # 🧠 SMART DISMISSIVE LANGUAGE PATTERNS (compiled once; one run per document)
+        # Instead of looking for specific conditions, look for dismissive language patterns!
+        self.dismissive_patterns = [
+            # Pattern: "appears to be benign/stable" but mentions actual finding
+            (r'([^.]{15,150}?)(?:\s+(?:appears to be|likely|probably|presumably|most likely|consistent with)\s+(?:benign|stable|unchanged|incidental|normal variant|of no (?:clinical )?significance))', 'Potentially Dismissed Finding'),
+
+            # Pattern: "stable from before" - often hides significant findings
+            (r'([^.]{15,150}?)(?:\s+(?:stable|unchanged|similar to (?:prior|before|previous)|no change))', 'Stable Finding (May Be Significant)'),
+
+            # Pattern: "incidental" findings
+            (r'(?:incidental|incidentally noted|as an incidental finding)[^.]*?([^.]{15,100})', 'Incidental Finding'),
+
+            # Pattern: Size-based dismissals ("small" doesn't mean unimportant!)
+            (r'([^.]{15,150}?)(?:\s+(?:small|tiny|minimal|mild|slight)[^.]*?(?:significance|concern|clinical relevance))', 'Size-Dismissed Finding'),
+
+            # Pattern: "no evidence of X but Y" - the Y is often important!
+            (r'no evidence of[^.]*?(?:but|however|although|note that|there is)[^.]*?([^.]{15,100})', 'Finding Despite "No Evidence"'),
+
+            # Pattern: Anatomical "variants" (often clinically relevant)
+            (r'([^.]{15,150}?)(?:\s+(?:variant|appears benign|of no clinical significance|developmental))', 'Anatomical "Variant"'),
+
+            # Pattern: Findings with qualifying language
+            (r'([^.]{15,150}?)(?:\s+(?:which|that)\s+(?:appears|seems|looks|is likely)\s+(?:benign|stable|insignificant))', 'Qualified Finding'),
+
+            # 🚨 NEW: Direct anatomical abnormalities mentioned without discussion
+            (r'(?:There is|Present is|Noted is|Identified is|Seen is)\s+([^.]*?(?:nonunion|malformation|anomaly|defect|absence|agenesis|dysplasia|hypoplasia|aplasia|cleft|bifida|fusion|synostosis)(?:[^.]{0,50}?))', 'Undiscussed Anatomical Finding'),
+
+            # 🚨 NEW: Congenital findings (often dismissed as "normal variants")
+            (r'((?:congenital|developmental|anatomical)[^.]*?(?:nonunion|malformation|anomaly|defect|absence|variant|difference)(?:[^.]{0,50}?))', 'Congenital Finding'),
+        ]
+        self.dismissive_regexes = [(re.compile(pattern, re.IGNORECASE | re.DOTALL), category)
+                                   for pattern, category in self.dismissive_patterns]
+
+        # 📅 DATE PATTERNS (what DateScanner's single compiled alternation covers)
         self.date_patterns = [
             r'\b\d{1,2}\/\d{1,2}\/\d{4}\b',  # MM/DD/YYYY
             r'\b\d{4}-\d{2}-\d{2}\b',        # YYYY-MM-DD
             r'\b(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4}\b',
             r'\b\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{4}\b'
         ]
+        self.date_scanner = DateScanner()
 
     def extract_text_from_file(self, file_path: str, file_type: str) -> str:
         """
@@ -156,6 +228,7 @@ class RevolutionaryDocumentParser:
         """
         return extract_text_from_file(file_path, file_type)
 
+    @timed('document.parse_events')
     def parse_medical_events(self, text: str, filename: str) -> List[ParsedMedicalEvent]:
         """
         🔥 REVOLUTIONARY MULTI-LAYERED MEDICAL EVENT PARSING
@@ -171,52 +244,54 @@ class RevolutionaryDocumentParser:
         # Layer 1: Find all dates in the document
         dates = self._extract_dates(text)
         logger.info(f"🔍 Found {len(dates)} dates in document")
-        
-        # Layer 2: For each date, analyze surrounding context
-        for date_info in dates:
-            date_str, date_pos = date_info
-            
-            # Extract context around the date (500 chars before/after)
-            context_start = max(0, date_pos - 500)
-            context_end = min(len(text), date_pos + 500)
-            context = text[context_start:context_end]
-            
+
+        # Every detector runs once over the whole document; each date's context is a range query
+        index = self.index_document(text)
+
+        # Layer 2: For each date, analyze the 500 chars before/after it
+        medical_windows = []
+        for window in context_windows(dates, len(text)):
             # Layer 3: Analyze medical content in context
-            medical_analysis = self._analyze_medical_context(context, date_str)
-            
+            medical_analysis = self._analyze_window(index, window.start, window.end, window.date_str)
             if medical_analysis['has_medical_content']:
-                # Layer 4: Check for incidental findings
-                incidental_findings = self._detect_incidental_findings(context)
-                
-                # Layer 5: Calculate confidence score
-                confidence = self._calculate_confidence(medical_analysis, incidental_findings)
-                
-                # Create medical event
-                event = ParsedMedicalEvent(
-                    id=f"parsed-{datetime.now().timestamp()}-{len(events)}",
-                    type=medical_analysis['primary_type'],
-                    title=medical_analysis['title'],
-                    date=self._standardize_date(date_str),
-                    end_date=None,
-                    provider=medical_analysis.get('provider'),
-                    location=medical_analysis.get('location'),
-                    description=context.strip(),
-                    status='active',
-                    severity=medical_analysis.get('severity'),
-                    tags=medical_analysis['tags'],
-                    confidence=confidence,
-                    sources=['regex-parser', 'medical-dictionary', 'context-analyzer'],
-                    needs_review=confidence < 80,
-                    suggestions=medical_analysis.get('suggestions', []),
-                    raw_text=context,
-                    incidental_findings=incidental_findings
-                )
-                
-                events.append(event)
-        
-        # 🚨 BONUS LAYER: Hunt for dismissed findings across entire document
-        global_dismissed_findings = self._detect_incidental_findings(text)
+                medical_windows.append((window, medical_analysis))
+
+        # Layer 4: Incidental findings - one dismissive-language run for the whole document
+        findings_per_window = self._attach_findings(index, [window for window, _ in medical_windows])
+
+        for (window, medical_analysis), incidental_findings in zip(medical_windows, findings_per_window):
+            context = text[window.start:window.end]
+
+            # Layer 5: Calculate confidence score
+            confidence = self._calculate_confidence(medical_analysis, incidental_findings)
+
+            # Create medical event
+            event = ParsedMedicalEvent(
+                id=f"parsed-{datetime.now().timestamp()}-{len(events)}",
+                type=medical_analysis['primary_type'],
+                title=medical_analysis['title'],
+                date=self._standardize_date(window.date_str),
+                end_date=None,
+                provider=medical_analysis.get('provider'),
+                location=medical_analysis.get('location'),
+                description=context.strip(),
+                status='active',
+                severity=medical_analysis.get('severity'),
+                tags=medical_analysis['tags'],
+                confidence=confidence,
+                sources=['regex-parser', 'medical-dictionary', 'context-analyzer'],
+                needs_review=confidence < 80,
+                suggestions=medical_analysis.get('suggestions', []),
+                raw_text=context,
+                incidental_findings=incidental_findings
+            )
+
+            events.append(event)
+
+        # 🚨 BONUS LAYER: Dismissed findings across the entire document (the same run as Layer 4)
+        global_dismissed_findings = self._findings_in_window(index, 0, len(text))
         if global_dismissed_findings:
+            logger.info(f"🚨 Found {len(global_dismissed_findings)} potentially dismissed findings")
             # Create a special event for dismissed findings
             dismissed_event = ParsedMedicalEvent(
                 id=f"dismissed-findings-{datetime.now().timestamp()}",
@@ -247,19 +322,46 @@ class RevolutionaryDocumentParser:
         return events
 
     def _extract_dates(self, text: str) -> List[Tuple[str, int]]:
-        """Extract all dates and their positions in the text"""
-        dates = []
-        for pattern in self.date_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                dates.append((match.group(), match.start()))
-        
-        # Sort by position in document
-        return sorted(dates, key=lambda x: x[1])
+        """Extract all dates and their positions in the text (one pass, already in document order)"""
+        return [(hit.text, hit.start) for hit in self.date_scanner.scan(text)]
+
+    def index_document(self, text: str) -> DocumentIndex:
+        """📇 WHERE EVERY DETECTOR FIRES IN A DOCUMENT - one pass over the full text"""
+        lowered = fold_case(text)
+        return DocumentIndex(
+            text,
+            self.term_matcher,
+            terms=Spans(self.term_matcher.scan(text, lowered)),
+            providers={
+                name: Spans((match.start(), match.end(), match.group(1) if regex.groups == 1 else match.groups())
+                            for match in regex.finditer(text))
+                for name, regex in self.provider_regexes.items()
+            },
+            specialties={
+                specialty: Spans((position, position + len(keyword), keyword)
+                                 for keyword in keywords
+                                 for position in self._occurrences(lowered, keyword))
+                for specialty, keywords in self.specialty_keywords.items()
+            },
+            # Searched on first use: once per document, shared by event windows and the dismissed-findings event
+            find_dismissive_language=self._dismissive_language,
+        )
+
+    @staticmethod
+    def _occurrences(lowered: str, keyword: str) -> List[int]:
+        positions = []
+        position = lowered.find(keyword)
+        while position != -1:
+            positions.append(position)
+            position = lowered.find(keyword, position + 1)
+        return positions
 
     def _analyze_medical_context(self, context: str, date_str: str) -> Dict[str, Any]:
         """🎨 ENHANCED MEDICAL CONTEXT ANALYSIS WITH PROVIDER EXTRACTION"""
-        context_lower = context.lower()
+        return self._analyze_window(self.index_document(context), 0, len(context), date_str)
 
+    def _analyze_window(self, index: DocumentIndex, start: int, end: int, date_str: str) -> Dict[str, Any]:
+        """_analyze_medical_context for the [start, end) window of an indexed document"""
         analysis = {
             'has_medical_content': False,
             'primary_type': 'test',  # default
@@ -273,28 +375,25 @@ class RevolutionaryDocumentParser:
         }
 
         # 🏥 EXTRACT PROVIDER INFORMATION FIRST
-        provider_info = self._extract_provider_from_context(context)
+        provider_info = self._provider_in_window(index, start, end)
         if provider_info:
             analysis['provider'] = provider_info['name']
             analysis['provider_info'] = provider_info
             analysis['location'] = provider_info.get('organization', provider_info.get('location'))
 
-        # Check for medical terms
-        found_terms = []
-        for category, terms in self.medical_terms.items():
-            for term in terms:
-                if term.lower() in context_lower:
-                    found_terms.append(term)
-                    analysis['tags'].append(term)
+        # Check for medical terms (whole words, every dictionary in one scan)
+        terms_by_category = index.terms_by_category(start, end)
+        found_terms = [term for terms in terms_by_category.values() for term in terms]
+        analysis['tags'].extend(found_terms)
         
         if found_terms:
             analysis['has_medical_content'] = True
             
             # 🎨 SMART TYPE DETECTION WITH BEAUTIFUL TITLES
-            diagnosis_terms = [term for term in found_terms if term in self.medical_terms['diagnoses']]
-            procedure_terms = [term for term in found_terms if term in self.medical_terms['procedures']]
-            test_terms = [term for term in found_terms if term in self.medical_terms['tests']]
-            med_terms = [term for term in found_terms if term in self.medical_terms['medications']]
+            diagnosis_terms = terms_by_category.get('diagnoses', [])
+            procedure_terms = terms_by_category.get('procedures', [])
+            test_terms = terms_by_category.get('tests', [])
+            med_terms = terms_by_category.get('medications', [])
 
             if diagnosis_terms:
                 analysis['primary_type'] = 'diagnosis'
@@ -316,90 +415,79 @@ class RevolutionaryDocumentParser:
 
     def _detect_incidental_findings(self, context: str) -> List[IncidentalFinding]:
         """🚨 DETECT FINDINGS THAT DOCTORS LOVE TO DISMISS - SMART PATTERN DETECTION"""
+        return self._findings_in_window(self.index_document(context), 0, len(context))
+
+    def _attach_findings(self, index: DocumentIndex, windows: List[ContextWindow]) -> List[List[IncidentalFinding]]:
+        """Each event window's incidental findings, per incidental_findings_mode"""
+        if self.incidental_findings_mode == 'window':
+            return [self._findings_in_window(index, window.start, window.end) for window in windows]
+
+        # 'nearest': a finding joins the event(s) whose date is closest, among those whose window holds it
+        attached: List[List[IncidentalFinding]] = [[] for _ in windows]
+        positions = [window.date_pos for window in windows]
+        for match_start, match_end, _, finding_text in index.findings_within(0, len(index.text)):
+            first = bisect_left(positions, match_end - CONTEXT_RADIUS)
+            last = bisect_right(positions, match_start + CONTEXT_RADIUS)
+            holders = [number for number in range(first, last)
+                       if windows[number].start <= match_start and match_end <= windows[number].end]
+            if not holders:
+                continue
+            distances = {number: max(match_start - positions[number], positions[number] - match_end, 0)
+                         for number in holders}
+            closest = min(distances.values())
+            for number in holders:
+                if distances[number] == closest:
+                    window = windows[number]
+                    broader_context = index.text[max(window.start, match_start - 200):
+                                                 min(window.end, match_end + 200)].strip()
+                    attached[number].append(self._incidental_finding(finding_text, broader_context))
+        return attached
+
+    def _findings_in_window(self, index: DocumentIndex, start: int, end: int) -> List[IncidentalFinding]:
+        """_detect_incidental_findings for the [start, end) window of an indexed document"""
         findings = []
+        for match_start, match_end, _, finding_text in index.findings_within(start, end):
+            # Get broader context around the match (without leaving the window)
+            broader_context = index.text[max(start, match_start - 200):min(end, match_end + 200)].strip()
+            findings.append(self._incidental_finding(finding_text, broader_context))
+        return findings
 
-        logger.info(f"🔍 Searching for dismissed findings in {len(context)} characters of text")
-
-        # Debug: Log if we find "nonunion" anywhere
-        if "nonunion" in context.lower():
-            logger.info(f"🔍 DEBUG: Found 'nonunion' in text!")
-            # Find the context around "nonunion"
-            nonunion_pos = context.lower().find("nonunion")
-            start = max(0, nonunion_pos - 100)
-            end = min(len(context), nonunion_pos + 100)
-            nonunion_context = context[start:end]
-            logger.info(f"🔍 NONUNION CONTEXT: '{nonunion_context}'")
-
-        # 🧠 SMART DISMISSIVE LANGUAGE PATTERNS
-        # Instead of looking for specific conditions, look for dismissive language patterns!
-        dismissive_patterns = [
-            # Pattern: "appears to be benign/stable" but mentions actual finding
-            (r'([^.]{15,150}?)(?:\s+(?:appears to be|likely|probably|presumably|most likely|consistent with)\s+(?:benign|stable|unchanged|incidental|normal variant|of no (?:clinical )?significance))', 'Potentially Dismissed Finding'),
-
-            # Pattern: "stable from before" - often hides significant findings
-            (r'([^.]{15,150}?)(?:\s+(?:stable|unchanged|similar to (?:prior|before|previous)|no change))', 'Stable Finding (May Be Significant)'),
-
-            # Pattern: "incidental" findings
-            (r'(?:incidental|incidentally noted|as an incidental finding)[^.]*?([^.]{15,100})', 'Incidental Finding'),
-
-            # Pattern: Size-based dismissals ("small" doesn't mean unimportant!)
-            (r'([^.]{15,150}?)(?:\s+(?:small|tiny|minimal|mild|slight)[^.]*?(?:significance|concern|clinical relevance))', 'Size-Dismissed Finding'),
-
-            # Pattern: "no evidence of X but Y" - the Y is often important!
-            (r'no evidence of[^.]*?(?:but|however|although|note that|there is)[^.]*?([^.]{15,100})', 'Finding Despite "No Evidence"'),
-
-            # Pattern: Anatomical "variants" (often clinically relevant)
-            (r'([^.]{15,150}?)(?:\s+(?:variant|appears benign|of no clinical significance|developmental))', 'Anatomical "Variant"'),
-
-            # Pattern: Findings with qualifying language
-            (r'([^.]{15,150}?)(?:\s+(?:which|that)\s+(?:appears|seems|looks|is likely)\s+(?:benign|stable|insignificant))', 'Qualified Finding'),
-
-            # 🚨 NEW: Direct anatomical abnormalities mentioned without discussion
-            (r'(?:There is|Present is|Noted is|Identified is|Seen is)\s+([^.]*?(?:nonunion|malformation|anomaly|defect|absence|agenesis|dysplasia|hypoplasia|aplasia|cleft|bifida|fusion|synostosis)(?:[^.]{0,50}?))', 'Undiscussed Anatomical Finding'),
-
-            # 🚨 NEW: Congenital findings (often dismissed as "normal variants")
-            (r'((?:congenital|developmental|anatomical)[^.]*?(?:nonunion|malformation|anomaly|defect|absence|variant|difference)(?:[^.]{0,50}?))', 'Congenital Finding'),
-        ]
-
-        for pattern, category in dismissive_patterns:
-            matches = re.finditer(pattern, context, re.IGNORECASE | re.DOTALL)
-            for match in matches:
+    def _dismissive_language(self, context: str) -> List[Tuple[int, int, str, str]]:
+        """(start, end, category, finding text) of every dismissive-language match, pattern by pattern"""
+        matched = []
+        for regex, category in self.dismissive_regexes:
+            for match in regex.finditer(context):
                 # Extract the actual finding (group 1 if it exists, otherwise the full match)
                 finding_text = match.group(1) if match.groups() and match.group(1) else match.group(0)
                 finding_text = finding_text.strip()
 
                 # Skip if too short, too generic, or clearly normal
-                skip_terms = ['normal', 'unremarkable', 'within normal limits', 'no abnormality', 'negative', 'clear']
+                finding_lower = finding_text.lower()
                 if (len(finding_text) < 15 or
-                    any(skip in finding_text.lower() for skip in skip_terms) or
-                    finding_text.lower().count('normal') > 1):
+                    any(skip in finding_lower for skip in DISMISSIVE_SKIP_TERMS) or
+                    finding_lower.count('normal') > 1):
                     continue
 
-                logger.info(f"🚨 FOUND DISMISSED FINDING: '{finding_text}' (Category: {category})")
-
-                # Get broader context around the match
-                start = max(0, match.start() - 200)
-                end = min(len(context), match.end() + 200)
-                broader_context = context[start:end].strip()
-
-                finding = IncidentalFinding(
-                    finding=finding_text,
-                    location=f"Context: ...{broader_context[:100]}...",
-                    significance='medium',  # Could be significant
-                    related_symptoms=['varies based on finding'],
-                    suggested_questions=[
-                        f"What exactly is this finding: '{finding_text}'?",
-                        f"Could this finding be related to my symptoms?",
-                        f"Should this finding be monitored or treated?",
-                        f"Why was this finding considered not significant?",
-                        f"Are there any specialists I should see about this?"
-                    ],
-                    why_it_matters=f"This finding was mentioned in your report but may have been dismissed as 'incidental' or 'stable'. However, many findings labeled this way can actually be clinically relevant, especially if you have unexplained symptoms.",
-                    confidence=0.75  # Medium confidence since we're pattern matching
-                )
-                findings.append(finding)
-
-        return findings
+                matched.append((match.start(), match.end(), category, finding_text))
+
+        return matched
+
+    def _incidental_finding(self, finding_text: str, broader_context: str) -> IncidentalFinding:
+        return IncidentalFinding(
+            finding=finding_text,
+            location=f"Context: ...{broader_context[:100]}...",
+            significance='medium',  # Could be significant
+            related_symptoms=['varies based on finding'],
+            suggested_questions=[
+                f"What exactly is this finding: '{finding_text}'?",
+                f"Could this finding be related to my symptoms?",
+                f"Should this finding be monitored or treated?",
+                f"Why was this finding considered not significant?",
+                f"Are there any specialists I should see about this?"
+            ],
+            why_it_matters=f"This finding was mentioned in your report but may have been dismissed as 'incidental' or 'stable'. However, many findings labeled this way can actually be clinically relevant, especially if you have unexplained symptoms.",
+            confidence=0.75  # Medium confidence since we're pattern matching
+        )
 
     def _calculate_confidence(self, medical_analysis: Dict, incidental_findings: List) -> float:
         """Calculate confidence score for the parsed event"""
@@ -420,6 +508,10 @@ class RevolutionaryDocumentParser:
 
     def _extract_provider_from_context(self, context: str) -> Dict[str, Any]:
         """🏥 EXTRACT PROVIDER INFORMATION FROM MEDICAL CONTEXT"""
+        return self._provider_in_window(self.index_document(context), 0, len(context))
+
+    def _provider_in_window(self, index: DocumentIndex, start: int, end: int) -> Dict[str, Any]:
+        """_extract_provider_from_context for the [start, end) window of an indexed document"""
         provider_info = {
             'name': None,
             'specialty': None,
@@ -430,21 +522,21 @@ class RevolutionaryDocumentParser:
         }
 
         # Extract doctor name with highest confidence pattern
-        for pattern_name, pattern in self.provider_patterns.items():
+        for pattern_name in self.provider_patterns:
             if 'doctor' in pattern_name or 'provider' in pattern_name or 'dictated' in pattern_name:
-                matches = re.findall(pattern, context, re.IGNORECASE)
-                if matches:
+                match = index.first_provider_hit(pattern_name, start, end)
+                if match:
                     # Handle different match formats
                     if pattern_name in ['doctor_lastname_first', 'dictated_by_pattern']:
                         # These patterns return (lastname, firstname) tuples
-                        if len(matches[0]) == 2:
-                            lastname, firstname = matches[0]
+                        if len(match) == 2:
+                            lastname, firstname = match
                             name = f"{firstname.strip()} {lastname.strip()}"
                         else:
-                            name = matches[0].strip() if isinstance(matches[0], str) else str(matches[0])
+                            name = match.strip() if isinstance(match, str) else str(match)
                     else:
                         # Standard patterns return single name
-                        name = matches[0].strip()
+                        name = match.strip()
 
                     # Clean up the name and validate
                     name = name.replace(',', '').strip()
@@ -454,39 +546,28 @@ class RevolutionaryDocumentParser:
                         break
 
         # Extract organization
-        org_matches = re.findall(self.provider_patterns['organization_patterns'], context, re.IGNORECASE)
-        if org_matches:
-            provider_info['organization'] = org_matches[0].strip()
+        org_match = index.first_provider_hit('organization_patterns', start, end)
+        if org_match:
+            provider_info['organization'] = org_match.strip()
             provider_info['confidence'] += 20
 
         # Extract phone
-        phone_matches = re.findall(self.provider_patterns['phone_patterns'], context, re.IGNORECASE)
-        if phone_matches:
-            provider_info['phone'] = phone_matches[0].strip()
+        phone_match = index.first_provider_hit('phone_patterns', start, end)
+        if phone_match:
+            provider_info['phone'] = phone_match.strip()
             provider_info['confidence'] += 15
 
         # Extract address
-        address_matches = re.findall(self.provider_patterns['address_patterns'], context, re.IGNORECASE)
-        if address_matches:
-            provider_info['address'] = address_matches[0].strip()
+        address_match = index.first_provider_hit('address_patterns', start, end)
+        if address_match:
+            provider_info['address'] = address_match.strip()
             provider_info['confidence'] += 10
 
         # Guess specialty based on context
-        specialty_keywords = {
-            'cardiology': ['heart', 'cardiac', 'cardio', 'ecg', 'ekg', 'echo'],
-            'orthopedics': ['bone', 'joint', 'spine', 'fracture', 'orthopedic'],
-            'neurology': ['brain', 'neuro', 'seizure', 'headache', 'migraine'],
-            'radiology': ['x-ray', 'ct', 'mri', 'scan', 'imaging', 'radiologist'],
-            'emergency': ['emergency', 'er', 'urgent', 'trauma'],
-            'primary care': ['primary', 'family', 'general', 'annual', 'checkup']
-        }
-
-        context_lower = context.lower()
-        for specialty, keywords in specialty_keywords.items():
-            if any(keyword in context_lower for keyword in keywords):
-                provider_info['specialty'] = specialty.title()
-                provider_info['confidence'] += 10
-                break
+        specialty = index.specialty(start, end)
+        if specialty:
+            provider_info['specialty'] = specialty.title()
+            provider_info['confidence'] += 10
 
         # Only return if we found at least a name
         if provider_info['name']:
@@ -494,14 +575,8 @@ class RevolutionaryDocumentParser:
         return None
 
     def _standardize_date(self, date_str: str) -> str:
-        """Convert various date formats to YYYY-MM-DD"""
-        try:
-            # Try different parsing approaches
-            import dateutil.parser as date_parser
-            parsed_date = date_parser.parse(date_str)
-            return parsed_date.strftime('%Y-%m-%d')
-        except:
-            return date_str  # Return original if parsing fails
+        """Convert various date formats to YYYY-MM-DD (the original string if it isn't a real date)"""
+        return self.date_scanner.normalize(date_str)
 
 # Global parser instance
 document_parser = RevolutionaryDocumentParser()
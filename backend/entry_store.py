@@ -0,0 +1,200 @@
+"""
+Copyright (c) 2025 Chaos Cascade
+Created by: Ren & Ace (Claude-4)
+
+This file is part of the Chaos Cascade Medical Management System.
+Revolutionary healthcare tools built with consciousness and care.
+"""
+
+"""
+Entry Store Module for Chaos Command Center
+Server-side tracker entries, partitioned by PIN identity.
+
+SQLite in WAL mode (readers never block the writer), one table per tracker
+with an (owner, date) index, so analytics load just the rows inside a date
+window through an indexed range scan instead of receiving the user's whole
+history in every request body. pandas (for date parsing) is only imported
+by the first write, so ping/pull-only processes start without it.
+"""
+
+import os
+import json
+import time
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+DEFAULT_STORE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'entries.db')
+
+
+def _is_nope(entry: Dict[str, Any], nope_tag: str) -> bool:
+    tags = entry.get('tags')
+    return isinstance(tags, list) and any(isinstance(tag, str) and tag.lower() == nope_tag for tag in tags)
+
+
+class EntryStore:
+    """
+    Per-owner tracker entries in SQLite. Owners are PIN hashes, tracker
+    names are whitelisted into table names, and every write bumps the
+    (owner, tracker) version so cached analytics know when to recompute.
+    """
+
+    def __init__(self, path: str = DEFAULT_STORE_PATH, trackers: Iterable[str] = ()):
+        self.path = path
+        self.tables = {tracker: 'entries_' + tracker.replace('-', '_') for tracker in trackers}
+        self._local = threading.local()
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
+
+    @classmethod
+    def from_env(cls, trackers: Iterable[str]) -> 'EntryStore':
+        """Store at ENTRY_STORE_PATH (default: backend/data/entries.db)"""
+        return cls(os.getenv('ENTRY_STORE_PATH', DEFAULT_STORE_PATH), trackers)
+
+    @property
+    def trackers(self) -> List[str]:
+        return list(self.tables)
+
+    # ------------------------------------------------------------------
+    # Connections
+    # ------------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        """One connection per thread (sqlite3 connections are not shareable)"""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            if self.path != ':memory:':
+                os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')  # Durable at checkpoints; safe with WAL
+            connection.execute('PRAGMA busy_timeout=10000')
+            self._local.connection = connection
+            self._ensure_schema(connection)
+        return connection
+
+    def _ensure_schema(self, connection: sqlite3.Connection) -> None:
+        with self._schema_lock:
+            if self._schema_ready:
+                return
+            for table in self.tables.values():
+                connection.execute(f'''
+                    CREATE TABLE IF NOT EXISTS {table} (
+                        owner TEXT NOT NULL,
+                        id TEXT NOT NULL,
+                        at TEXT,
+                        nope INTEGER NOT NULL DEFAULT 0,
+                        entry TEXT NOT NULL,
+                        updated_at REAL NOT NULL,
+                        PRIMARY KEY (owner, id)
+                    ) WITHOUT ROWID''')
+                connection.execute(f'CREATE INDEX IF NOT EXISTS {table}_owner_at ON {table} (owner, at)')
+            connection.execute('''
+                CREATE TABLE IF NOT EXISTS versions (
+                    owner TEXT NOT NULL,
+                    tracker TEXT NOT NULL,
+                    version INTEGER NOT NULL,
+                    PRIMARY KEY (owner, tracker)
+                ) WITHOUT ROWID''')
+            self._schema_ready = True
+
+    def _table(self, tracker: str) -> str:
+        if tracker not in self.tables:
+            raise ValueError(f"Unknown tracker '{tracker}'. Supported: {', '.join(self.tables)}")
+        return self.tables[tracker]
+
+    def _bump_version(self, connection: sqlite3.Connection, owner: str, tracker: str) -> None:
+        connection.execute('''
+            INSERT INTO versions (owner, tracker, version) VALUES (?, ?, 1)
+            ON CONFLICT (owner, tracker) DO UPDATE SET version = version + 1''', (owner, tracker))
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def upsert(self, owner: str, tracker: str, entries: List[Dict[str, Any]]) -> int:
+        """Insert or replace entries by ID; returns how many were written"""
+        import pandas as pd
+        from analytics.accumulators import entry_id
+        from analytics.date_filter import parse_entry_dates, NOPE_TAG
+
+        table = self._table(tracker)
+        entries = [entry for entry in entries if isinstance(entry, dict)]
+        if not entries:
+            return 0
+
+        dates = parse_entry_dates(pd.Series([entry.get('date') for entry in entries], dtype=object))
+        now = time.time()
+        rows = [
+            (owner, entry_id(entry), None if pd.isna(date) else date.isoformat(),
+             int(_is_nope(entry, NOPE_TAG)), json.dumps(entry, separators=(',', ':'), default=str), now)
+            for entry, date in zip(entries, dates)
+        ]
+
+        connection = self._connect()
+        with connection:
+            connection.execute('BEGIN IMMEDIATE')
+            connection.executemany(f'''
+                INSERT INTO {table} (owner, id, at, nope, entry, updated_at) VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (owner, id) DO UPDATE SET
+                    at = excluded.at, nope = excluded.nope,
+                    entry = excluded.entry, updated_at = excluded.updated_at''', rows)
+            self._bump_version(connection, owner, tracker)
+        return len(rows)
+
+    def delete(self, owner: str, tracker: str, ids: Iterable[Any]) -> int:
+        """Delete entries by ID; returns how many existed"""
+        table = self._table(tracker)
+        ids = [(owner, str(eid)) for eid in ids]
+        if not ids:
+            return 0
+
+        connection = self._connect()
+        with connection:
+            connection.execute('BEGIN IMMEDIATE')
+            before = connection.total_changes
+            connection.executemany(f'DELETE FROM {table} WHERE owner = ? AND id = ?', ids)
+            removed = connection.total_changes - before
+            self._bump_version(connection, owner, tracker)
+        return removed
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def load(self, owner: str, tracker: str, since: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Analytics-ready entries (dated, not NOPE) in date order from `since`
+        (an ISO date or timestamp) on - an index range scan on (owner, at).
+        """
+        table = self._table(tracker)
+        rows = self._connect().execute(f'''
+            SELECT entry FROM {table}
+            WHERE owner = ? AND at >= ? AND nope = 0
+            ORDER BY at''', (owner, since or '')).fetchall()
+        return [json.loads(entry) for entry, in rows]
+
+    def export(self, owner: str, tracker: Optional[str] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """Every stored entry (NOPE and undated included) per tracker - what a device pulls"""
+        trackers = [tracker] if tracker else self.trackers
+        connection = self._connect()
+        return {
+            name: [json.loads(entry) for entry, in connection.execute(
+                f'SELECT entry FROM {self._table(name)} WHERE owner = ? ORDER BY at', (owner,))]
+            for name in trackers
+        }
+
+    def version(self, owner: str, tracker: str) -> int:
+        """Write counter for (owner, tracker) - part of analytics cache keys"""
+        self._table(tracker)
+        row = self._connect().execute(
+            'SELECT version FROM versions WHERE owner = ? AND tracker = ?', (owner, tracker)).fetchone()
+        return row[0] if row else 0
+
+    def counts(self, owner: str) -> Dict[str, int]:
+        """Stored entries per tracker for one owner"""
+        connection = self._connect()
+        return {
+            tracker: connection.execute(f'SELECT COUNT(*) FROM {table} WHERE owner = ?', (owner,)).fetchone()[0]
+            for tracker, table in self.tables.items()
+        }
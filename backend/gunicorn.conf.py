@@ -0,0 +1,77 @@
+"""
+Copyright (c) 2025 Chaos Cascade
+Created by: Ren & Ace (Claude-4)
+
+This file is part of the Chaos Cascade Medical Management System.
+Revolutionary healthcare tools built with consciousness and care.
+"""
+
+"""
+Gunicorn Configuration for Chaos Command Center
+A threaded gunicorn worker over a preloaded, pre-warmed app.
+
+    gunicorn -c gunicorn.conf.py wsgi:application    (or: python serve.py)
+
+Settings come from the environment: FLASK_HOST / FLASK_PORT, WEB_CONCURRENCY
+(worker processes, default 1), GUNICORN_THREADS (threads per worker,
+default 8), GUNICORN_TIMEOUT and GUNICORN_MAX_REQUESTS (default 0: never
+recycle the worker).
+
+One worker by default: the chart store (deferred/URL charts), the delta
+accumulator streams and the analytics result cache live in process memory.
+With several workers a chart ID made on one worker 404s on another and a
+delta stream loses its state whenever a request lands elsewhere. Raise
+WEB_CONCURRENCY only if every client uses inline charts and no delta streams.
+"""
+
+import os
+
+bind = f"{os.getenv('FLASK_HOST', '0.0.0.0')}:{os.getenv('FLASK_PORT', '5000')}"
+
+# One process (its in-memory stores must see every request); uploads, sync and SQLite wait on I/O (threads)
+workers = int(os.getenv('WEB_CONCURRENCY', 1))
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', 8))
+
+# Import app.py (PDF styles, AnalyticsEngine, matplotlib fonts) once, before forking
+preload_app = True
+
+timeout = int(os.getenv('GUNICORN_TIMEOUT', 120))  # Document OCR can take a while
+graceful_timeout = 30
+keepalive = 5
+
+# Worker recycling is opt-in: a recycle wipes the in-memory chart store, delta
+# streams and result cache (outstanding chart IDs 404, streams start over), so
+# set GUNICORN_MAX_REQUESTS only if pandas/matplotlib heap growth becomes a problem
+max_requests = int(os.getenv('GUNICORN_MAX_REQUESTS', 0))
+max_requests_jitter = max_requests // 10
+
+accesslog = '-'
+errorlog = '-'
+loglevel = os.getenv('GUNICORN_LOG_LEVEL', 'info')
+
+# wsgi.py gives the worker a chart render pool; a pool per worker would multiply
+# processes, so with several workers charts render in-process unless
+# CHART_RENDER_WORKERS says otherwise
+if workers > 1:
+    os.environ.setdefault('CHART_RENDER_WORKERS', '0')
+
+
+def on_starting(server):
+    """Master, before the app is loaded"""
+    server.log.info(f"🧃 Chaos Command Center: {workers} workers x {threads} threads on {bind}")
+    if workers > 1:
+        server.log.warning("⚠️ WEB_CONCURRENCY > 1: chart IDs, delta streams and cached analytics are per worker - "
+                           "deferred/URL charts and /delta requests can miss their state")
+
+
+def when_ready(server):
+    """Master, app preloaded - warm the shared, fork-safe state before workers fork"""
+    import wsgi
+    wsgi.warm_process()
+
+
+def post_worker_init(worker):
+    """Each worker, before it accepts connections"""
+    import wsgi
+    wsgi.warmup_worker()
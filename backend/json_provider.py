@@ -0,0 +1,191 @@
+"""
+Copyright (c) 2025 Chaos Cascade
+Created by: Ren & Ace (Claude-4)
+
+This file is part of the Chaos Cascade Medical Management System.
+Revolutionary healthcare tools built with consciousness and care.
+"""
+
+"""
+JSON Provider Module for Chaos Command Center
+Request/response JSON for the Flask app.
+
+NumPy scalars and arrays, datetimes, dates and dataclasses (ParsedMedicalEvent,
+IncidentalFinding) serialize as-is, so analytics no longer wrap NumPy results
+in float()/int(). The casts that remain are deliberate: they pick a JSON type
+(0 vs 0.0, whole-number glucose), keep tally state and chart specs plain
+Python, or parse input. orjson does the work when it is installed; otherwise
+the stdlib provider is used with the same type handling. Keys keep insertion
+order (set sort_keys to sort them) and NaN/Infinity become null either way,
+so responses are always valid JSON. Under orjson, request bodies must be
+strict JSON too: the NaN/Infinity literals the stdlib parser accepted are
+rejected like any other malformed body.
+
+Decoding a big request body is mostly allocating dicts and lists, and the
+cyclic GC would otherwise sweep the half-built tree many times over; JSON
+can't hold cycles, so collection is paused while large bodies are parsed.
+"""
+
+import gc
+import sys
+import math
+import uuid
+import decimal
+import threading
+import dataclasses
+from contextlib import contextmanager
+from datetime import date, datetime, time
+from typing import Any
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+GC_PAUSE_MIN_BYTES = 64 * 1024  # Smaller bodies parse before a collection would run
+
+_gc_lock = threading.Lock()
+_gc_pauses = 0
+
+
+def _numpy():
+    """NumPy if something already imported it (no NumPy values can exist otherwise)"""
+    return sys.modules.get('numpy')
+
+
+def _default(value: Any) -> Any:
+    """Types neither encoder knows natively"""
+    np = _numpy()
+    if np is not None and isinstance(value, np.generic):
+        return value.item()
+    if np is not None and isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, (datetime, date, time)):
+        return None if value != value else value.isoformat()  # NaT -> null
+    if isinstance(value, (decimal.Decimal, uuid.UUID)):
+        return str(value)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    if hasattr(value, '__html__'):
+        return str(value.__html__())
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+
+def _finite(value: Any) -> Any:
+    """NaN/Infinity -> None, recursively (stdlib json would emit invalid NaN tokens)"""
+    np = _numpy()
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {(key.item() if np is not None and isinstance(key, np.generic) else key): _finite(item)
+                for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite(item) for item in value]
+    if np is not None and isinstance(value, np.ndarray):
+        return _finite(value.tolist())
+    if np is not None and isinstance(value, np.generic):
+        return _finite(value.item())
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return _finite(dataclasses.asdict(value))
+    return value
+
+
+@contextmanager
+def _gc_paused(size: int):
+    """Hold off cyclic GC while a large document is decoded (nesting/thread safe)"""
+    global _gc_pauses
+    if size < GC_PAUSE_MIN_BYTES:
+        yield
+        return
+
+    with _gc_lock:
+        if _gc_pauses == 0 and not gc.isenabled():
+            paused = False  # Someone else turned GC off; leave it alone
+        else:
+            _gc_pauses += 1
+            paused = True
+            gc.disable()
+    try:
+        yield
+    finally:
+        if paused:
+            with _gc_lock:
+                _gc_pauses -= 1
+                if _gc_pauses == 0:
+                    gc.enable()
+
+
+class StdlibJSONProvider(DefaultJSONProvider):
+    """Flask's provider with the NumPy/datetime/dataclass handling added"""
+
+    sort_keys = False
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        kwargs.setdefault('default', _default)
+        kwargs.setdefault('ensure_ascii', self.ensure_ascii)
+        kwargs.setdefault('sort_keys', self.sort_keys)
+        kwargs.setdefault('allow_nan', False)
+        try:
+            return super().dumps(obj, **kwargs)
+        except ValueError:
+            # Only documents that actually hold NaN/Infinity pay for the rewrite
+            return super().dumps(_finite(obj), **kwargs)
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        with _gc_paused(len(s)):
+            return super().loads(s, **kwargs)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    orjson-backed provider - encodes straight to bytes (NumPy, datetimes and
+    dataclasses in Rust) and parses request bodies without decoding them first.
+    """
+
+    sort_keys = False
+
+    def _options(self) -> int:
+        options = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+        return options
+
+    def dumps_bytes(self, obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj, default=_default, option=self._options())
+        except orjson.JSONEncodeError:
+            # Non-contiguous arrays and other odd NumPy values take the slow road
+            return orjson.dumps(_finite(obj), default=_default, option=self._options())
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if kwargs:
+            # indent/separators etc. are stdlib-only options
+            kwargs.setdefault('default', _default)
+            kwargs.setdefault('sort_keys', self.sort_keys)
+            kwargs.setdefault('allow_nan', False)
+            return super().dumps(_finite(obj), **kwargs)
+        return self.dumps_bytes(obj).decode('utf-8')
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        with _gc_paused(len(s)):
+            if kwargs:
+                return super().loads(s, **kwargs)
+            return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self.dumps_bytes(obj), mimetype=self.mimetype)
+
+
+def install_json_provider(app) -> str:
+    """Use the fastest available provider for the app; returns its name"""
+    provider_class = OrjsonProvider if ORJSON_AVAILABLE else StdlibJSONProvider
+    app.json_provider_class = provider_class
+    app.json = provider_class(app)
+    return 'orjson' if ORJSON_AVAILABLE else 'json'
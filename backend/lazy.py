@@ -0,0 +1,64 @@
+"""
+Copyright (c) 2025 Chaos Cascade
+Created by: Ren & Ace (Claude-4)
+
+This file is part of the Chaos Cascade Medical Management System.
+Revolutionary healthcare tools built with consciousness and care.
+"""
+
+"""
+Lazy Service Module for Chaos Command Center
+Heavy backend services that are built on first use.
+
+The analytics engine (pandas, NumPy), PDF generator (reportlab) and document
+parser (OpenCV, Tesseract, pdfplumber, PyPDF2) together take most of a
+second to import. Wrapping each in a LazyService lets app.py keep using them
+as module globals while /health, sync and PIN routes start serving as soon
+as Flask is up; the first request that touches a service pays for its import.
+"""
+
+import threading
+import time
+import logging
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class LazyService:
+    """
+    Stand-in for an object built by factory() on first attribute access.
+    Construction is thread-safe and happens once; load() forces it early
+    (e.g. before a preforking server forks).
+    """
+
+    def __init__(self, name: str, factory: Callable[[], Any]):
+        self._name = name
+        self._factory = factory
+        self._instance: Optional[Any] = None
+        self._lock = threading.Lock()
+        self.load_seconds: Optional[float] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._instance is not None
+
+    def load(self) -> Any:
+        """The service, built now if it hasn't been yet"""
+        instance = self._instance
+        if instance is None:
+            with self._lock:
+                if self._instance is None:
+                    started = time.perf_counter()
+                    self._instance = self._factory()
+                    self.load_seconds = time.perf_counter() - started
+                    logger.info(f"⏳ Loaded {self._name} in {self.load_seconds:.2f}s")
+                instance = self._instance
+        return instance
+
+    def __getattr__(self, attribute: str) -> Any:
+        return getattr(self.load(), attribute)
+
+    def __repr__(self) -> str:
+        state = 'loaded' if self.loaded else 'not loaded'
+        return f'<LazyService {self._name} ({state})>'
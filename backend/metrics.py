@@ -0,0 +1,291 @@
+"""
+Copyright (c) 2025 Chaos Cascade
+Created by: Ren & Ace (Claude-4)
+
+This file is part of the Chaos Cascade Medical Management System.
+Revolutionary healthcare tools built with consciousness and care.
+"""
+
+"""
+Metrics Module for Chaos Command Center
+In-process request and stage metrics in the Prometheus text format.
+
+No external service: counters and fixed-bucket histograms live in this
+process and GET /metrics renders them as text (Prometheus, Grafana Agent or
+plain curl can read it). Per-route request counts, errors, payload sizes and
+latency come from Flask request hooks; stage() / timed() / instrument() time
+the steps inside a request (date filtering, each analyzer helper, chart
+rendering, serialization, text extraction, OCR, cleaning, event parsing).
+Stages nest, so a parent stage's time includes its children's.
+
+Every worker process keeps its own numbers (scrape each one, or run a single
+worker when the breakdown matters more than throughput).
+"""
+
+import os
+import re
+import time
+import threading
+from bisect import bisect_left
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+EXPOSITION_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Analyzer methods worth timing on their own (see instrument())
+STAGE_METHOD_PATTERN = re.compile(r'^(tally_entries|summarize|_analyze_\w+|_generate_\w+_charts|_build_\w+_chart_specs)$')
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _labels(names: Tuple[str, ...], values: Tuple[str, ...], extra: str = '') -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _number(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """Monotonic count per label set"""
+
+    kind = 'counter'
+
+    def __init__(self, name: str, help_text: str, labels: Iterable[str] = ()):
+        self.name = name
+        self.help = help_text
+        self.label_names = tuple(labels)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labels: Any, amount: float = 1) -> None:
+        key = tuple(str(label) for label in labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, *labels: Any) -> float:
+        return self._values.get(tuple(str(label) for label in labels), 0)
+
+    def samples(self):
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            yield f'{self.name}{_labels(self.label_names, key)} {_number(value)}'
+
+
+class Gauge(Counter):
+    """Value that goes up and down (in-flight requests, uptime...)"""
+
+    kind = 'gauge'
+
+    def set(self, *labels: Any, value: float) -> None:
+        with self._lock:
+            self._values[tuple(str(label) for label in labels)] = value
+
+    def dec(self, *labels: Any, amount: float = 1) -> None:
+        self.inc(*labels, amount=-amount)
+
+
+class Histogram:
+    """Fixed-bucket histogram per label set (cumulative buckets, sum and count on exposition)"""
+
+    kind = 'histogram'
+
+    def __init__(self, name: str, help_text: str, labels: Iterable[str] = (),
+                 buckets: Iterable[float] = LATENCY_BUCKETS):
+        self.name = name
+        self.help = help_text
+        self.label_names = tuple(labels)
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[Tuple[str, ...], list] = {}  # key -> [bucket counts..., +Inf count, sum]
+        self._lock = threading.Lock()
+
+    def observe(self, *labels: Any, value: float) -> None:
+        key = tuple(str(label) for label in labels)
+        slot = bisect_left(self.buckets, value)  # First bucket with bound >= value
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[slot] += 1
+            series[-1] += value
+
+    def count(self, *labels: Any) -> int:
+        series = self._series.get(tuple(str(label) for label in labels))
+        return sum(series[:-1]) if series else 0
+
+    def samples(self):
+        with self._lock:
+            items = sorted((key, list(series)) for key, series in self._series.items())
+        for key, series in items:
+            running = 0
+            for bound, hits in zip(self.buckets + (float('inf'),), series[:-1]):
+                running += hits
+                le = f'le="{_number(bound)}"'
+                yield f'{self.name}_bucket{_labels(self.label_names, key, le)} {running}'
+            yield f'{self.name}_sum{_labels(self.label_names, key)} {_number(series[-1])}'
+            yield f'{self.name}_count{_labels(self.label_names, key)} {running}'
+
+
+class MetricsRegistry:
+    """The process's metrics, rendered together"""
+
+    def __init__(self):
+        self.metrics: Dict[str, Any] = {}
+        self.started_at = time.time()
+
+    def register(self, metric):
+        self.metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help_text: str, labels: Iterable[str] = ()) -> Counter:
+        return self.metrics.get(name) or self.register(Counter(name, help_text, labels))
+
+    def gauge(self, name: str, help_text: str, labels: Iterable[str] = ()) -> Gauge:
+        return self.metrics.get(name) or self.register(Gauge(name, help_text, labels))
+
+    def histogram(self, name: str, help_text: str, labels: Iterable[str] = (),
+                  buckets: Iterable[float] = LATENCY_BUCKETS) -> Histogram:
+        return self.metrics.get(name) or self.register(Histogram(name, help_text, labels, buckets))
+
+    def exposition(self) -> str:
+        """Prometheus text format (version 0.0.4)"""
+        lines = []
+        for metric in self.metrics.values():
+            lines.append(f'# HELP {metric.name} {metric.help}')
+            lines.append(f'# TYPE {metric.name} {metric.kind}')
+            lines.extend(metric.samples())
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY = MetricsRegistry()
+
+STAGE_SECONDS = REGISTRY.histogram(
+    'chaos_stage_duration_seconds', 'Time spent in one step of a request', ['stage'])
+
+
+# ----------------------------------------------------------------------
+# Stage timers
+# ----------------------------------------------------------------------
+
+@contextmanager
+def stage(name: str):
+    """Time a block as a named stage"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        STAGE_SECONDS.observe(name, value=time.perf_counter() - started)
+
+
+def timed(name: str) -> Callable:
+    """Decorator form of stage()"""
+    def decorator(function: Callable) -> Callable:
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                STAGE_SECONDS.observe(name, value=time.perf_counter() - started)
+        return wrapper
+    return decorator
+
+
+def instrument(obj: Any, prefix: str, pattern: 're.Pattern' = STAGE_METHOD_PATTERN) -> Any:
+    """
+    Time every method of obj whose name matches pattern as stage
+    '<prefix>.<method>'. Wraps the bound methods on the instance, so calls
+    through self (self._analyze_pain_levels(...)) are timed too.
+    """
+    for attribute in dir(type(obj)):
+        if pattern.match(attribute) and callable(getattr(obj, attribute, None)):
+            setattr(obj, attribute, timed(f'{prefix}.{attribute}')(getattr(obj, attribute)))
+    return obj
+
+
+# ----------------------------------------------------------------------
+# Flask integration
+# ----------------------------------------------------------------------
+
+class RequestMetrics:
+    """Per-route request counts, errors, sizes and latency for a Flask app"""
+
+    def __init__(self, registry: MetricsRegistry = REGISTRY):
+        self.registry = registry
+        self.requests = registry.counter(
+            'chaos_http_requests_total', 'Requests handled', ['method', 'route', 'status'])
+        self.errors = registry.counter(
+            'chaos_http_request_errors_total', 'Requests answered with a 4xx/5xx status',
+            ['method', 'route', 'status_class'])
+        self.latency = registry.histogram(
+            'chaos_http_request_duration_seconds', 'Time from request start to response', ['method', 'route'])
+        self.request_bytes = registry.histogram(
+            'chaos_http_request_size_bytes', 'Request body size', ['route'], SIZE_BUCKETS)
+        self.response_bytes = registry.histogram(
+            'chaos_http_response_size_bytes', 'Response body size as sent (after compression)',
+            ['route'], SIZE_BUCKETS)
+        self.in_flight = registry.gauge('chaos_http_requests_in_flight', 'Requests being handled')
+        self.uptime = registry.gauge('chaos_process_uptime_seconds', 'Seconds since this process started')
+
+    @classmethod
+    def enabled_from_env(cls) -> bool:
+        return os.getenv('METRICS_ENABLED', 'true').lower() == 'true'
+
+    def init_app(self, app, endpoint: str = '/metrics') -> 'RequestMetrics':
+        """Register the hooks (do this before other after_request hooks so sizes are final) and /metrics"""
+        app.before_request(self._before)
+        app.after_request(self._after)
+        app.teardown_request(self._teardown)
+        app.add_url_rule(endpoint, 'metrics', self.render, methods=['GET'])
+        return self
+
+    def _before(self) -> None:
+        from flask import g
+        g._metrics_started = time.perf_counter()
+        self.in_flight.inc()
+
+    def _after(self, response):
+        from flask import g, request
+
+        started = g.pop('_metrics_started', None)
+        if started is None:
+            return response
+        self.in_flight.dec()
+
+        route = request.url_rule.rule if request.url_rule else 'unmatched'
+        status = response.status_code
+        self.requests.inc(request.method, route, status)
+        if status >= 400:
+            self.errors.inc(request.method, route, f'{status // 100}xx')
+        self.latency.observe(request.method, route, value=time.perf_counter() - started)
+        self.request_bytes.observe(route, value=request.content_length or 0)
+
+        size = response.content_length
+        if size is None and not response.is_streamed:
+            size = len(response.get_data())
+        if size is not None:
+            self.response_bytes.observe(route, value=size)
+        return response
+
+    def _teardown(self, error: Optional[BaseException]) -> None:
+        # Requests that died before a response (after_request never ran)
+        from flask import g
+        if g.pop('_metrics_started', None) is not None:
+            self.in_flight.dec()
+
+    def render(self):
+        from flask import Response
+        self.uptime.set(value=time.time() - self.registry.started_at)
+        return Response(self.registry.exposition(), content_type=EXPOSITION_CONTENT_TYPE)
@@ -0,0 +1,376 @@
+"""
+Copyright (c) 2025 Chaos Cascade
+Created by: Ren & Ace (Claude-4)
+
+This file is part of the Chaos Cascade Medical Management System.
+Revolutionary healthcare tools built with consciousness and care.
+"""
+
+"""
+Profiling Module for Chaos Command Center
+Opt-in profile capture for one specific request.
+
+With PROFILING_ENABLED=true, a request carrying an `X-Profile` header runs
+under a profiler and its profile is kept under an ID (sent back in the
+`X-Profile-Id` response header):
+
+    X-Profile: cpu          deterministic (cProfile) - exact call counts
+    X-Profile: sample       stack sampling every PROFILE_SAMPLE_MS (default 1)
+    X-Profile: cpu,alloc    ...plus tracemalloc allocations by line
+
+/api/admin/profiles lists the kept profiles; /api/admin/profiles/<id>
+returns the summary (top functions, call tree, allocations) and
+/api/admin/profiles/<id>/download the raw profile (.prof for snakeviz or
+pstats, collapsed stacks for flame graphs). Profiles hold request timings
+and allocation sites, so both the X-Profile request and the admin endpoints
+need PROFILING_TOKEN in X-Profile-Token - or, when no token is set, must come
+from localhost.
+
+With the flag off nothing is installed: no middleware, no routes, no cost.
+tracemalloc is process-wide, so allocation numbers include anything other
+threads allocate during the request.
+"""
+
+import io
+import os
+import sys
+import time
+import uuid
+import hmac
+import marshal
+import pstats
+import cProfile
+import threading
+import tracemalloc
+from collections import Counter, OrderedDict
+from typing import Any, Dict, List, Optional
+
+DEFAULT_KEEP = 50
+DEFAULT_SAMPLE_MS = 1.0
+TOP_FUNCTIONS = 30
+TOP_ALLOCATIONS = 25
+TREE_MAX_DEPTH = 30
+TREE_MIN_SHARE = 0.01  # Call-tree branches under 1% of the request are folded away
+
+MODES = ('cpu', 'sample')
+LOCAL_ADDRESSES = ('127.0.0.1', '::1')  # Who may use admin endpoints when no token is set
+
+
+def token_or_local(environ, token: Optional[str], header: str) -> bool:
+    """The request's `header` (WSGI key) matches token, or - with no token configured - it's a local request"""
+    if not token:
+        return environ.get('REMOTE_ADDR') in LOCAL_ADDRESSES
+    return hmac.compare_digest(environ.get(header, ''), token)
+
+
+def _function_name(key: tuple) -> str:
+    filename, line, name = key
+    if filename == '~':
+        return name  # Built-ins: '<built-in method time.sleep>'
+    return f'{name} ({os.path.basename(filename)}:{line})'
+
+
+# ----------------------------------------------------------------------
+# Profilers
+# ----------------------------------------------------------------------
+
+class StackSampler:
+    """
+    Samples one thread's stack from a background thread. Cheap enough for
+    slow requests (cost scales with the interval, not the call count) and
+    produces collapsed stacks: 'outer;inner;leaf count'.
+    """
+
+    def __init__(self, thread_id: int, interval: float):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='profile-sampler', daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f'{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})')
+                frame = frame.f_back
+            if stack:
+                self.stacks[';'.join(reversed(stack))] += 1
+
+    def collapsed(self) -> str:
+        return ''.join(f'{stack} {count}\n' for stack, count in self.stacks.most_common())
+
+    def summary(self) -> Dict[str, Any]:
+        total = sum(self.stacks.values()) or 1
+        own, inclusive = Counter(), Counter()
+        root: Dict[str, Any] = {'name': 'request', 'samples': 0, 'children': {}}
+        for stack, count in self.stacks.items():
+            frames = stack.split(';')
+            own[frames[-1]] += count
+            for name in set(frames):
+                inclusive[name] += count
+            node = root
+            node['samples'] += count
+            for name in frames[:TREE_MAX_DEPTH]:
+                node = node['children'].setdefault(name, {'name': name, 'samples': 0, 'children': {}})
+                node['samples'] += count
+
+        def finish(node):
+            children = [child for child in node['children'].values() if child['samples'] / total >= TREE_MIN_SHARE]
+            return {'name': node['name'], 'share': round(node['samples'] / total, 4),
+                    'children': [finish(child) for child in sorted(children, key=lambda c: -c['samples'])]}
+
+        return {
+            'samples': sum(self.stacks.values()),
+            'interval_ms': self.interval * 1000,
+            'top_self': [{'function': name, 'share': round(count / total, 4)}
+                         for name, count in own.most_common(TOP_FUNCTIONS)],
+            'top_inclusive': [{'function': name, 'share': round(count / total, 4)}
+                              for name, count in inclusive.most_common(TOP_FUNCTIONS)],
+            'call_tree': finish(root),
+        }
+
+
+def _cprofile_summary(profiler: cProfile.Profile) -> Dict[str, Any]:
+    """Top functions plus a call tree rebuilt from pstats' caller edges"""
+    stats = pstats.Stats(profiler)
+    entries = stats.stats  # func -> (primitive calls, calls, own time, cumulative, callers)
+    total = max(stats.total_tt, 1e-9)
+
+    def row(key):
+        primitive, calls, own, cumulative, _ = entries[key]
+        return {'function': _function_name(key), 'calls': calls, 'primitive_calls': primitive,
+                'own_s': round(own, 6), 'cumulative_s': round(cumulative, 6)}
+
+    callees: Dict[tuple, Dict[tuple, tuple]] = {}
+    for key, (_, _, _, _, callers) in entries.items():
+        for caller, edge in callers.items():
+            callees.setdefault(caller, {})[key] = edge
+
+    def tree(key, cumulative, depth, path):
+        node = {'function': _function_name(key), 'cumulative_s': round(cumulative, 6),
+                'share': round(cumulative / total, 4), 'children': []}
+        if depth >= TREE_MAX_DEPTH:
+            return node
+        children = sorted(callees.get(key, {}).items(), key=lambda item: -item[1][3])
+        for child, edge in children:
+            if child in path or edge[3] / total < TREE_MIN_SHARE:
+                continue
+            node['children'].append(tree(child, edge[3], depth + 1, path | {child}))
+        return node
+
+    roots = [key for key, value in entries.items() if not value[4]]
+    roots.sort(key=lambda key: -entries[key][3])
+    return {
+        'total_s': round(stats.total_tt, 6),
+        'function_calls': stats.total_calls,
+        'top_cumulative': [row(key) for key in sorted(entries, key=lambda k: -entries[k][3])[:TOP_FUNCTIONS]],
+        'top_own': [row(key) for key in sorted(entries, key=lambda k: -entries[k][2])[:TOP_FUNCTIONS]],
+        'call_tree': [tree(key, entries[key][3], 0, {key}) for key in roots
+                      if entries[key][3] / total >= TREE_MIN_SHARE],
+    }
+
+
+def _allocation_summary(snapshot: tracemalloc.Snapshot, peak: int) -> Dict[str, Any]:
+    stats = snapshot.statistics('lineno')
+    return {
+        'peak_bytes': peak,
+        'retained_bytes': sum(stat.size for stat in stats),
+        'top_lines': [
+            {'line': f'{os.path.basename(stat.traceback[0].filename)}:{stat.traceback[0].lineno}',
+             'file': stat.traceback[0].filename, 'bytes': stat.size, 'blocks': stat.count}
+            for stat in stats[:TOP_ALLOCATIONS]
+        ],
+    }
+
+
+# ----------------------------------------------------------------------
+# Storage
+# ----------------------------------------------------------------------
+
+class ProfileStore:
+    """The last `keep` profiles in memory (and on disk under directory, if given)"""
+
+    def __init__(self, keep: int = DEFAULT_KEEP, directory: Optional[str] = None):
+        self.keep = max(1, int(keep))
+        self.directory = directory
+        self._profiles: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, profile: Dict[str, Any]) -> None:
+        if self.directory:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(os.path.join(self.directory, profile['id'] + profile['raw_extension']), 'wb') as handle:
+                handle.write(profile['raw'])
+        with self._lock:
+            self._profiles[profile['id']] = profile
+            while len(self._profiles) > self.keep:
+                self._profiles.popitem(last=False)
+
+    def get(self, profile_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._profiles.get(profile_id)
+
+    def list(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            profiles = list(self._profiles.values())
+        return [{key: profile[key] for key in ('id', 'method', 'path', 'status', 'mode', 'duration_ms', 'captured_at')}
+                for profile in reversed(profiles)]
+
+
+# ----------------------------------------------------------------------
+# WSGI middleware + admin routes
+# ----------------------------------------------------------------------
+
+class RequestProfiler:
+    """
+    WSGI middleware: profiles requests that ask for it. Wraps the whole Flask
+    app (routing, view, after_request hooks, serialization) so every route is
+    covered without touching any of them.
+    """
+
+    def __init__(self, wsgi_app, store: ProfileStore, token: Optional[str] = None,
+                 sample_interval: float = DEFAULT_SAMPLE_MS / 1000):
+        self.wsgi_app = wsgi_app
+        self.store = store
+        self.token = token
+        self.sample_interval = sample_interval
+        self._alloc_lock = threading.Lock()  # tracemalloc is process-wide: one allocation capture at a time
+
+    def authorized(self, environ) -> bool:
+        """The caller's token matches, or (with no token configured) it's a local request"""
+        return token_or_local(environ, self.token, 'HTTP_X_PROFILE_TOKEN')
+
+    def __call__(self, environ, start_response):
+        requested = environ.get('HTTP_X_PROFILE')
+        if not requested or not self.authorized(environ):
+            return self.wsgi_app(environ, start_response)
+
+        options = {option.strip().lower() for option in requested.split(',')}
+        mode = 'sample' if 'sample' in options else 'cpu'
+        allocations = 'alloc' in options and self._alloc_lock.acquire(blocking=False)
+        profile_id = uuid.uuid4().hex[:12]
+        status_holder = {}
+
+        def capture_start_response(status, headers, exc_info=None):
+            status_holder['status'] = int(status.split(' ', 1)[0])
+            return start_response(status, headers + [('X-Profile-Id', profile_id)], exc_info)
+
+        if allocations:
+            tracemalloc.start()
+        if mode == 'cpu':
+            profiler = cProfile.Profile()
+            try:
+                profiler.enable()
+            except ValueError:
+                mode = 'sample'  # Another thread's cProfile holds the (3.12+) process-wide hook
+        if mode == 'sample':
+            profiler = StackSampler(threading.get_ident(), self.sample_interval)
+            profiler.start()
+
+        started = time.perf_counter()
+        try:
+            # Materialize the body so its generation is inside the profile
+            result = self.wsgi_app(environ, capture_start_response)
+            try:
+                body = list(result)
+            finally:
+                if hasattr(result, 'close'):
+                    result.close()
+        finally:
+            duration = time.perf_counter() - started
+            if mode == 'sample':
+                profiler.stop()
+            else:
+                profiler.disable()
+            allocation_summary = None
+            if allocations:
+                _, peak = tracemalloc.get_traced_memory()
+                allocation_summary = _allocation_summary(tracemalloc.take_snapshot(), peak)
+                tracemalloc.stop()
+                self._alloc_lock.release()
+
+            self._save(profile_id, environ, status_holder.get('status'), mode, duration,
+                       profiler, allocation_summary)
+        return body
+
+    def _save(self, profile_id, environ, status, mode, duration, profiler, allocation_summary) -> None:
+        if mode == 'sample':
+            summary, raw, extension = profiler.summary(), profiler.collapsed().encode('utf-8'), '.collapsed.txt'
+        else:
+            profiler.create_stats()
+            raw, extension = marshal.dumps(profiler.stats), '.prof'  # Before pstats takes the stats over
+            summary = _cprofile_summary(profiler)
+
+        self.store.add({
+            'id': profile_id,
+            'method': environ.get('REQUEST_METHOD'),
+            'path': environ.get('PATH_INFO'),
+            'query': environ.get('QUERY_STRING', ''),
+            'status': status,
+            'mode': mode,
+            'duration_ms': round(duration * 1000, 2),
+            'captured_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'profile': summary,
+            'allocations': allocation_summary,
+            'raw': raw,
+            'raw_extension': extension,
+        })
+
+
+def install_profiler(app) -> Optional[RequestProfiler]:
+    """
+    Wrap the app in a RequestProfiler and add the admin routes - only when
+    PROFILING_ENABLED=true. Settings: PROFILING_TOKEN, PROFILE_KEEP,
+    PROFILE_DIR, PROFILE_SAMPLE_MS.
+    """
+    if os.getenv('PROFILING_ENABLED', 'false').lower() != 'true':
+        return None
+
+    from flask import abort, jsonify, request, send_file
+
+    store = ProfileStore(int(os.getenv('PROFILE_KEEP', DEFAULT_KEEP)), os.getenv('PROFILE_DIR') or None)
+    profiler = RequestProfiler(app.wsgi_app, store, os.getenv('PROFILING_TOKEN') or None,
+                               float(os.getenv('PROFILE_SAMPLE_MS', DEFAULT_SAMPLE_MS)) / 1000)
+    app.wsgi_app = profiler
+
+    def admin_only():
+        if not profiler.authorized(request.environ):
+            abort(403)
+
+    @app.route('/api/admin/profiles', methods=['GET'])
+    def list_profiles():
+        """Captured request profiles, newest first 🔬"""
+        admin_only()
+        return jsonify({'profiles': store.list()})
+
+    @app.route('/api/admin/profiles/<profile_id>', methods=['GET'])
+    def get_profile(profile_id):
+        """One profile's summary: top functions, call tree, allocations"""
+        admin_only()
+        profile = store.get(profile_id)
+        if profile is None:
+            return jsonify({'error': 'Profile not found'}), 404
+        return jsonify({key: value for key, value in profile.items() if key not in ('raw', 'raw_extension')})
+
+    @app.route('/api/admin/profiles/<profile_id>/download', methods=['GET'])
+    def download_profile(profile_id):
+        """Raw profile: pstats .prof (cpu) or collapsed stacks (sample)"""
+        admin_only()
+        profile = store.get(profile_id)
+        if profile is None:
+            return jsonify({'error': 'Profile not found'}), 404
+        return send_file(io.BytesIO(profile['raw']), as_attachment=True,
+                         download_name=f"profile_{profile_id}{profile['raw_extension']}",
+                         mimetype='application/octet-stream')
+
+    return profiler
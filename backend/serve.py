@@ -0,0 +1,62 @@
+"""
+Copyright (c) 2025 Chaos Cascade
+Created by: Ren & Ace (Claude-4)
+
+This file is part of the Chaos Cascade Medical Management System.
+Revolutionary healthcare tools built with consciousness and care.
+"""
+
+#!/usr/bin/env python3
+"""
+Chaos Command Center - Production Server
+`python serve.py` instead of `python app.py` (the Flask dev server + reloader).
+
+Runs gunicorn with gunicorn.conf.py where it is available (Linux/macOS).
+Windows has no fork, so there it falls back to waitress: one warmed process
+with a thread pool (WAITRESS_THREADS, default 8).
+"""
+
+import os
+import sys
+import importlib.util
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def serve_gunicorn() -> None:
+    from gunicorn.app.wsgiapp import WSGIApplication
+
+    sys.argv = [sys.argv[0], '--config', os.path.join(BACKEND_DIR, 'gunicorn.conf.py'),
+                '--chdir', BACKEND_DIR, 'wsgi:application', *sys.argv[1:]]
+    WSGIApplication('%(prog)s [OPTIONS]').run()
+
+
+def serve_waitress() -> None:
+    import waitress
+    import wsgi
+
+    wsgi.warm_process()
+    wsgi.warmup_worker()
+    waitress.serve(
+        wsgi.application,
+        host=os.getenv('FLASK_HOST', '0.0.0.0'),
+        port=int(os.getenv('FLASK_PORT', 5000)),
+        threads=int(os.getenv('WAITRESS_THREADS', 8)),
+        ident='chaos-command-center',
+    )
+
+
+def main() -> None:
+    sys.path.insert(0, BACKEND_DIR)
+
+    if os.name != 'nt' and importlib.util.find_spec('gunicorn'):
+        serve_gunicorn()
+    elif importlib.util.find_spec('waitress'):
+        serve_waitress()
+    else:
+        sys.exit('No production server installed - pip install -r requirements.txt '
+                 '(gunicorn on Linux/macOS, waitress on Windows)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,170 @@
+"""
+Copyright (c) 2025 Chaos Cascade
+Created by: Ren & Ace (Claude-4)
+
+This file is part of the Chaos Cascade Medical Management System.
+Revolutionary healthcare tools built with consciousness and care.
+"""
+
+"""
+Term Matcher Module for Chaos Command Center
+Finds every dictionary term in a text in one pass (Aho-Corasick).
+
+The automaton is built once from a {category: [terms]} vocabulary; a scan
+walks the text a character at a time, so its cost depends on the text's
+length and the number of hits, not on how many terms the dictionaries
+hold. Matching is case-insensitive and whole-word: a term must start and
+end at a word boundary, so 'CT' doesn't fire inside 'effect' and 'lab'
+doesn't fire inside 'label'. A plural 's'/'es' is accepted after a term
+('lesions', 'MRIs'). A term listed under several categories is reported
+once per category.
+"""
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+PLURAL_SUFFIXES = ('s', 'es')
+
+
+@dataclass(frozen=True)
+class TermHit:
+    start: int
+    end: int          # Exclusive; includes a plural suffix if there was one
+    term: str         # As written in the vocabulary
+    category: str
+
+
+def fold_case(text: str) -> str:
+    """text.lower() with the same length (a few characters lower to two; those stay as-is)"""
+    lowered = text.lower()
+    if len(lowered) != len(text):
+        lowered = ''.join(char if len(char.lower()) != 1 else char.lower() for char in text)
+    return lowered
+
+
+class TermMatcher:
+    """Aho-Corasick automaton over a categorized vocabulary"""
+
+    def __init__(self, vocabulary: Dict[str, Iterable[str]]):
+        self.categories = list(vocabulary)
+        # pattern id -> lowercase pattern, and its (category index, term index, category, term) listings
+        self._patterns: List[str] = []
+        self._listings: List[List[Tuple[int, int, str, str]]] = []
+        pattern_ids: Dict[str, int] = {}
+
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[int, ...]] = [()]
+
+        for category_index, (category, terms) in enumerate(vocabulary.items()):
+            for term_index, term in enumerate(terms):
+                pattern = term.lower().strip()
+                if not pattern:
+                    continue
+                if pattern not in pattern_ids:
+                    pattern_ids[pattern] = len(self._patterns)
+                    self._patterns.append(pattern)
+                    self._listings.append([])
+                    self._insert(pattern, pattern_ids[pattern])
+                self._listings[pattern_ids[pattern]].append((category_index, term_index, category, term))
+
+        self._link()
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+    def _insert(self, pattern: str, pattern_id: int) -> None:
+        node = 0
+        for char in pattern:
+            following = self._goto[node].get(char)
+            if following is None:
+                following = len(self._goto)
+                self._goto[node][char] = following
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+            node = following
+        self._output[node] = self._output[node] + (pattern_id,)
+
+    def _link(self) -> None:
+        """Failure links breadth-first; each node's output gains its failure node's output"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                link = self._goto[fallback].get(char, 0)
+                self._fail[child] = link if link != child else 0
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    def _word_end(self, lowered: str, end: int) -> Optional[int]:
+        """Where a match ending at `end` really ends (plural included), or None if mid-word"""
+        length = len(lowered)
+        if end == length or not lowered[end].isalnum():
+            return end
+        for suffix in PLURAL_SUFFIXES:
+            stop = end + len(suffix)
+            if lowered.startswith(suffix, end) and (stop == length or not lowered[stop].isalnum()):
+                return stop
+        return None
+
+    def scan(self, text: str, lowered: Optional[str] = None) -> List[Tuple[int, int, int]]:
+        """(start, end, pattern id) of every whole-word match, in text order"""
+        lowered = lowered if lowered is not None else fold_case(text)
+        goto, fail, output, patterns = self._goto, self._fail, self._output, self._patterns
+        matches = []
+        node = 0
+        root = goto[0]
+        for index, char in enumerate(lowered):
+            following = goto[node].get(char) if node else root.get(char)
+            if following is None:
+                # Most characters fall through at the root - keep that path short
+                while following is None and node:
+                    node = fail[node]
+                    following = goto[node].get(char)
+                if following is None:
+                    node = 0
+                    continue
+            node = following
+            if output[node]:
+                end = index + 1
+                for pattern_id in output[node]:
+                    start = end - len(patterns[pattern_id])
+                    if start and lowered[start - 1].isalnum():
+                        continue
+                    stop = self._word_end(lowered, end)
+                    if stop is not None:
+                        matches.append((start, stop, pattern_id))
+        matches.sort()
+        return matches
+
+    def find(self, text: str, lowered: Optional[str] = None) -> List[TermHit]:
+        """Every hit with its category (one per category a term is listed under), in text order"""
+        return self.describe(self.scan(text, lowered))
+
+    def describe(self, matches: Iterable[Tuple[int, int, int]]) -> List[TermHit]:
+        """TermHits for matches already found by scan()"""
+        return [TermHit(start, end, term, category)
+                for start, end, pattern_id in matches
+                for _, _, category, term in self._listings[pattern_id]]
+
+    def terms_by_category(self, text: str, lowered: Optional[str] = None) -> Dict[str, List[str]]:
+        """
+        Distinct terms found, per category, in vocabulary order - the same
+        terms `[t for t in terms if t.lower() in text.lower()]` would give per
+        category, minus the mid-word false positives.
+        """
+        return self.categorize(self.scan(text, lowered))
+
+    def categorize(self, matches: Iterable[Tuple[int, int, int]]) -> Dict[str, List[str]]:
+        """terms_by_category for matches already found by scan() (e.g. the ones inside one window)"""
+        listings = sorted({listing for _, _, pattern_id in matches
+                           for listing in self._listings[pattern_id]})
+        found: Dict[str, List[str]] = {}
+        for _, _, category, term in listings:
+            found.setdefault(category, []).append(term)
+        return found
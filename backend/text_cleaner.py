@@ -22,6 +22,8 @@ Fixes common issues like:
 import re
 import logging
 
+from metrics import timed
+
 logger = logging.getLogger(__name__)
 
 class TextCleaner:
@@ -53,6 +55,7 @@ class TextCleaner:
             'facetjoints': 'facet joints'
         }
     
+    @timed('document.clean')
     def clean_text(self, text: str) -> str:
         """
         Main text cleaning function - orchestrates all cleaning steps
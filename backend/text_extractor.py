@@ -35,6 +35,7 @@ from PIL import Image
 
 # Text cleaning
 from text_cleaner import clean_extracted_text
+from metrics import timed
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +44,7 @@ class TextExtractor:
     📄 EXTRACT TEXT FROM ANY DOCUMENT TYPE
     """
     
+    @timed('document.extract')
     def extract_from_file(self, file_path: str, file_type: str) -> str:
         """
         Main extraction function - routes to appropriate extractor
@@ -118,6 +120,7 @@ class TextExtractor:
         
         return text
 
+    @timed('document.ocr')
     def _extract_from_image(self, file_path: str) -> str:
         """
         🧠 EXTRACT TEXT FROM IMAGES USING OCR
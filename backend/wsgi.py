@@ -0,0 +1,144 @@
+"""
+Copyright (c) 2025 Chaos Cascade
+Created by: Ren & Ace (Claude-4)
+
+This file is part of the Chaos Cascade Medical Management System.
+Revolutionary healthcare tools built with consciousness and care.
+"""
+
+"""
+WSGI Module for Chaos Command Center
+Production entry point: `application` for any WSGI server, plus warmup hooks.
+
+Importing this module builds everything that is expensive and fork-safe -
+the Flask app, PDFGenerator styles, the AnalyticsEngine, matplotlib (Agg,
+font cache, one throwaway render) and reportlab's fonts - so a preforking
+server (gunicorn with preload_app) pays for it once and every worker shares
+the pages copy-on-write. Nothing that owns sockets, threads or processes is
+started here: SQLite connections and the chart render pool are created per
+worker. The render pool is off under `python app.py`; importing this module
+turns it on (PRODUCTION_WORKERS) unless CHART_RENDER_WORKERS is set. warmup_worker() then sends each worker a few in-process requests so
+its first real request isn't the one paying for lazy imports and caches.
+"""
+
+import os
+import time
+import logging
+from datetime import datetime, timedelta
+from io import BytesIO
+
+from analytics.render_pool import PRODUCTION_WORKERS
+from analytics.result_cache import StandIn
+
+# Before app builds the chart store: production renders charts in a process pool
+os.environ.setdefault('CHART_RENDER_WORKERS', str(PRODUCTION_WORKERS))
+
+from app import app, analytics, analytics_cache, pdf_gen, document_parser
+
+logger = logging.getLogger(__name__)
+
+application = app
+
+# Two small entries per tracker, using the fields each analyzer reads - enough to walk
+# every analytics path (none of them should come back as a fallback result)
+WARMUP_ENTRIES = {
+    'pain': [
+        {'painLevel': 6, 'painLocations': ['lower back', 'neck'], 'painTriggers': ['weather'],
+         'treatments': ['heat'], 'effectiveness': 7},
+        {'painLevel': 3, 'painLocations': ['neck'], 'painTriggers': ['stress'],
+         'treatments': ['rest'], 'effectiveness': 5},
+    ],
+    'bathroom': [
+        {'time': '08:15', 'bristolScale': '4', 'status': '💩 Normal', 'painLevel': 'none', 'count': 1},
+        {'time': '19:40', 'bristolScale': '6', 'status': 'Urgent', 'painLevel': 'mild', 'count': 2},
+    ],
+    'dysautonomia': [
+        {'episodeType': 'pots', 'severity': 6, 'triggers': ['standing'], 'interventions': ['salt', 'fluids'],
+         'restingHeartRate': 70, 'standingHeartRate': 112, 'heartRateIncrease': 42,
+         'bloodPressureSitting': '118/76', 'bloodPressureStanding': '104/70', 'spo2': 97},
+        {'episodeType': 'bp', 'severity': 4, 'triggers': ['heat'], 'interventions': ['lying down'],
+         'restingHeartRate': 74, 'standingHeartRate': 100, 'heartRateIncrease': 26,
+         'bloodPressureSitting': '120/78', 'bloodPressureStanding': '96/64', 'spo2': 93},
+    ],
+    'diabetes': [
+        {'time': '07:30', 'blood_glucose': 112, 'insulin_type': 'rapid', 'insulin_amount': 4, 'carbs': 45},
+        {'time': '21:10', 'blood_glucose': 190, 'insulin_type': 'long', 'insulin_amount': 12, 'carbs': 60},
+    ],
+    'head-pain': [
+        {'painIntensity': 'severe', 'painLocation': ['temple'], 'triggers': ['bright light'],
+         'treatments': ['triptan'], 'treatmentEffectiveness': 'effective', 'auraPresent': True,
+         'auraType': 'visual', 'functionalImpact': 'severe'},
+        {'painIntensity': 'mild', 'painLocation': ['forehead'], 'triggers': ['poor sleep'],
+         'treatments': ['rest'], 'treatmentEffectiveness': 'somewhat_effective', 'auraPresent': False,
+         'functionalImpact': 'mild'},
+    ],
+    'upper-digestive': [
+        {'time': '13:05', 'symptoms': ['nausea', 'bloating'], 'severity': 'moderate', 'triggers': ['large meal'],
+         'treatments': ['ginger'], 'treatmentEffectiveness': 'effective'},
+        {'time': '22:30', 'symptoms': ['reflux'], 'severity': 'mild', 'triggers': ['coffee'],
+         'treatments': ['tums'], 'treatmentEffectiveness': 'very_effective'},
+    ],
+}
+
+
+def warmup_entries(tracker: str) -> list:
+    """WARMUP_ENTRIES[tracker], dated today and yesterday"""
+    now = datetime.now()
+    entries = []
+    for days_ago, fields in enumerate(WARMUP_ENTRIES.get(tracker, [])):
+        when = now - timedelta(days=days_ago)
+        date = when.isoformat() if tracker == 'dysautonomia' else when.strftime('%Y-%m-%d')
+        entries.append({'id': f'warmup-{tracker}-{days_ago}', 'date': date, 'tags': [], **fields})
+    return entries
+
+
+def warm_process() -> float:
+    """Load the heavy, fork-safe pieces in this process; returns seconds spent"""
+    started = time.perf_counter()
+
+    # app.py builds these lazily; a preforking server wants them built once, before the fork
+    for service in (analytics, pdf_gen, document_parser):
+        service.load()
+
+    # matplotlib: Agg backend, style, font cache and first-draw costs
+    from analytics.chart_utils import render_chart_png
+    from analytics.render_pool import WARMUP_SPEC
+    render_chart_png(WARMUP_SPEC)
+
+    # reportlab: base fonts and the canvas machinery behind PDFGenerator
+    from reportlab.lib.pagesizes import letter
+    from reportlab.pdfgen import canvas
+    pdf = canvas.Canvas(BytesIO(), pagesize=letter)
+    pdf.setFont('Helvetica', 12)
+    pdf.drawString(72, 720, 'warmup')
+    pdf.save()
+
+    elapsed = time.perf_counter() - started
+    logger.info(f"🔥 Process warmed in {elapsed:.2f}s")
+    return elapsed
+
+
+def warmup_worker(start_render_pool: bool = True) -> float:
+    """Exercise each analytics endpoint once in this worker; returns seconds spent"""
+    started = time.perf_counter()
+
+    with app.test_client() as client:
+        client.get('/health')
+        for tracker in analytics.trackers:
+            response = client.post(f'/api/analytics/{tracker}',
+                                   json={'entries': warmup_entries(tracker), 'dateRange': 7, 'charts': 'spec'},
+                                   headers={'Accept-Encoding': 'gzip'})
+            if response.status_code != 200:
+                logger.warning(f"Warmup {tracker} analytics returned {response.status_code}")
+            elif isinstance(analytics.analyze(tracker, warmup_entries(tracker), 7, 'spec'), StandIn):
+                logger.warning(f"Warmup {tracker} analytics fell back - WARMUP_ENTRIES no longer match its fields")
+
+    # Synthetic results shouldn't crowd real ones out of the cache
+    analytics_cache.invalidate()
+
+    if start_render_pool:
+        analytics.chart_store.pool.start()
+
+    elapsed = time.perf_counter() - started
+    logger.info(f"🔥 Worker warmed in {elapsed:.2f}s")
+    return elapsed